@@ -0,0 +1,12 @@
+"""End-to-end orchestrator benchmarks.
+
+Synthetic workflows (see :mod:`benchmarks.generators`) are built through
+``ChainFactory.from_dict`` and executed by ``Workflow.execute`` against
+deterministic mock skills and LLM calls (:mod:`benchmarks.mocks`).  Run the
+suite with::
+
+    python -m benchmarks.run --compare benchmarks/baseline.json
+
+:mod:`benchmarks.graph_scaling` separately checks that graph construction
+stays linear up to 10k+ node workflows.
+"""
@@ -0,0 +1,204 @@
+"""Synthetic workflow payloads for ``ChainFactory.from_dict``.
+
+Every generator is deterministic for a given ``seed`` and returns a plain
+JSON-compatible dict, so the same payloads can also be posted to the MCP API.
+Skill nodes call :data:`~benchmarks.mocks.BENCH_SKILL` and LLM nodes use the
+mock provider installed by :func:`~benchmarks.mocks.install_mocks`.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable, Dict, List
+
+from .mocks import BENCH_SKILL
+
+__all__: list[str] = [
+    "GENERATORS",
+    "build",
+    "chain",
+    "diamond",
+    "fan_out",
+    "random_dag",
+    "wide_dag",
+]
+
+Payload = Dict[str, Any]
+
+
+# ---------------------------------------------------------------------------
+# Node helpers ----------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _skill(node_id: str, deps: List[str]) -> Dict[str, Any]:
+    return {
+        "id": node_id,
+        "type": "skill",
+        "tool_name": BENCH_SKILL,
+        "tool_args": {"node": node_id},
+        "dependencies": deps,
+        "use_cache": False,
+    }
+
+
+def _llm(node_id: str, deps: List[str]) -> Dict[str, Any]:
+    return {
+        "id": node_id,
+        "type": "llm",
+        "model": "gpt-4o",  # validated name; never reaches a real provider
+        "prompt": f"Summarise the upstream results for {node_id}.",
+        "llm_config": {"provider": "openai"},
+        "dependencies": deps,
+        "use_cache": False,
+    }
+
+
+def _payload(name: str, nodes: List[Dict[str, Any]]) -> Payload:
+    return {"name": name, "chain_id": name, "version": "1.0.0", "nodes": nodes}
+
+
+# ---------------------------------------------------------------------------
+# Shapes ------------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def fan_out(width: int = 64, *, llm_ratio: float = 0.0, seed: int = 0) -> Payload:
+    """One root feeding *width* parallel nodes that join into a sink."""
+
+    rng = random.Random(seed)
+    nodes = [_skill("root", [])]
+    leaves: List[str] = []
+    for i in range(width):
+        nid = f"n{i}"
+        make = _llm if rng.random() < llm_ratio else _skill
+        nodes.append(make(nid, ["root"]))
+        leaves.append(nid)
+    nodes.append(_skill("sink", leaves))
+    return _payload(f"fan_out_{width}", nodes)
+
+
+def chain(depth: int = 64, *, llm_ratio: float = 0.0, seed: int = 0) -> Payload:
+    """A single sequential chain of *depth* nodes."""
+
+    rng = random.Random(seed)
+    nodes: List[Dict[str, Any]] = []
+    prev: List[str] = []
+    for i in range(depth):
+        nid = f"n{i}"
+        make = _llm if rng.random() < llm_ratio else _skill
+        nodes.append(make(nid, prev))
+        prev = [nid]
+    return _payload(f"chain_{depth}", nodes)
+
+
+def diamond(
+    stages: int = 8, width: int = 4, *, llm_ratio: float = 0.0, seed: int = 0
+) -> Payload:
+    """*stages* stacked diamonds: split into *width* nodes, then join."""
+
+    rng = random.Random(seed)
+    nodes = [_skill("j0", [])]
+    for s in range(stages):
+        mids: List[str] = []
+        for w in range(width):
+            nid = f"s{s}_{w}"
+            make = _llm if rng.random() < llm_ratio else _skill
+            nodes.append(make(nid, [f"j{s}"]))
+            mids.append(nid)
+        nodes.append(_skill(f"j{s + 1}", mids))
+    return _payload(f"diamond_{stages}x{width}", nodes)
+
+
+def random_dag(
+    size: int = 128,
+    *,
+    edge_prob: float = 0.05,
+    condition_ratio: float = 0.05,
+    llm_ratio: float = 0.1,
+    seed: int = 0,
+) -> Payload:
+    """Random layered DAG with condition nodes gating downstream branches.
+
+    Edges only point from lower to higher indices, so the graph is acyclic by
+    construction.  Each condition node evaluates a constant expression chosen
+    from *seed* and gates two of its later nodes (one per branch).
+    """
+
+    rng = random.Random(seed)
+    nodes: List[Dict[str, Any]] = []
+    for i in range(size):
+        nid = f"n{i}"
+        deps = [f"n{j}" for j in range(max(0, i - 32), i) if rng.random() < edge_prob]
+        if i > 0 and not deps and rng.random() < 0.5:
+            deps = [f"n{rng.randrange(i)}"]
+        roll = rng.random()
+        if roll < condition_ratio and i < size - 2:
+            nodes.append(
+                {
+                    "id": nid,
+                    "type": "condition",
+                    "expression": rng.choice(["True", "False"]),
+                    "dependencies": deps,
+                    "use_cache": False,
+                }
+            )
+        elif roll < condition_ratio + llm_ratio:
+            nodes.append(_llm(nid, deps))
+        else:
+            nodes.append(_skill(nid, deps))
+
+    # Wire every condition to two later nodes that then depend on it.
+    by_id = {n["id"]: n for n in nodes}
+    for i, node in enumerate(nodes):
+        if node["type"] != "condition":
+            continue
+        later = [n for n in nodes[i + 1 :] if n["type"] != "condition"]
+        true_node, false_node = (later + [None, None])[:2]
+        for target, branch in (
+            (true_node, "true_branch"),
+            (false_node, "false_branch"),
+        ):
+            if target is None:
+                continue
+            node[branch] = [target["id"]]
+            deps = by_id[target["id"]]["dependencies"]
+            if node["id"] not in deps:
+                deps.append(node["id"])
+    return _payload(f"random_{size}", nodes)
+
+
+def wide_dag(size: int = 10_000, *, parents: int = 3, seed: int = 0) -> Payload:
+    """Large random DAG where every node depends on up to *parents* earlier ones.
+
+    Unlike :func:`random_dag` parents are drawn from the whole prefix, so
+    levels and fan-in spread across the graph – the shape used to check that
+    graph construction stays linear in ``V + E``.
+    """
+
+    rng = random.Random(seed)
+    nodes: List[Dict[str, Any]] = []
+    for i in range(size):
+        picks = sorted(rng.sample(range(i), min(parents, i))) if i else []
+        nodes.append(_skill(f"n{i}", [f"n{j}" for j in picks]))
+    return _payload(f"wide_{size}", nodes)
+
+
+# name -> payload factory; keyword arguments tune the shape
+GENERATORS: Dict[str, Callable[..., Payload]] = {
+    "fan_out": fan_out,
+    "chain": chain,
+    "diamond": diamond,
+    "random_dag": random_dag,
+    "wide_dag": wide_dag,
+}
+
+
+def build(name: str, *, seed: int = 0, **params: Any) -> Payload:
+    """Return the payload produced by generator *name*."""
+
+    try:
+        gen = GENERATORS[name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown generator '{name}'") from exc
+    return gen(seed=seed, **params)
@@ -0,0 +1,100 @@
+"""Graph-construction scaling check for large workflows.
+
+Builds :func:`~benchmarks.generators.wide_dag` payloads of increasing size and
+times what every new workflow pays before the first node runs: constructing
+the :class:`~ice_orchestrator.graph.dependency_graph.DependencyGraph` (cycle
+detection, CSR adjacency) and assigning levels.  Node configs are parsed
+once, outside the timed region.
+
+Usage::
+
+    python -m benchmarks.graph_scaling                      # 1k .. 20k nodes
+    python -m benchmarks.graph_scaling --sizes 10000 --repeat 5
+
+The command exits with status ``1`` when the cost per node at the largest
+size exceeds ``--max-growth`` times the cost per node at the smallest size,
+i.e. when construction stops scaling linearly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if str(_SRC) not in sys.path:  # allow ``python -m benchmarks.graph_scaling``
+    sys.path.insert(0, str(_SRC))
+
+from .generators import wide_dag  # noqa: E402
+
+__all__: list[str] = ["measure"]
+
+
+def _parse_nodes(size: int, parents: int, seed: int) -> List[Any]:
+    from ice_core.models.node_models import SkillNodeConfig
+
+    payload = wide_dag(size, parents=parents, seed=seed)
+    return [SkillNodeConfig.model_validate(nd) for nd in payload["nodes"]]
+
+
+def measure(
+    size: int, *, parents: int = 3, repeat: int = 3, seed: int = 0
+) -> Tuple[float, int]:
+    """Best-of-*repeat* seconds to build and level a *size*-node graph.
+
+    Returns ``(seconds, edges)``.
+    """
+
+    from ice_orchestrator.graph.dependency_graph import DependencyGraph
+
+    nodes = _parse_nodes(size, parents, seed)
+    edges = sum(len(n.dependencies) for n in nodes)
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        graph = DependencyGraph(nodes)
+        graph.get_level_nodes()
+        best = min(best, time.perf_counter() - t0)
+    return best, edges
+
+
+def main(argv: Optional[List[str]] = None) -> int:  # – CLI helper
+    parser = argparse.ArgumentParser(description="DependencyGraph scaling check")
+    parser.add_argument("--sizes", default="1000,2500,5000,10000,20000")
+    parser.add_argument("--parents", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-growth", type=float, default=2.0)
+    args = parser.parse_args(argv)
+    logging.disable(logging.INFO)
+
+    sizes = sorted(int(s) for s in args.sizes.split(",") if s)
+    per_node: List[float] = []
+    print(f"{'nodes':>8} {'edges':>8} {'build_ms':>10} {'us/node':>9}")
+    for size in sizes:
+        seconds, edges = measure(
+            size, parents=args.parents, repeat=args.repeat, seed=args.seed
+        )
+        per_node.append(seconds / size * 1e6)
+        print(f"{size:>8} {edges:>8} {seconds * 1e3:>10.1f} {per_node[-1]:>9.2f}")
+
+    if len(sizes) > 1:
+        growth = per_node[-1] / per_node[0]
+        print(f"\ncost per node grew {growth:.2f}x from {sizes[0]} to {sizes[-1]}")
+        if growth > args.max_growth:
+            print(
+                f"Non-linear growth: {growth:.2f}x > {args.max_growth:.2f}x",
+                file=sys.stderr,
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""Deterministic mock skill and LLM provider with configurable latency.
+
+Latencies are derived from ``(seed, node_id)`` so repeated runs see the same
+per-node delays regardless of scheduling order.  The delay actually applied
+to each node is recorded in the active :class:`RunTrace`, which the harness
+uses to separate simulated work from orchestrator overhead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+from ice_sdk.models.config import LLMConfig
+from ice_sdk.providers.llm_providers.base_handler import BaseLLMHandler
+from ice_sdk.skills import SkillBase
+
+__all__: list[str] = [
+    "BENCH_SKILL",
+    "LatencyModel",
+    "MockLLMHandler",
+    "RunTrace",
+    "install_mocks",
+]
+
+BENCH_SKILL = "bench_mock"
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Latency distribution in seconds.
+
+    ``kind`` is one of ``zero``, ``fixed`` (``mean``), ``uniform``
+    (``mean`` ± ``spread``), ``exponential`` (``mean``) or ``lognormal``
+    (median ``mean``, shape ``spread``).
+    """
+
+    kind: str = "zero"
+    mean: float = 0.0
+    spread: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """Parse ``kind[:mean_ms[:spread]]``, e.g. ``lognormal:20:0.5``."""
+
+        kind, *nums = spec.split(":")
+        mean = float(nums[0]) / 1000 if nums else 0.0
+        spread = float(nums[1]) if len(nums) > 1 else 0.0
+        if kind == "uniform":
+            spread /= 1000
+        if kind not in {"zero", "fixed", "uniform", "exponential", "lognormal"}:
+            raise ValueError(f"Unknown latency model '{kind}'")
+        return cls(kind, mean, spread)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "zero":
+            return 0.0
+        if self.kind == "fixed":
+            return self.mean
+        if self.kind == "uniform":
+            low, high = self.mean - self.spread, self.mean + self.spread
+            return max(0.0, rng.uniform(low, high))
+        if self.kind == "exponential":
+            return rng.expovariate(1 / self.mean) if self.mean > 0 else 0.0
+        if self.mean <= 0:
+            return 0.0
+        return rng.lognormvariate(math.log(self.mean), self.spread)
+
+
+@dataclass
+class RunTrace:
+    """Per-run record of simulated latencies, keyed by node id."""
+
+    seed: int = 0
+    tool_latency: LatencyModel = field(default_factory=LatencyModel)
+    llm_latency: LatencyModel = field(default_factory=LatencyModel)
+    work: Dict[str, float] = field(default_factory=dict)
+
+    def delay(self, node_id: str, model: LatencyModel) -> float:
+        seconds = model.sample(random.Random(f"{self.seed}:{node_id}"))
+        self.work[node_id] = seconds
+        return seconds
+
+
+# Tasks spawned by the workflow inherit the caller's context, so every node
+# of a run records into the same trace.
+_TRACE: ContextVar[Optional[RunTrace]] = ContextVar("bench_trace", default=None)
+
+
+def current_trace() -> RunTrace:
+    trace = _TRACE.get()
+    if trace is None:
+        trace = RunTrace()
+        _TRACE.set(trace)
+    return trace
+
+
+def set_trace(trace: RunTrace) -> None:
+    _TRACE.set(trace)
+
+
+async def _simulate(node_id: str, llm: bool) -> float:
+    trace = current_trace()
+    seconds = trace.delay(node_id, trace.llm_latency if llm else trace.tool_latency)
+    # ``sleep(0)`` still yields so zero-latency runs exercise the scheduler.
+    await asyncio.sleep(seconds)
+    return seconds
+
+
+# ---------------------------------------------------------------------------
+# Mock skill --------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+class BenchMockSkill(SkillBase):
+    """Skill that sleeps for the node's sampled latency and echoes its id."""
+
+    name: str = BENCH_SKILL
+    description: str = "Benchmark mock with configurable latency"
+    tags: ClassVar[list[str]] = ["benchmark"]
+
+    def get_required_config(self) -> list[str]:
+        return []
+
+    async def _execute_impl(self, **kwargs: Any) -> Dict[str, Any]:
+        node_id = str(kwargs.get("node", ""))
+        seconds = await _simulate(node_id, llm=False)
+        return {"node": node_id, "latency": seconds}
+
+
+# ---------------------------------------------------------------------------
+# Mock LLM provider -------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+class MockLLMHandler(BaseLLMHandler):
+    """Provider handler returning a canned completion after a sampled delay."""
+
+    async def generate_text(
+        self,
+        llm_config: LLMConfig,
+        prompt: str,
+        context: Dict[str, Any],
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> Tuple[str, Optional[Dict[str, int]], Optional[str]]:
+        node_id = str(context.get("node_id", ""))
+        await _simulate(node_id, llm=True)
+        words = len(prompt.split())
+        usage = {
+            "prompt_tokens": words,
+            "completion_tokens": 8,
+            "total_tokens": words + 8,
+        }
+        return f"mock completion for {node_id}", usage, None
+
+
+_installed = False
+
+
+def install_mocks() -> None:
+    """Register the mock skill and route LLM nodes through :class:`MockLLMHandler`.
+
+    The ``llm``/``ai`` executors are replaced via
+    :func:`~ice_orchestrator.execution.executors.mock.install_mock_llm`, which
+    renders the prompt like the builtin executor, then asks the mock handler
+    for a completion – no agent or network provider is involved.  Idempotent.
+    """
+
+    global _installed
+    if _installed:
+        return
+
+    from ice_orchestrator.execution.executors.mock import install_mock_llm
+    from ice_sdk.registry.skill import global_skill_registry
+
+    global_skill_registry.register(BENCH_SKILL, BenchMockSkill())
+    install_mock_llm(MockLLMHandler())
+    _installed = True
@@ -0,0 +1,349 @@
+"""Benchmark runner – executes synthetic workflows and checks for regressions.
+
+Usage::
+
+    python -m benchmarks.run                              # default scenarios
+    python -m benchmarks.run --tool-latency lognormal:5:0.5 --runs 20
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json --tolerance 0.3
+
+Timings on shared CI runners are noisy, hence the loose default tolerance;
+refresh the baseline on the machine that runs the comparison.
+
+Per scenario the runner reports throughput, p50/p95/p99 end-to-end latency,
+scheduler overhead per node and the process' peak RSS.  *Overhead* is the wall
+time not explained by the simulated work on the DAG's critical path, divided by
+the number of executed nodes – it therefore includes level-barrier stalls as
+well as pure orchestration cost.  With the default zero-latency mocks it is
+the orchestrator hot path alone.
+
+``--compare`` exits with status ``1`` when any tracked metric is worse than
+the stored baseline by more than ``--tolerance``.  ``--block-budget-ms``
+fails the run when any step of the measured runs blocks the event loop for
+longer than the budget (see :func:`ice_core.utils.watchdog.assert_no_blocking`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import sys
+import time
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import resource
+except ModuleNotFoundError:  # pragma: no cover – non-POSIX platforms
+    resource = None  # type: ignore[assignment]
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if str(_SRC) not in sys.path:  # allow ``python -m benchmarks.run`` from a checkout
+    sys.path.insert(0, str(_SRC))
+
+from .generators import Payload, build  # noqa: E402
+from .mocks import LatencyModel, RunTrace, install_mocks, set_trace  # noqa: E402
+
+__all__: list[str] = [
+    "SCENARIOS",
+    "Scenario",
+    "ScenarioResult",
+    "compare",
+    "run_scenario",
+]
+
+# Metrics gated by ``--compare`` -> True when larger is better.  Tail
+# percentiles are reported but not gated: over a few dozen runs they mostly
+# track scheduler noise on the host.
+TRACKED: Dict[str, bool] = {
+    "throughput_wps": True,
+    "p50_ms": False,
+    "overhead_per_node_us": False,
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    generator: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    s.name: s
+    for s in (
+        Scenario("fan_out_64", "fan_out", {"width": 64, "llm_ratio": 0.25}),
+        Scenario("chain_64", "chain", {"depth": 64, "llm_ratio": 0.25}),
+        Scenario("diamond_8x8", "diamond", {"stages": 8, "width": 8}),
+        Scenario("random_256", "random_dag", {"size": 256}),
+    )
+}
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    nodes: int
+    runs: int
+    failures: int
+    throughput_wps: float
+    nodes_per_s: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    overhead_per_node_us: float
+    build_ms: float
+    peak_rss_mb: Optional[float]
+
+
+# ---------------------------------------------------------------------------
+# Measurement helpers -----------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of *samples*."""
+
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100 * len(ordered)) - 1
+    return ordered[max(0, min(len(ordered) - 1, rank))]
+
+
+def critical_path(payload: Payload, work: Dict[str, float]) -> float:
+    """Longest chain of simulated work through the DAG, in seconds."""
+
+    finish: Dict[str, float] = {}
+    # Generators emit nodes in topological order.
+    for node in payload["nodes"]:
+        start = max((finish[d] for d in node.get("dependencies", [])), default=0.0)
+        finish[node["id"]] = start + work.get(node["id"], 0.0)
+    return max(finish.values(), default=0.0)
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+# ---------------------------------------------------------------------------
+# Runner --------------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+async def run_scenario(
+    scenario: Scenario,
+    *,
+    runs: int = 50,
+    warmup: int = 3,
+    tool_latency: LatencyModel = LatencyModel(),
+    llm_latency: LatencyModel = LatencyModel(),
+    max_parallel: int = 64,
+    seed: int = 0,
+    block_budget_ms: Optional[float] = None,
+) -> ScenarioResult:
+    """Execute *scenario* ``warmup + runs`` times and aggregate the timings.
+
+    With *block_budget_ms* the measured runs are guarded by
+    :func:`~ice_core.utils.watchdog.assert_no_blocking`, which raises
+    ``LoopBlockedError`` once the scenario finishes.
+    """
+
+    from ice_core.utils.watchdog import assert_no_blocking
+    from ice_orchestrator.core.chain_factory import ChainFactory
+
+    install_mocks()
+    payload = build(scenario.generator, seed=seed, **scenario.params)
+
+    latencies: List[float] = []
+    overheads: List[float] = []
+    builds: List[float] = []
+    failures = 0
+    executed_nodes = 0
+    guard = AsyncExitStack()
+    for i in range(warmup + runs):
+        if i == warmup and block_budget_ms is not None:
+            # Warm-up runs import modules and fill caches – not guarded.
+            await guard.enter_async_context(assert_no_blocking(block_budget_ms))
+        trace = RunTrace(
+            seed=seed + i, tool_latency=tool_latency, llm_latency=llm_latency
+        )
+        set_trace(trace)
+
+        t0 = time.perf_counter()
+        workflow = await ChainFactory.from_dict(payload, max_parallel=max_parallel)
+        t1 = time.perf_counter()
+        result = await workflow.execute()
+        wall = time.perf_counter() - t1
+        if i < warmup:
+            continue
+
+        builds.append(t1 - t0)
+        latencies.append(wall)
+        executed = max(1, len(trace.work))
+        executed_nodes += executed
+        ideal = critical_path(payload, trace.work)
+        overheads.append(max(0.0, wall - ideal) / executed)
+        failures += not getattr(result, "success", False)
+    await guard.aclose()
+
+    total = sum(latencies) or float("inf")
+    return ScenarioResult(
+        scenario=scenario.name,
+        nodes=len(payload["nodes"]),
+        runs=runs,
+        failures=failures,
+        throughput_wps=runs / total,
+        nodes_per_s=executed_nodes / total,
+        p50_ms=percentile(latencies, 50) * 1e3,
+        p95_ms=percentile(latencies, 95) * 1e3,
+        p99_ms=percentile(latencies, 99) * 1e3,
+        overhead_per_node_us=percentile(overheads, 50) * 1e6,
+        build_ms=sum(builds) / len(builds) * 1e3,
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def compare(
+    results: Sequence[ScenarioResult],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """Return one message per tracked metric that regressed beyond *tolerance*."""
+
+    regressions: List[str] = []
+    for res in results:
+        base = baseline.get(res.scenario)
+        if base is None:
+            continue
+        for metric, higher_is_better in TRACKED.items():
+            old = base.get(metric)
+            new = getattr(res, metric)
+            if not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            if worse > tolerance:
+                regressions.append(
+                    f"{res.scenario}.{metric}: {old:.3f} -> {new:.3f} "
+                    f"({change:+.0%}, tolerance {tolerance:.0%})"
+                )
+    return regressions
+
+
+def _print_table(results: Sequence[ScenarioResult]) -> None:
+    header = (
+        f"{'scenario':<14}{'nodes':>6}{'wf/s':>9}{'nodes/s':>10}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'ovh us/node':>13}"
+        f"{'build ms':>10}{'rss MB':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        rss = f"{r.peak_rss_mb:.1f}" if r.peak_rss_mb is not None else "n/a"
+        print(
+            f"{r.scenario:<14}{r.nodes:>6}{r.throughput_wps:>9.1f}"
+            f"{r.nodes_per_s:>10.0f}{r.p50_ms:>9.2f}{r.p95_ms:>9.2f}"
+            f"{r.p99_ms:>9.2f}{r.overhead_per_node_us:>13.1f}"
+            f"{r.build_ms:>10.2f}{rss:>9}"
+        )
+        if r.failures:
+            print(f"  ! {r.failures} failed run(s)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:  # – CLI helper
+    parser = argparse.ArgumentParser(description="iceOS orchestrator benchmarks")
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated subset of: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-parallel", type=int, default=64)
+    parser.add_argument(
+        "--tool-latency",
+        default="zero",
+        help="kind[:mean_ms[:spread]] – zero, fixed, uniform, exponential, lognormal",
+    )
+    parser.add_argument("--llm-latency", default="zero")
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare to")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument(
+        "--block-budget-ms",
+        type=float,
+        help="Fail if any step blocks the event loop longer than this",
+    )
+    args = parser.parse_args(argv)
+
+    # Per-run INFO logs would dominate the measurements.
+    logging.disable(logging.INFO)
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+
+    try:
+        selected = [SCENARIOS[name] for name in args.scenarios.split(",") if name]
+    except KeyError as exc:
+        parser.error(f"unknown scenario {exc}")
+    tool_latency = LatencyModel.parse(args.tool_latency)
+    llm_latency = LatencyModel.parse(args.llm_latency)
+
+    async def _run_all() -> List[ScenarioResult]:
+        return [
+            await run_scenario(
+                scenario,
+                runs=args.runs,
+                warmup=args.warmup,
+                tool_latency=tool_latency,
+                llm_latency=llm_latency,
+                max_parallel=args.max_parallel,
+                seed=args.seed,
+                block_budget_ms=args.block_budget_ms,
+            )
+            for scenario in selected
+        ]
+
+    from ice_core.utils.watchdog import LoopBlockedError
+
+    try:
+        results = asyncio.run(_run_all())
+    except LoopBlockedError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    _print_table(results)
+
+    report = {r.scenario: asdict(r) for r in results}
+    for path in (args.json, args.save_baseline):
+        if path is not None:
+            path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+    if args.compare is not None:
+        regressions = compare(
+            results, json.loads(args.compare.read_text()), args.tolerance
+        )
+        if regressions:
+            print("\nRegressions against baseline:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover – executed manually / CI
+    sys.exit(main())
@@ -21,7 +21,9 @@ from pathlib import Path
 # ---------------------------------------------------------------------------
 
 ALLOWED_DEPENDENCIES: dict[str, list[str]] = {
-    "ice_cli": ["ice_core"],
+    # The CLI is a composition root: ``ice run``/``ice profile`` build and
+    # execute workflows, so it may reach every layer below it.
+    "ice_cli": ["ice_core", "ice_sdk", "ice_orchestrator"],
     "ice_api": ["ice_core", "ice_sdk"],  # API can use SDK helpers like ServiceLocator
     "ice_sdk": ["ice_core"],
     "ice_orchestrator": ["ice_core", "ice_sdk"],
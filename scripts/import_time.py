@@ -0,0 +1,92 @@
+"""Report (and optionally budget) package import cost via ``-X importtime``.
+
+Usage::
+
+    python scripts/import_time.py ice_sdk ice_orchestrator --top 15
+    python scripts/import_time.py ice_sdk --max-ms 50
+
+Each module is imported in a fresh interpreter so results are independent of
+import order.  Exit status is ``1`` when a module exceeds ``--max-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, NamedTuple
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def measure(module: str) -> List[ImportRecord]:
+    """Import *module* in a subprocess and parse its ``importtime`` trace."""
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(_SRC), env.get("PYTHONPATH", "")) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    records: List[ImportRecord] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header row
+        records.append(
+            ImportRecord(fields[2].strip(), int(fields[0]), int(fields[1]))
+        )
+    return records
+
+
+def total_ms(records: List[ImportRecord], module: str) -> float:
+    """Cumulative import time of *module* itself, in milliseconds."""
+
+    for rec in reversed(records):
+        if rec.module == module:
+            return rec.cumulative_us / 1000
+    return 0.0
+
+
+def main(argv: List[str] | None = None) -> int:  # – CLI helper
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="+")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        records = measure(module)
+        total = total_ms(records, module)
+        print(f"{module}: {total:.1f} ms ({len(records)} modules)")
+        for rec in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[
+            1 : args.top + 1
+        ]:
+            print(f"  {rec.cumulative_us / 1000:8.1f} ms  {rec.module}")
+        if args.max_ms is not None and total > args.max_ms:
+            print(
+                f"Import budget exceeded: {module} {total:.1f} ms > {args.max_ms} ms",
+                file=sys.stderr,
+            )
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":  # pragma: no cover – executed manually / CI
+    sys.exit(main())
@@ -2,9 +2,10 @@
 Gaffer - AI Workflow Orchestration System
 """
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from fastapi import FastAPI
+if TYPE_CHECKING:  # pragma: no cover
+    from fastapi import FastAPI
 
 # NOTE: The legacy alias `ScriptChain` has been removed to comply with layer
 # boundaries (ice_api must not import from *ice_orchestrator*). External
@@ -29,7 +30,17 @@ class _RemovedScriptChain:  # – shim for backwards compatibility
 # Expose the stub so attribute access is still possible (albeit unsupported)
 ScriptChain = _RemovedScriptChain()  # type: ignore
 
-app = FastAPI(title="IceOS API")
+
+def __getattr__(name: str) -> Any:
+    # ``app`` is built on first access so ``import ice_api.*`` stays cheap.
+    if name == "app":
+        from fastapi import FastAPI
+
+        value: "FastAPI" = FastAPI(title="IceOS API")
+        globals()["app"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "0.1.0"
 
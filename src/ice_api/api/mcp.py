@@ -3,8 +3,9 @@
 Exposes three operations required for the Frosty ➔ iceOS control-plane loop:
 1. POST /blueprints – register or upsert a workflow blueprint.
 2. POST /runs       – execute a blueprint (by id or inline).
-3. GET  /runs/{id}  – fetch final result (202 while running).
-4. GET  /runs/{id}/events – SSE telemetry (stub – plain text for now).
+3. GET  /runs/{id}  – fetch final result (202 while running); ``?wait=<s>``
+   long-polls until the run finishes or the timeout elapses.
+4. GET  /runs/{id}/events – SSE telemetry (``event:`` / ``data:`` messages).
 
 The data models intentionally mirror the draft YAML spec so we can generate
 OpenAPI later with *fastapi.openapi.utils.get_openapi*.
@@ -12,12 +13,14 @@ OpenAPI later with *fastapi.openapi.utils.get_openapi*.
 
 from __future__ import annotations
 
+import asyncio
 import datetime as _dt
 import json
 import uuid
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 
 # Redis helper
 from ice_api.redis_client import get_redis
@@ -39,7 +42,18 @@ router = APIRouter(prefix="/api/v1/mcp", tags=["mcp"])
 
 # In-memory fallback stores (only for unit-tests) ---------------------------
 _RUNS: Dict[str, RunResult] = {}
-_EVENTS: Dict[str, List[str]] = {}
+# Framed SSE messages per run for the plain-text events endpoint.  Only
+# recorded while that endpoint is active (no *sse_starlette* – otherwise the
+# stream is read from Redis), dropped once a finished stream was served and
+# capped at _MAX_EVENT_RUNS runs, oldest first.
+_EVENTS: "OrderedDict[str, List[str]]" = OrderedDict()
+_RECORD_EVENTS = True
+_MAX_EVENT_RUNS = 256
+# Completion signals for in-flight runs (long-poll ``GET /runs/{id}?wait=``)
+_RUN_DONE: Dict[str, asyncio.Event] = {}
+
+# Upper bound for a single long-poll request (seconds)
+_MAX_WAIT = 60.0
 
 # Redis keys helpers --------------------------------------------------------
 
@@ -52,6 +66,19 @@ def _stream_key(run_id: str) -> str:
     return f"stream:{run_id}"
 
 
+def _record_event(run_id: str, event: str, payload: str) -> None:
+    """Keep a framed SSE message for the in-memory fallback stream."""
+
+    if not _RECORD_EVENTS:
+        return
+    events = _EVENTS.get(run_id)
+    if events is None:
+        events = _EVENTS[run_id] = []
+        while len(_EVENTS) > _MAX_EVENT_RUNS:
+            _EVENTS.popitem(last=False)
+    events.append(f"event: {event}\ndata: {payload}\n\n")
+
+
 # ---------------------------------------------------------------------------
 # Routes --------------------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -95,22 +122,26 @@ async def start_run(req: RunRequest) -> RunAck:
         raise HTTPException(status_code=404, detail="blueprint_id not found")
 
     # Validate (and implicitly convert) the blueprint -------------------------
+    # Conversion validates too; results are memoised per plan key so repeat
+    # runs of the same blueprint skip both parsing and graph compilation.
+    plan_key = bp.plan_key()
     try:
-        bp.validate_runtime()
         from ice_core.utils.node_conversion import convert_node_specs
 
-        conv_nodes = convert_node_specs(bp.nodes)
+        conv_nodes = convert_node_specs(bp.nodes, cache_key=plan_key)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"Invalid node spec: {exc}")
 
     run_id = f"run_{uuid.uuid4().hex[:8]}"
     start_ts = _dt.datetime.utcnow()
+    _RUN_DONE[run_id] = asyncio.Event()
 
     try:
         redis = get_redis()
 
         # Event emitter closure ---------------------------------------
         def _emit(evt_name: str, payload: dict) -> None:
+            _record_event(run_id, evt_name, json.dumps(payload))
             redis.xadd(_stream_key(run_id), {"event": evt_name, "payload": json.dumps(payload)})  # type: ignore[arg-type]
 
         result_obj = await _get_workflow_service().execute(
@@ -119,6 +150,7 @@ async def start_run(req: RunRequest) -> RunAck:
             req.options.max_parallel,
             run_id=run_id,
             event_emitter=_emit,
+            plan_key=plan_key,
         )
         from pydantic import BaseModel
 
@@ -151,14 +183,15 @@ async def start_run(req: RunRequest) -> RunAck:
         error=error_msg,
     )
     _RUNS[run_id] = run_result
-    # Pre-populate first event (finished) so SSE clients receive something.
+    done = _RUN_DONE.pop(run_id, None)
+    if done is not None:
+        done.set()
     # Push terminal event to stream
+    finished = json.dumps({"run_id": run_id, "success": success})
+    _record_event(run_id, "workflow.finished", finished)
     await redis.xadd(
         _stream_key(run_id),
-        {
-            "event": "workflow.finished",
-            "payload": json.dumps({"run_id": run_id, "success": success}),
-        },
+        {"event": "workflow.finished", "payload": finished},
     )
 
     return RunAck(
@@ -169,10 +202,24 @@ async def start_run(req: RunRequest) -> RunAck:
 
 
 @router.get("/runs/{run_id}", response_model=RunResult)
-async def get_result(run_id: str) -> RunResult:
-    """Return the final *RunResult* if available, else 202."""
+async def get_result(
+    run_id: str, wait: float = Query(0.0, ge=0.0, le=_MAX_WAIT)
+) -> RunResult:
+    """Return the final *RunResult* if available, else 202.
+
+    With ``wait`` > 0 the request is held open until the run completes or
+    *wait* seconds elapse, replacing client-side polling.
+    """
 
     result = _RUNS.get(run_id)
+    if result is None and wait > 0:
+        done = _RUN_DONE.get(run_id)
+        if done is not None:
+            try:
+                await asyncio.wait_for(done.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+            result = _RUNS.get(run_id)
     if result is None:
         raise HTTPException(
             status_code=202, detail="Run is still executing or not found"
@@ -185,6 +232,8 @@ try:
 
     from sse_starlette.sse import EventSourceResponse  # type: ignore
 
+    _RECORD_EVENTS = False  # events are streamed from Redis
+
     @router.get("/runs/{run_id}/events")
     async def event_stream(
         run_id: str,
@@ -199,7 +248,7 @@ try:
         if not exists:
             raise HTTPException(status_code=404, detail="run_id not found")
 
-        async def _gen() -> AsyncGenerator[str, None]:
+        async def _gen() -> AsyncGenerator[Dict[str, str], None]:
             last_id: str = "0-0"
             while True:
                 events = await redis.xread({stream: last_id}, block=1000, count=10)  # type: ignore[arg-type]
@@ -207,7 +256,9 @@ try:
                     for _, batches in events:
                         for ev_id, data in batches:
                             last_id = ev_id
-                            yield f"event: {data['event']}\ndata: {data['payload']}\n\n"
+                            # Yield fields, not a pre-formatted string:
+                            # sse_starlette would frame that as ``data:``.
+                            yield {"event": data["event"], "data": data["payload"]}
                             if data.get("event") == "workflow.finished":
                                 return
 
@@ -226,5 +277,7 @@ except ImportError:  # pragma: no cover – SSE optional
         events = _EVENTS.get(run_id)
         if events is None:
             raise HTTPException(status_code=404, detail="run_id not found")
-        body = "\n\n".join(events)
+        body = "".join(events)
+        if events[-1].startswith("event: workflow.finished\n"):
+            _EVENTS.pop(run_id, None)  # complete – nothing more to serve
         return PlainTextResponse(body, media_type="text/event-stream")
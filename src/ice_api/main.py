@@ -5,7 +5,7 @@ FastAPI application entry point
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncIterator, List
+from typing import Any, AsyncIterator, List
 
 from dotenv import load_dotenv
 from fastapi import APIRouter, FastAPI, Request
@@ -27,6 +27,8 @@ from ice_api.api.builder import router as builder_router
 from ice_api.api.mcp import router as mcp_router
 from ice_api.ws_gateway import router as ws_router
 from ice_core.utils.logging import setup_logger
+from ice_core.utils.hedging import hedging_metrics
+from ice_core.utils.watchdog import watchdog_from_env
 from ice_sdk import ToolService
 from ice_sdk.context import GraphContextManager
 
@@ -92,6 +94,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     app.state.context_manager = ctx_manager  # type: ignore[attr-defined]
 
+    # Warm skill pools so the first request skips construction & setup ------
+    for tool_name in tool_service.available_tools():
+        try:
+            await tool_service.warm_up([tool_name])
+        except Exception as exc:  # pragma: no cover – missing deps etc.
+            logger.warning("Tool '%s' could not be warmed up: %s", tool_name, exc)
+
     # Load all relevant API keys from environment and make them available if needed by SDKs
     # The actual key used by an LLM call will be the one specified in the Node's LLMConfig.
     # This step ensures that if SDKs implicitly look for env vars, they might be found.
@@ -126,15 +135,25 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Register standard exception handlers (must happen *after* app creation).
     add_exception_handlers(app)
 
+    # Opt-in event-loop lag watchdog (``ICE_LOOP_WATCHDOG_MS``) -------------
+    watchdog = watchdog_from_env()
+    app.state.loop_watchdog = watchdog  # type: ignore[attr-defined]
+    if watchdog is not None:
+        watchdog.start()
+        logger.info(
+            "Loop watchdog enabled (threshold %.0f ms)", watchdog.threshold * 1e3
+        )
+
     yield
 
     # Shutdown
-    # Add any cleanup code here
-    pass
+    await tool_service.shutdown()
+    if watchdog is not None:
+        watchdog.stop()
 
 
 # Create FastAPI app
-app = FastAPI(title="iceOS API")
+app = FastAPI(title="iceOS API", lifespan=lifespan)
 
 # Expose globally for immediate availability in tests (before lifespan)
 tool_service_global = ToolService()
@@ -180,6 +199,21 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/health/loop", tags=["utils"])
+async def loop_health(request: Request) -> dict[str, Any]:
+    """Return event-loop lag metrics when the loop watchdog is enabled."""
+    watchdog = getattr(request.app.state, "loop_watchdog", None)
+    if watchdog is None:
+        return {"enabled": False}
+    return {"enabled": True, **watchdog.metrics()}
+
+
+@app.get("/health/hedging", tags=["utils"])
+async def hedging_health() -> dict[str, Any]:
+    """Return request-hedging counters (hedges issued, wins, budget denials)."""
+    return hedging_metrics()
+
+
 @app.get("/v1/tools", response_model=List[str], tags=["utils"])
 async def list_tools_v1(request: Request) -> List[str]:
     """Return all registered tool names (legacy alias without /api prefix)."""
@@ -23,7 +23,8 @@ from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 from fastapi.websockets import WebSocketState
-from jsonschema import Draft202012Validator
+
+from ice_core.utils.schema_cache import compile_schema
 
 router = APIRouter(prefix="/ws/mcp", tags=["mcp"])
 
@@ -84,7 +85,9 @@ _SCHEMAS: dict[str, dict[str, Any]] = {
     },
 }
 
-_VALIDATORS = {name: Draft202012Validator(schema) for name, schema in _SCHEMAS.items()}
+# Compiled once at import; ``compile_schema`` picks Draft 2020-12 from ``$schema``
+# and adds a fast checker so valid messages skip the full jsonschema walk.
+_VALIDATORS = {name: compile_schema(schema) for name, schema in _SCHEMAS.items()}
 
 
 # ---------------------------------------------------------------------------
@@ -5,28 +5,26 @@ The public executable is registered in *pyproject.toml* as::
     [tool.poetry.scripts]
     ice = "ice_cli.cli:cli"
 
-Currently only a **doctor** command is implemented because it is required by
-``make doctor`` (and related CI pipelines).  Additional sub-commands can be
-added incrementally without breaking existing automation.
-"""
-
-from __future__ import annotations
-
-"""iceOS command-line interface (pure *Click* implementation).
-
-The public executable is registered in *pyproject.toml* as::
+Commands:
 
-    [tool.poetry.scripts]
-    ice = "ice_cli.cli:cli"
+* ``doctor`` – repository health-checks used by ``make doctor`` and CI.
+* ``run`` – execute a *NetworkSpec* YAML workflow (optionally profiled).
+* ``profile`` – execute a workflow under the sampling event-loop profiler
+  and write a speedscope flamegraph, the asyncio task tree and the top
+  blocking calls.
 
-Currently only a **doctor** command is implemented because it is required by
-``make doctor`` (and related CI pipelines).  Additional sub-commands can be
-added incrementally without breaking existing automation.
+Heavy imports (orchestrator, providers) happen inside the commands so
+``ice --help`` and ``ice doctor`` stay fast.
 """
 
+from __future__ import annotations
+
+import asyncio
+import json
 import subprocess
 import sys
-from typing import List
+from pathlib import Path
+from typing import Any, List, Optional
 
 import click
 
@@ -75,7 +73,154 @@ def doctor(category: str) -> None:  # – imperative mood
     click.echo("[doctor] All checks passed ✔")
 
 
-# Allow ``python -m ice_cli.cli doctor`` invocation --------------------------
+# ---------------------------------------------------------------------------
+# Workflow execution & profiling ------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _install_mock_llm() -> None:
+    """Route ``llm``/``ai`` nodes to a canned, network-free completion.
+
+    The prompt is still rendered against the node context so template work is
+    part of the profile; only the provider round-trip is skipped.
+    """
+
+    from ice_orchestrator.execution.executors.mock import install_mock_llm
+
+    install_mock_llm()
+
+
+async def _execute_yaml(
+    path: Path, *, max_parallel: int, profiler: Optional[Any] = None
+) -> Any:
+    from ice_orchestrator.core.network_factory import NetworkFactory
+
+    workflow = await NetworkFactory.from_yaml(path, max_parallel=max_parallel)
+    if profiler is None:
+        return await workflow.execute()
+    async with profiler:
+        return await workflow.execute()
+
+
+def _echo_result(result: Any) -> None:
+    success = getattr(result, "success", False)
+    if hasattr(result, "model_dump"):
+        # Nested per-node results (datetimes, enums) become plain JSON values.
+        output = result.model_dump(mode="json").get("output")
+    else:
+        output = result
+    click.echo(json.dumps(output, indent=2, default=str))
+    if not success:
+        click.echo(f"Workflow failed: {getattr(result, 'error', '')}", err=True)
+        sys.exit(1)
+
+
+def _write_profile(profiler: Any, out: Path, top: int) -> None:
+    report = profiler.report
+    paths = report.write(out)
+    click.echo(report.summary(top), err=True)
+    for path in paths:
+        click.echo(f"[profile] wrote {path}", err=True)
+
+
+_workflow_arg = click.argument(
+    "workflow", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+_parallel_opt = click.option(
+    "--max-parallel", type=int, default=5, show_default=True, help="Node concurrency."
+)
+
+
+@cli.command()
+@_workflow_arg
+@_parallel_opt
+@click.option(
+    "--mock/--real",
+    default=False,
+    help="Replace LLM calls with canned completions (default: real providers).",
+)
+@click.option("--profile", is_flag=True, help="Sample the event loop during the run.")
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("profiles"),
+    show_default=True,
+)
+def run(
+    workflow: Path, max_parallel: int, mock: bool, profile: bool, profile_dir: Path
+) -> None:
+    """Execute the *NetworkSpec* YAML file ``WORKFLOW`` and print its output."""
+
+    from ice_core.utils.profiling import LoopProfiler
+
+    if mock:
+        _install_mock_llm()
+    profiler = LoopProfiler(name=workflow.stem) if profile else None
+    result = asyncio.run(
+        _execute_yaml(workflow, max_parallel=max_parallel, profiler=profiler)
+    )
+    if profiler is not None:
+        _write_profile(profiler, profile_dir, top=10)
+    _echo_result(result)
+
+
+@cli.command()
+@_workflow_arg
+@_parallel_opt
+@click.option(
+    "--mock/--real",
+    default=True,
+    help="Replace LLM calls with canned completions (default: mock).",
+)
+@click.option(
+    "--out",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("profiles"),
+    show_default=True,
+    help="Directory for the speedscope, task-tree and blocking-call files.",
+)
+@click.option("--interval-ms", type=float, default=5.0, show_default=True)
+@click.option(
+    "--block-ms",
+    type=float,
+    default=50.0,
+    show_default=True,
+    help="Report calls that held the event loop longer than this.",
+)
+@click.option("--top", type=int, default=10, show_default=True)
+def profile(
+    workflow: Path,
+    max_parallel: int,
+    mock: bool,
+    out: Path,
+    interval_ms: float,
+    block_ms: float,
+    top: int,
+) -> None:
+    """Profile one execution of ``WORKFLOW`` with the sampling loop profiler.
+
+    Open ``<out>/<name>.speedscope.json`` at https://www.speedscope.app.
+    """
+
+    from ice_core.utils.profiling import LoopProfiler
+
+    if mock:
+        _install_mock_llm()
+    profiler = LoopProfiler(
+        interval=interval_ms / 1e3,
+        block_threshold=block_ms / 1e3,
+        name=workflow.stem,
+    )
+    result = asyncio.run(
+        _execute_yaml(workflow, max_parallel=max_parallel, profiler=profiler)
+    )
+    _write_profile(profiler, out, top=top)
+    if not getattr(result, "success", False):
+        click.echo(f"Workflow failed: {getattr(result, 'error', '')}", err=True)
+        sys.exit(1)
+
+
+# Allow ``python -m ice_cli.cli <command>`` invocation --------------------------
 if __name__ == "__main__":  # pragma: no cover
     cli()
 
@@ -53,6 +53,26 @@ class Blueprint(BaseModel):
         # Will raise ValueError / ValidationError on failure
         convert_node_specs(self.nodes)
 
+    def plan_key(self) -> str:
+        """Return the cache key for this blueprint's compiled execution plan.
+
+        Combines ``blueprint_id``, ``version`` and the DAG topology hash with
+        a digest of the node specs, so upserting a blueprint under the same
+        id/version never serves a stale plan.
+        """
+
+        import hashlib
+        import json
+
+        from ice_core.utils.hashing import topology_hash
+
+        specs = [n.model_dump() for n in self.nodes]
+        topo = topology_hash({s["id"]: s.get("dependencies") or [] for s in specs})
+        digest = hashlib.sha256(
+            json.dumps(specs, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{self.blueprint_id}:{self.version}:{topo}:{digest[:16]}"
+
 
 class BlueprintAck(BaseModel):
     """Acknowledgement for blueprint registration."""
@@ -24,6 +24,7 @@ __all__ = [
     "BANNED_MODELS",
     "DEFAULT_MODEL_ID",
     "get_default_model_id",
+    "get_alternate_model",
 ]
 
 
@@ -38,6 +39,11 @@ class LLMModelInfo(BaseModel):
         None,
         description="Maximum tokens accepted by the model (None when unknown)",
     )
+    cost_tier: int | None = Field(
+        None,
+        ge=1,
+        description="Relative price class, 1 = cheapest (None when unknown)",
+    )
 
     model_config = {
         "extra": "forbid",
@@ -57,6 +63,7 @@ _ALLOWED_MODELS: Dict[str, LLMModelInfo] = {
         label="GPT-4.1 (OpenAI)",
         best_for="General reasoning & code generation with high quality",
         max_tokens=128000,
+        cost_tier=2,
     ),
     "gpt-4o": LLMModelInfo(
         id="gpt-4o",
@@ -64,6 +71,7 @@ _ALLOWED_MODELS: Dict[str, LLMModelInfo] = {
         label="GPT-4o (OpenAI)",
         best_for="Fastest GPT-4 tier – balanced quality & latency",
         max_tokens=128000,
+        cost_tier=2,
     ),
     "gpt-4-turbo-2024-04-09": LLMModelInfo(
         id="gpt-4-turbo-2024-04-09",
@@ -71,6 +79,7 @@ _ALLOWED_MODELS: Dict[str, LLMModelInfo] = {
         label="GPT-4 Turbo 04/2024 (OpenAI)",
         best_for="Cost-optimised GPT-4 for prod workloads",
         max_tokens=128000,
+        cost_tier=3,
     ),
     "gpt-4.5-preview": LLMModelInfo(
         id="gpt-4.5-preview",
@@ -78,6 +87,7 @@ _ALLOWED_MODELS: Dict[str, LLMModelInfo] = {
         label="GPT-4.5 Preview (OpenAI)",
         best_for="Early access to upcoming GPT-4.5 capabilities",
         max_tokens=None,
+        cost_tier=4,
     ),
     # Anthropic -----------------------------------------------------------
     "claude-4-sonnet": LLMModelInfo(
@@ -86,6 +96,7 @@ _ALLOWED_MODELS: Dict[str, LLMModelInfo] = {
         label="Claude-4 Sonnet (Anthropic)",
         best_for="Creative writing, analytical reasoning",
         max_tokens=200000,
+        cost_tier=2,
     ),
     "claude-4-opus": LLMModelInfo(
         id="claude-4-opus",
@@ -93,6 +104,7 @@ _ALLOWED_MODELS: Dict[str, LLMModelInfo] = {
         label="Claude-4 Opus (Anthropic)",
         best_for="State-of-the-art reasoning & long-context",
         max_tokens=200000,
+        cost_tier=3,
     ),
     # Google --------------------------------------------------------------
     "gemini-2.5-pro": LLMModelInfo(
@@ -101,6 +113,7 @@ _ALLOWED_MODELS: Dict[str, LLMModelInfo] = {
         label="Gemini 2.5 Pro (Google)",
         best_for="Multimodal tasks & long-context summarisation",
         max_tokens=100000,
+        cost_tier=2,
     ),
     # DeepSeek ------------------------------------------------------------
     "deepseek-v3.1": LLMModelInfo(
@@ -109,6 +122,7 @@ _ALLOWED_MODELS: Dict[str, LLMModelInfo] = {
         label="DeepSeek V3.1",
         best_for="Large-scale code understanding & generation",
         max_tokens=None,
+        cost_tier=1,
     ),
 }
 
@@ -146,3 +160,34 @@ def is_allowed_model(model_id: str) -> bool:  # – helper
 def get_default_model_id() -> str:  # – helper
     """Return the project-wide default LLM model identifier."""
     return DEFAULT_MODEL_ID
+
+
+def get_alternate_model(
+    model_id: str, *, cross_provider: bool = False
+) -> LLMModelInfo | None:
+    """Return a different allowed model to fail over / hedge to.
+
+    Prefers a model from the same provider (same credentials, comparable
+    output style); with *cross_provider* a model from another provider is
+    chosen instead.  Only models in the same or a cheaper
+    :attr:`~LLMModelInfo.cost_tier` qualify – the closest tier wins – so a
+    failover never raises the price of a call.  Preview models and models
+    without a known tier are skipped.  Returns ``None`` when no candidate
+    exists.
+    """
+    current = _ALLOWED_MODELS.get(model_id)
+    if current is None or current.cost_tier is None:
+        return None
+    best: LLMModelInfo | None = None
+    for info in list_models():
+        if info.id == model_id or not is_allowed_model(info.id):
+            continue
+        if "preview" in info.id or info.cost_tier is None:
+            continue
+        if info.cost_tier > current.cost_tier:
+            continue
+        if (info.provider != current.provider) != cross_provider:
+            continue
+        if best is None or info.cost_tier > (best.cost_tier or 0):
+            best = info
+    return best
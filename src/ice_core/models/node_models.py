@@ -140,6 +140,13 @@ class NodeMetadata(BaseModel):
     end_time: Optional[datetime] = None
     version: Optional[str] = None
     tags: List[str] = Field(default_factory=list)
+    duration: Optional[float] = Field(
+        None, description="Monotonic node run time in seconds (queue wait excluded)"
+    )
+    phase_timings: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds spent per orchestration phase (see ChainMetrics)",
+    )
 
 
 class BaseNodeConfig(BaseModel):
@@ -94,6 +94,7 @@ class IWorkflowService(Protocol):
         *,
         run_id: str | None = None,
         event_emitter: Any | None = None,
+        plan_key: str | None = None,
     ) -> Any: ...
 
 
@@ -5,12 +5,18 @@ by any layer (ice_core, ice_sdk, ice_orchestrator).
 """
 
 __all__: list[str] = [
+    "blobs",
     "hashing",
     "logging",
     "meta",
     "perf",
+    "profiling",
     "security",
     "text",
+    "watchdog",
     "coercion",
+    "deadline",
+    "hedging",
     "nested_validation",
+    "schema_cache",
 ]
@@ -0,0 +1,449 @@
+"""Content-addressed blob store for large node outputs (dependency-free).
+
+Large values (CSV rows, documents, base64 screenshots) are stored once in a
+:class:`BlobStore` and replaced by a small :class:`BlobRef`, so copying node
+outputs into downstream contexts and hashing them into cache keys only ever
+touches the reference.  Consumers call :func:`materialize` when they actually
+need the data – and before writing it anywhere that outlives the references
+(e.g. the context store).
+
+Blobs are keyed by the SHA-256 of their encoded bytes, so identical payloads
+(e.g. an output re-exposed under an alias) are stored once.  The store keeps
+recent blobs in memory and spills the least-recently-used ones to files that
+are read back through ``mmap``.
+
+Blobs are reference counted: every :meth:`BlobStore.put` takes a reference
+and :meth:`BlobStore.release` drops it, deleting the blob at zero (workflows
+release what they created when the run finishes).  Referenced blobs are never
+evicted: spill files are bounded by a disk budget, and a put that fits
+neither budget raises :class:`BlobStoreFull` (:func:`offload` then keeps the
+value inline).  A temporary spill directory is removed when the store is
+collected or at interpreter exit.
+
+Environment:
+    ``ICE_BLOB_THRESHOLD``: Size in bytes above which values are offloaded
+        (default ``0``: off; e.g. 262144 for 256 KiB).
+    ``ICE_BLOB_MEMORY_MB``: Memory tier budget of the shared store (64).
+    ``ICE_BLOB_DISK_MB``: Spill budget of the shared store (1024, ``0`` for
+        unbounded).
+    ``ICE_BLOB_DIR``: Spill directory (default: a fresh temporary directory).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+__all__: list[str] = [
+    "BlobRef",
+    "BlobStore",
+    "BlobStoreFull",
+    "blob_threshold_from_env",
+    "contains_refs",
+    "global_blob_store",
+    "materialize",
+    "offload",
+]
+
+# Offloading is opt-in: with a threshold every node output is size-checked.
+DEFAULT_THRESHOLD = 0
+
+_MARKER = "$blob"
+_KINDS = ("text", "bytes", "json")
+
+
+class BlobStoreFull(RuntimeError):
+    """Raised by :meth:`BlobStore.put` when memory and disk budgets are used up."""
+
+
+class BlobRef(dict):  # type: ignore[type-arg]
+    """Reference to a blob: ``{"$blob": digest, "size": n, "kind": k}``.
+
+    A ``dict`` subclass so references survive ``json.dumps`` (context store,
+    cache keys, API responses) unchanged; a plain dict of that shape read back
+    from JSON is recognised by :meth:`coerce`.  *kind* records how to decode
+    the bytes: ``text`` (UTF-8 ``str``), ``bytes`` or ``json``.
+    """
+
+    def __init__(self, digest: str, size: int, kind: str) -> None:
+        super().__init__({_MARKER: digest, "size": size, "kind": kind})
+
+    @property
+    def digest(self) -> str:
+        return str(self[_MARKER])
+
+    @property
+    def size(self) -> int:
+        return int(self["size"])
+
+    @property
+    def kind(self) -> str:
+        return str(self["kind"])
+
+    @classmethod
+    def coerce(cls, value: Any) -> Optional["BlobRef"]:
+        """Return *value* as a :class:`BlobRef` when it has the ref shape."""
+
+        if isinstance(value, BlobRef):
+            return value
+        if (
+            isinstance(value, dict)
+            and len(value) == 3
+            and isinstance(value.get(_MARKER), str)
+            and value.get("kind") in _KINDS
+        ):
+            return cls(value[_MARKER], int(value.get("size", 0)), value["kind"])
+        return None
+
+    def materialize(self, store: Optional["BlobStore"] = None) -> Any:
+        """Load and decode the referenced value."""
+
+        view = (store or global_blob_store()).open(self.digest)
+        try:
+            if self.kind == "bytes":
+                return bytes(view)
+            text = str(view, "utf-8")
+        finally:
+            view.release()
+        return json.loads(text) if self.kind == "json" else text
+
+    def __repr__(self) -> str:
+        return f"BlobRef({self.digest[:12]}…, {self.size} bytes, {self.kind})"
+
+
+class BlobStore:
+    """Memory-first, disk-spilling content-addressed byte store.
+
+    Args:
+        memory_limit: Bytes kept in memory before the least-recently-used
+            blobs are spilled to *directory*.
+        directory: Spill directory (created on first spill; a temporary one
+            when omitted, removed again with the store or at exit).
+        disk_limit: Bytes of spill files allowed (``None`` = unbounded).  Once
+            reached, blobs stay in memory; a put that would push memory past
+            *memory_limit* as well raises :class:`BlobStoreFull`.
+    """
+
+    def __init__(
+        self,
+        memory_limit: int = 64 * 1024 * 1024,
+        directory: str | Path | None = None,
+        disk_limit: Optional[int] = 1024 * 1024 * 1024,
+    ) -> None:
+        self.memory_limit = memory_limit
+        self.disk_limit = disk_limit
+        self._directory = Path(directory) if directory else None
+        self._cleanup: Optional[weakref.finalize] = None
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._on_disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._refs: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.puts = 0
+        self.dedup_hits = 0
+        self.rejected = 0
+
+    # ------------------------------------------------------------------
+    # Public API --------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def put(self, data: bytes) -> str:
+        """Store *data* once and return its SHA-256 digest.
+
+        Raises :class:`BlobStoreFull` (storing nothing) when *data* fits
+        neither the memory nor the disk budget.
+        """
+
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self.puts += 1
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                self.dedup_hits += 1
+            elif digest in self._on_disk:
+                self._on_disk.move_to_end(digest)
+                self.dedup_hits += 1
+            else:
+                self._memory[digest] = bytes(data)
+                self._memory_bytes += len(data)
+                if not self._spill():
+                    self._memory.pop(digest)
+                    self._memory_bytes -= len(data)
+                    self.rejected += 1
+                    raise BlobStoreFull(
+                        f"Blob of {len(data)} bytes exceeds the memory and "
+                        "disk budgets"
+                    )
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+        return digest
+
+    def open(self, digest: str) -> memoryview:
+        """Zero-copy view of blob *digest* (memory or ``mmap``-ed file)."""
+
+        with self._lock:
+            data = self._memory.get(digest)
+            if data is not None:
+                self._memory.move_to_end(digest)
+                return memoryview(data)
+            size = self._on_disk.get(digest)
+            if size is None:
+                raise KeyError(f"Unknown blob {digest}")
+            self._on_disk.move_to_end(digest)
+            path = self._path(digest)
+        if size == 0:
+            return memoryview(b"")
+        with open(path, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped)
+
+    def get(self, digest: str) -> bytes:
+        view = self.open(digest)
+        try:
+            return bytes(view)
+        finally:
+            view.release()
+
+    def release(self, digest: str) -> None:
+        """Drop one reference to *digest*; the blob is deleted at zero."""
+
+        with self._lock:
+            count = self._refs.get(digest, 0) - 1
+            if count > 0:
+                self._refs[digest] = count
+                return
+            self._refs.pop(digest, None)
+            self._drop(digest)
+
+    def __contains__(self, digest: object) -> bool:
+        return digest in self._memory or digest in self._on_disk
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "blobs": len(self._memory) + len(self._on_disk),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes,
+                "puts": self.puts,
+                "dedup_hits": self.dedup_hits,
+                "rejected": self.rejected,
+            }
+
+    def clear(self) -> None:
+        """Drop every blob (and the spill directory when it was temporary)."""
+
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._refs.clear()
+            if self._directory is not None:
+                if self._cleanup is not None:
+                    self._cleanup()  # removes the temporary directory
+                    self._cleanup = None
+                    self._directory = None
+                else:
+                    for digest in self._on_disk:
+                        self._path(digest).unlink(missing_ok=True)
+            self._on_disk.clear()
+            self._disk_bytes = 0
+
+    # ------------------------------------------------------------------
+    # Internal helpers --------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def _path(self, digest: str) -> Path:
+        if self._directory is None:
+            self._directory = Path(tempfile.mkdtemp(prefix="ice-blobs-"))
+            # Runs on garbage collection or at interpreter exit.
+            self._cleanup = weakref.finalize(
+                self, shutil.rmtree, str(self._directory), ignore_errors=True
+            )
+        return self._directory / digest[:2] / digest
+
+    def _drop(self, digest: str) -> None:
+        # Called with the lock held.
+        data = self._memory.pop(digest, None)
+        if data is not None:
+            self._memory_bytes -= len(data)
+            return
+        size = self._on_disk.pop(digest, None)
+        if size is not None:
+            self._disk_bytes -= size
+            self._path(digest).unlink(missing_ok=True)
+
+    def _spill(self) -> bool:
+        # Called with the lock held; always keeps the newest blob in memory.
+        # Every stored blob is referenced, so nothing is ever evicted – return
+        # whether memory is back within budget.
+        limit = self.disk_limit
+        while self._memory_bytes > self.memory_limit and len(self._memory) > 1:
+            digest, data = next(iter(self._memory.items()))
+            if limit is not None and self._disk_bytes + len(data) > limit:
+                return False
+            path = self._path(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            del self._memory[digest]
+            self._memory_bytes -= len(data)
+            self._on_disk[digest] = len(data)
+            self._disk_bytes += len(data)
+        return True
+
+
+# ---------------------------------------------------------------------------
+# Offloading helpers ----------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _exceeds(value: Any, budget: int) -> bool:
+    """Cheap check whether *value* is larger than *budget* bytes (approx.)."""
+
+    stack = [value]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (str, bytes, bytearray)):
+            size += len(item)
+        elif isinstance(item, dict):
+            if BlobRef.coerce(item) is not None:
+                continue
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            size += len(item)
+            stack.extend(item)
+        else:
+            size += 8
+        if size > budget:
+            return True
+    return False
+
+
+def _store_value(
+    value: Any, store: BlobStore, created: Optional[List[BlobRef]]
+) -> Any:
+    if isinstance(value, str):
+        data, kind = value.encode("utf-8"), "text"
+    elif isinstance(value, (bytes, bytearray)):
+        data, kind = bytes(value), "bytes"
+    else:
+        try:
+            data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError):
+            return value  # not serialisable – keep inline
+        kind = "json"
+    try:
+        digest = store.put(data)
+    except BlobStoreFull:
+        return value  # store exhausted – keep inline
+    ref = BlobRef(digest, len(data), kind)
+    if created is not None:
+        created.append(ref)
+    return ref
+
+
+def offload(
+    value: Any,
+    *,
+    threshold: int,
+    store: Optional[BlobStore] = None,
+    created: Optional[List[BlobRef]] = None,
+) -> Any:
+    """Replace large parts of *value* with :class:`BlobRef` objects.
+
+    Top-level values of a ``dict`` are offloaded individually so small
+    fields (status codes, flags, condition results) stay inline; any other
+    value is offloaded as a whole.  Returns *value* itself when nothing
+    crosses *threshold* (``threshold <= 0`` disables offloading).  New
+    references are appended to *created* – each holds one store reference
+    the caller should :meth:`~BlobStore.release` when done.
+    """
+
+    if threshold <= 0 or not _exceeds(value, threshold):
+        return value
+    store = store or global_blob_store()
+    if isinstance(value, dict) and BlobRef.coerce(value) is None:
+        return {
+            key: (
+                _store_value(item, store, created)
+                if _exceeds(item, threshold)
+                else item
+            )
+            for key, item in value.items()
+        }
+    return _store_value(value, store, created)
+
+
+def contains_refs(value: Any) -> bool:
+    """Whether *value* holds any :class:`BlobRef` (searched recursively)."""
+
+    if isinstance(value, dict):
+        return BlobRef.coerce(value) is not None or any(
+            contains_refs(item) for item in value.values()
+        )
+    if isinstance(value, (list, tuple)):
+        return any(contains_refs(item) for item in value)
+    return False
+
+
+def materialize(value: Any, store: Optional[BlobStore] = None) -> Any:
+    """Return *value* with every :class:`BlobRef` replaced by its content.
+
+    Containers without references are returned as-is (no copy).
+    """
+
+    if not contains_refs(value):
+        return value
+    ref = BlobRef.coerce(value)
+    if ref is not None:
+        return ref.materialize(store)
+    if isinstance(value, dict):
+        return {key: materialize(item, store) for key, item in value.items()}
+    return type(value)(materialize(item, store) for item in value)
+
+
+# ---------------------------------------------------------------------------
+# Shared instance -------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+_GLOBAL_STORE: Optional[BlobStore] = None
+_GLOBAL_LOCK = threading.Lock()
+
+
+def global_blob_store() -> BlobStore:
+    """Process-wide :class:`BlobStore` configured from the environment."""
+
+    global _GLOBAL_STORE  # pylint: disable=global-statement
+    with _GLOBAL_LOCK:
+        if _GLOBAL_STORE is None:
+            memory_mb = float(os.getenv("ICE_BLOB_MEMORY_MB", "64"))
+            disk_mb = float(os.getenv("ICE_BLOB_DISK_MB", "1024"))
+            _GLOBAL_STORE = BlobStore(
+                memory_limit=int(memory_mb * 1024 * 1024),
+                directory=os.getenv("ICE_BLOB_DIR") or None,
+                disk_limit=int(disk_mb * 1024 * 1024) if disk_mb > 0 else None,
+            )
+        return _GLOBAL_STORE
+
+
+def blob_threshold_from_env() -> int:
+    """Offload threshold in bytes from ``ICE_BLOB_THRESHOLD``."""
+
+    raw = os.getenv("ICE_BLOB_THRESHOLD")
+    if not raw:
+        return DEFAULT_THRESHOLD
+    try:
+        return int(raw)
+    except ValueError:
+        return DEFAULT_THRESHOLD
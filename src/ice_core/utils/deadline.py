@@ -0,0 +1,87 @@
+"""Deadline propagation for nested async calls (dependency-free).
+
+A deadline is an absolute :func:`time.monotonic` instant stored in a
+context variable, so it flows into tasks spawned by the orchestrator, nested
+chains and SDK calls without being threaded through every signature.  Scopes
+only ever *tighten* the deadline: an inner scope with a longer budget keeps
+the outer deadline.
+
+Example::
+
+    with deadline_scope(30):               # whole chain
+        ...
+        with deadline_scope(node.timeout_seconds):
+            timeout = clamp_timeout(10.0)  # min(10, time left)
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+__all__: list[str] = [
+    "DeadlineExceeded",
+    "clamp_timeout",
+    "current_deadline",
+    "deadline_scope",
+    "expired",
+    "remaining",
+]
+
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("ice_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work would run past the active deadline."""
+
+
+def current_deadline() -> Optional[float]:
+    """Absolute ``time.monotonic()`` deadline, or ``None`` when unbounded."""
+
+    return _DEADLINE.get()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the active deadline (never negative)."""
+
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0.0
+
+
+def clamp_timeout(timeout: Optional[float]) -> Optional[float]:
+    """Return *timeout* capped at the time left (``None`` = no limit)."""
+
+    left = remaining()
+    if left is None:
+        return timeout
+    return left if timeout is None else min(float(timeout), left)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """Bound the enclosed work to *seconds* from now (``None`` = inherit).
+
+    Yields the effective absolute deadline.
+    """
+
+    outer = _DEADLINE.get()
+    if seconds is None:
+        yield outer
+        return
+    deadline = time.monotonic() + seconds
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _DEADLINE.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _DEADLINE.reset(token)
@@ -9,8 +9,9 @@ utility gracefully falls back to SHA-256.
 from __future__ import annotations
 
 import hashlib
+import json
 from enum import Enum
-from typing import Callable, cast
+from typing import Callable, Iterable, Mapping, cast
 
 try:  # Optional – used only in PERFORMANCE mode
     import blake3  # type: ignore
@@ -22,7 +23,7 @@ try:
 except ModuleNotFoundError:  # pragma: no cover – optional dep
     MinHash = None  # type: ignore
 
-__all__: list[str] = ["HashMode", "compute_hash"]
+__all__: list[str] = ["HashMode", "compute_hash", "topology_hash"]
 
 
 class HashMode(str, Enum):
@@ -68,3 +69,14 @@ def compute_hash(content: str, mode: HashMode = HashMode.SECURITY) -> str:
         return _blake3(content.encode())
 
     return _sha256(content.encode())
+
+
+def topology_hash(adjacency: Mapping[str, Iterable[str]]) -> str:
+    """Return the SHA-256 of a DAG's adjacency list (node id → dependencies).
+
+    Dependency order is irrelevant; the digest matches the ``topology_hash``
+    recorded in :class:`~ice_core.models.node_models.ChainMetadata`.
+    """
+
+    normalised = {node_id: sorted(deps) for node_id, deps in adjacency.items()}
+    return _sha256(json.dumps(normalised, sort_keys=True).encode())
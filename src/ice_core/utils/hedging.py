@@ -0,0 +1,234 @@
+"""Hedged requests for tail-latency reduction (dependency-free).
+
+A :class:`Hedger` starts the primary call and, if it has not finished after
+the *percentile* latency observed for the same key, issues one backup call
+(possibly against a different backend).  The first *acceptable* response
+wins and the other call is cancelled.
+
+Spend is capped by a token bucket: every request earns ``budget_ratio``
+tokens (up to ``burst``) and every hedge costs one, so in the long run at
+most ``budget_ratio`` extra calls are issued per request.
+
+Only hedge idempotent operations (LLM completions, HTTP ``GET``) – the losing
+call may already have reached the backend before it is cancelled.
+
+Named hedgers are shared process-wide via :func:`get_hedger`;
+:func:`hedging_metrics` reports request, hedge and win counts for all of them.
+Callers with different requirements pass their own *policy* to
+:meth:`Hedger.run` and still share the latency history of the backend.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+__all__: list[str] = [
+    "HedgePolicy",
+    "HedgeStats",
+    "Hedger",
+    "get_hedger",
+    "hedging_metrics",
+]
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to hedge and how much extra load is acceptable.
+
+    Args:
+        percentile: Latency percentile of recent calls after which the backup
+            is issued.
+        min_delay: Lower bound for the hedge delay in seconds.
+        max_delay: Optional upper bound for the hedge delay in seconds.
+        min_samples: Calls observed per key before hedging starts.
+        window: Recent latencies kept per key.
+        budget_ratio: Long-run ceiling of hedges per request (0.05 = +5%).
+        burst: Hedges that may be issued back-to-back after an idle period.
+    """
+
+    percentile: float = 95.0
+    min_delay: float = 0.05
+    max_delay: Optional[float] = None
+    min_samples: int = 20
+    window: int = 256
+    budget_ratio: float = 0.05
+    burst: float = 3.0
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    primary_wins: int = 0
+    budget_denied: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of hedges where the backup answered first."""
+
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+def _accept_all(_: Any) -> bool:
+    return True
+
+
+def _consume(task: "asyncio.Future[Any]") -> None:
+    # Retrieve the loser's exception so asyncio does not log it as unhandled.
+    if not task.cancelled():
+        task.exception()
+
+
+class Hedger:
+    """Latency-percentile hedging with a spend budget (see module docs)."""
+
+    def __init__(self, policy: Optional[HedgePolicy] = None) -> None:
+        self.policy = policy or HedgePolicy()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._stats: Dict[str, HedgeStats] = {}
+        self._tokens = self.policy.burst
+
+    # ------------------------------------------------------------------
+    # Public API --------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def delay_for(
+        self, key: str, policy: Optional[HedgePolicy] = None
+    ) -> Optional[float]:
+        """Hedge delay for *key*, or ``None`` while too few samples exist."""
+
+        samples = self._latencies.get(key)
+        policy = policy or self.policy
+        if samples is None or len(samples) < policy.min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = math.ceil(policy.percentile / 100 * len(ordered)) - 1
+        delay = max(policy.min_delay, ordered[max(0, rank)])
+        if policy.max_delay is not None:
+            delay = min(delay, policy.max_delay)
+        return delay
+
+    def record(self, key: str, seconds: float) -> None:
+        samples = self._latencies.get(key)
+        if samples is None:
+            samples = self._latencies[key] = deque(maxlen=self.policy.window)
+        samples.append(seconds)
+
+    async def run(
+        self,
+        key: str,
+        primary: Callable[[], Awaitable[T]],
+        backup: Optional[Callable[[], Awaitable[T]]] = None,
+        *,
+        accept: Callable[[T], bool] = _accept_all,
+        policy: Optional[HedgePolicy] = None,
+    ) -> T:
+        """Await *primary*, hedging with *backup* (default: *primary* again).
+
+        *accept* decides whether a completed result may win; a rejected or
+        failed result only counts when the other call fails as well.
+        *policy* overrides the hedger's default for this call.
+        """
+
+        policy = policy or self.policy
+        stats = self._stats.setdefault(key, HedgeStats())
+        stats.requests += 1
+        self._tokens = min(policy.burst, self._tokens + policy.budget_ratio)
+
+        started = time.monotonic()
+        first = asyncio.ensure_future(primary())
+        delay = self.delay_for(key, policy)
+        hedge = False
+        if delay is not None:
+            done, _ = await asyncio.wait({first}, timeout=delay)
+            hedge = not done
+            if hedge and self._tokens < 1.0:
+                stats.budget_denied += 1
+                hedge = False
+        if not hedge:
+            try:
+                return await first
+            finally:
+                self.record(key, time.monotonic() - started)
+
+        self._tokens -= 1.0
+        stats.hedged += 1
+        second = asyncio.ensure_future((backup or primary)())
+        pending = {first, second}
+        winner: Optional["asyncio.Future[T]"] = None
+        fallback: "asyncio.Future[T]" = first
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None and accept(task.result()):
+                        winner = task
+                        break
+                    fallback = task
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_consume)
+            # The primary's latency is known (or lower-bounded) either way.
+            self.record(key, time.monotonic() - started)
+
+        if winner is second:
+            stats.hedge_wins += 1
+        elif winner is first:
+            stats.primary_wins += 1
+        return (winner or fallback).result()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-key counters plus hedge win rate and current delay."""
+
+        return {
+            key: {
+                **asdict(stats),
+                "win_rate": stats.win_rate,
+                "delay_ms": (
+                    None
+                    if (delay := self.delay_for(key)) is None
+                    else delay * 1e3
+                ),
+            }
+            for key, stats in self._stats.items()
+        }
+
+
+# ---------------------------------------------------------------------------
+# Shared instances ------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+_HEDGERS: Dict[str, Hedger] = {}
+_LOCK = threading.Lock()
+
+
+def get_hedger(name: str, policy: Optional[HedgePolicy] = None) -> Hedger:
+    """Return the process-wide hedger *name*, creating it with *policy*.
+
+    *policy* only sets the default of a newly created hedger; pass a policy
+    to :meth:`Hedger.run` to apply it to an individual call.
+    """
+
+    with _LOCK:
+        hedger = _HEDGERS.get(name)
+        if hedger is None:
+            hedger = _HEDGERS[name] = Hedger(policy)
+        return hedger
+
+
+def hedging_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics of every shared hedger, keyed by hedger name."""
+
+    return {name: hedger.metrics() for name, hedger in list(_HEDGERS.items())}
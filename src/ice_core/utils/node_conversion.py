@@ -7,8 +7,9 @@ Keeping this logic inside *ice_core* prevents higher-level layers from
 hard-coding type switches and ensures that the mapping stays in one place.
 """
 
-from typing import Dict, List, Type
+from typing import Dict, List, Optional, Type
 
+from ice_core.cache import LRUCache
 from ice_core.models import (
     ConditionNodeConfig,
     LLMOperatorConfig,
@@ -69,7 +70,26 @@ def convert_node_spec(spec: NodeSpec) -> NodeConfig:
     return cfg_cls.model_validate(payload)
 
 
-def convert_node_specs(specs: List[NodeSpec]) -> List[NodeConfig]:
-    """Bulk convert a list of NodeSpec objects."""
+# Converted node lists keyed by ``Blueprint.plan_key()`` ----------------------
+_CONVERSION_CACHE = LRUCache(capacity=256)
 
-    return [convert_node_spec(s) for s in specs]
+
+def convert_node_specs(
+    specs: List[NodeSpec], *, cache_key: Optional[str] = None
+) -> List[NodeConfig]:
+    """Bulk convert a list of NodeSpec objects.
+
+    When *cache_key* is given (see :meth:`Blueprint.plan_key`) the validated
+    configs are memoised, so repeated runs of one blueprint skip Pydantic
+    validation.  Cached configs are shared and must be treated as read-only.
+    """
+
+    if cache_key is not None:
+        cached = _CONVERSION_CACHE.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+    converted = [convert_node_spec(s) for s in specs]
+    if cache_key is not None:
+        _CONVERSION_CACHE.set(cache_key, tuple(converted))
+    return converted
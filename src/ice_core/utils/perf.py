@@ -3,12 +3,148 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import heapq
+import itertools
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional, Tuple
 
-__all__ = ["estimate_complexity", "WeightedSemaphore"]
+__all__ = [
+    "CostModel",
+    "PrioritySemaphore",
+    "WeightedSemaphore",
+    "estimate_complexity",
+    "global_cost_model",
+]
 
 
-def estimate_complexity(node_cfg: Any) -> int:  # – generic for now
+# ---------------------------------------------------------------------------
+# Learned node cost -----------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _kind_key(node_cfg: Any) -> str:
+    """Signature shared by nodes doing the same kind of work."""
+
+    target = (
+        getattr(node_cfg, "tool_name", None)
+        or getattr(node_cfg, "model", None)
+        or getattr(node_cfg, "chain_id", None)
+        or ""
+    )
+    return f"{getattr(node_cfg, 'type', '')}:{target}"
+
+
+def _keys(node_cfg: Any) -> Tuple[str, str]:
+    """``(node key, kind key)`` – the kind is formatted once for both."""
+
+    kind = _kind_key(node_cfg)
+    return f"{kind}#{getattr(node_cfg, 'id', '')}", kind
+
+
+class CostModel:
+    """Exponentially-weighted latency and token usage observed per node.
+
+    Observations are kept under two keys – the node itself (``type:target#id``)
+    and its *kind* (``type:target``, e.g. ``skill:web_search`` or
+    ``llm:gpt-4o``) – so a node that never ran still inherits the history of
+    its kind.  Nodes without any history fall back to *prior_latency* scaled
+    by the static heuristic.
+
+    Args:
+        alpha: EWMA smoothing factor (weight of the newest observation).
+        prior_latency: Assumed seconds per heuristic weight unit when nothing
+            has been observed yet.
+        token_unit: Tokens per extra parallelism slot.
+        latency_unit: Seconds per extra parallelism slot.
+        max_weight: Upper bound for :meth:`weight`.
+        max_entries: Keys kept before the least-recently-observed are
+            evicted (per-node keys grow with every distinct node id).
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = 0.3,
+        prior_latency: float = 0.1,
+        token_unit: float = 4000.0,
+        latency_unit: float = 10.0,
+        max_weight: int = 4,
+        max_entries: int = 4096,
+    ) -> None:
+        self.alpha = alpha
+        self.prior_latency = prior_latency
+        self.token_unit = token_unit
+        self.latency_unit = latency_unit
+        self.max_weight = max_weight
+        self.max_entries = max_entries
+        # key -> (latency_ewma, tokens_ewma, samples), least recently observed
+        # first.  A bounded LRU like the other caches, kept inline so one lock
+        # covers the read-modify-write and reads stay lock-free.
+        self._stats: "OrderedDict[str, Tuple[float, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def observe(self, node_cfg: Any, seconds: float, tokens: int = 0) -> None:
+        """Record one successful execution of *node_cfg*."""
+
+        stats = self._stats
+        a = self.alpha
+        with self._lock:
+            for key in _keys(node_cfg):
+                prev = stats.get(key)
+                if prev is None:
+                    stats[key] = (seconds, float(tokens), 1)
+                    continue
+                lat, tok, n = prev
+                stats[key] = (
+                    lat + a * (seconds - lat),
+                    tok + a * (tokens - tok),
+                    n + 1,
+                )
+                stats.move_to_end(key)
+            while len(stats) > self.max_entries:
+                stats.popitem(last=False)
+
+    def _lookup(self, node_cfg: Any) -> Optional[Tuple[float, float, int]]:
+        if not self._stats:
+            return None  # nothing learned yet – skip formatting the keys
+        node_key, kind_key = _keys(node_cfg)
+        return self._stats.get(node_key) or self._stats.get(kind_key)
+
+    def latency(self, node_cfg: Any) -> float:
+        """Expected run time of *node_cfg* in seconds."""
+
+        stats = self._lookup(node_cfg)
+        if stats is None:
+            return self.prior_latency * _heuristic_weight(node_cfg)
+        return stats[0]
+
+    def weight(self, node_cfg: Any) -> Optional[int]:
+        """Learned parallelism weight, or ``None`` without history."""
+
+        stats = self._lookup(node_cfg)
+        if stats is None:
+            return None
+        lat, tok, _ = stats
+        units = tok / self.token_unit + lat / self.latency_unit
+        return max(1, min(self.max_weight, 1 + int(units)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+_GLOBAL_COST_MODEL = CostModel()
+
+
+def global_cost_model() -> CostModel:
+    """Process-wide :class:`CostModel` fed by every workflow run."""
+
+    return _GLOBAL_COST_MODEL
+
+
+def _heuristic_weight(node_cfg: Any) -> int:
     # Avoid cross-layer imports – infer complexity heuristically -------------
     cls_name = getattr(getattr(node_cfg, "__class__", None), "__name__", "")
     if cls_name == "LLMOperatorConfig":
@@ -16,6 +152,22 @@ def estimate_complexity(node_cfg: Any) -> int:  # – generic for now
     return 1
 
 
+def estimate_complexity(node_cfg: Any, model: Optional[CostModel] = None) -> int:
+    """Parallelism slots *node_cfg* should hold.
+
+    Learned from observed latency and token usage (see :class:`CostModel`);
+    nodes without history fall back to a static heuristic.
+    """
+
+    learned = (model or _GLOBAL_COST_MODEL).weight(node_cfg)
+    return learned if learned is not None else _heuristic_weight(node_cfg)
+
+
+# ---------------------------------------------------------------------------
+# Semaphores ------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
 class WeightedSemaphore:
     """Async context-manager that acquires *weight* slots from *sem*."""
 
@@ -34,3 +186,77 @@ class WeightedSemaphore:
         for _ in range(self._weight):
             self._sem.release()
         return False
+
+
+class PrioritySemaphore:
+    """Weighted semaphore that admits the highest-priority waiter first.
+
+    Slots are granted atomically (all *weight* slots at once), so heavy
+    waiters cannot deadlock by each holding part of their share.  Waiters are
+    served strictly by ``(priority desc, arrival)``; a heavy head-of-line
+    waiter blocks lighter ones behind it until enough slots are free, which
+    keeps it from starving.  Weights above *capacity* are clamped.
+
+    Example::
+
+        sem = PrioritySemaphore(4)
+        async with sem.slot(weight=2, priority=critical_path_seconds):
+            ...
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be ≥1")
+        self.capacity = capacity
+        self._free = capacity
+        self._waiters: List[Tuple[float, int, int, "asyncio.Future[None]"]] = []
+        self._seq = itertools.count()
+
+    @property
+    def available(self) -> int:
+        return self._free
+
+    async def acquire(self, weight: int = 1, priority: float = 0.0) -> int:
+        """Wait for *weight* slots; returns the (clamped) weight acquired."""
+
+        weight = max(1, min(weight, self.capacity))
+        if not self._waiters and self._free >= weight:
+            self._free -= weight
+            return weight
+        fut: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._seq), weight, fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release(weight)  # granted just before the cancellation
+            else:
+                fut.cancel()
+                self._wake()  # a cancelled head may have been blocking others
+            raise
+        return weight
+
+    def release(self, weight: int = 1) -> None:
+        self._free += max(1, min(weight, self.capacity))
+        self._wake()
+
+    def _wake(self) -> None:
+        waiters = self._waiters
+        while waiters:
+            _, _, weight, fut = waiters[0]
+            if fut.done():  # cancelled waiter
+                heapq.heappop(waiters)
+                continue
+            if weight > self._free:
+                break
+            heapq.heappop(waiters)
+            self._free -= weight
+            fut.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, weight: int = 1, priority: float = 0.0) -> AsyncIterator[int]:
+        acquired = await self.acquire(weight, priority)
+        try:
+            yield acquired
+        finally:
+            self.release(acquired)
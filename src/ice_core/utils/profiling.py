@@ -0,0 +1,438 @@
+"""Low-overhead sampling profiler for the asyncio event loop (dependency-free).
+
+A daemon thread samples the loop thread's Python stack every *interval*
+seconds via :func:`sys._current_frames` – nothing is instrumented on the loop
+itself except a cheap heartbeat callback.  A run produces:
+
+* a wall-clock **flamegraph** in speedscope's JSON format
+  (open it at https://www.speedscope.app),
+* the **asyncio task tree** at peak concurrency plus a census of coroutine
+  names seen during the run,
+* the **blocking calls** – stacks that held the loop for longer than
+  *block_threshold* without yielding (detected when the heartbeat is late).
+
+Example::
+
+    async with LoopProfiler(interval=0.005, block_threshold=0.05) as prof:
+        await workflow.execute()
+    prof.report.write("profiles", prefix="checkout")
+
+Set ``ICE_PROFILE=1`` to enable :func:`profile_from_env` hooks (used by the
+workflow service) without code changes; see :func:`profile_from_env` for the
+related variables.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+__all__ = [
+    "BlockingCall",
+    "LoopProfiler",
+    "ProfileReport",
+    "profile_dir",
+    "profile_from_env",
+]
+
+logger = logging.getLogger(__name__)
+
+# (qualified function name, file, first line) – stable across samples
+FrameKey = Tuple[str, str, int]
+Stack = Tuple[int, ...]  # frame indices, root → leaf
+
+
+@dataclass
+class BlockingCall:
+    """A stack that kept the event loop busy beyond the block threshold."""
+
+    stack: List[str]
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass
+class ProfileReport:
+    """Result of one profiling session."""
+
+    name: str
+    duration: float
+    interval: float
+    frames: List[FrameKey]
+    samples: List[Stack]
+    weights: List[float]
+    blocking_calls: List[BlockingCall]
+    task_tree: List[Dict[str, Any]]
+    task_counts: Dict[str, int] = field(default_factory=dict)
+
+    # ------------------------------------------------------------------
+    # Exporters ----------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def speedscope(self) -> Dict[str, Any]:
+        """Return the samples as a speedscope *sampled* profile."""
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": "iceos-loop-profiler",
+            "shared": {
+                "frames": [
+                    {"name": name, "file": file, "line": line}
+                    for name, file, line in self.frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": f"{self.name} (event loop, wall clock)",
+                    "unit": "seconds",
+                    "startValue": 0.0,
+                    "endValue": sum(self.weights),
+                    "samples": [list(s) for s in self.samples],
+                    "weights": self.weights,
+                }
+            ],
+        }
+
+    def top_blocking(self, limit: int = 10) -> List[BlockingCall]:
+        return sorted(self.blocking_calls, key=lambda b: b.total_ms, reverse=True)[
+            :limit
+        ]
+
+    def summary(self, limit: int = 10) -> str:
+        """Human-readable digest: blocking calls and busiest functions."""
+
+        lines = [
+            f"Profile '{self.name}': {self.duration:.3f}s, "
+            f"{len(self.samples)} samples @ {self.interval * 1e3:.1f}ms"
+        ]
+        self_time: Counter[int] = Counter()
+        for stack, weight in zip(self.samples, self.weights):
+            if stack:
+                self_time[stack[-1]] += weight  # type: ignore[assignment]
+        lines.append("Top functions (self wall time):")
+        for idx, seconds in self_time.most_common(limit):
+            name, file, line = self.frames[idx]
+            lines.append(f"  {seconds * 1e3:9.1f} ms  {name} ({file}:{line})")
+        blocking = self.top_blocking(limit)
+        lines.append(f"Blocking calls ({len(self.blocking_calls)}):")
+        for call in blocking:
+            where = call.stack[-1] if call.stack else "?"
+            lines.append(
+                f"  {call.total_ms:9.1f} ms total, {call.count}x, "
+                f"max {call.max_ms:.1f} ms  {where}"
+            )
+        return "\n".join(lines)
+
+    def write(self, directory: str | Path, prefix: Optional[str] = None) -> List[Path]:
+        """Write speedscope, task-tree and blocking-call JSON files."""
+
+        out = Path(directory)
+        out.mkdir(parents=True, exist_ok=True)
+        stem = prefix or self.name
+        files = {
+            out / f"{stem}.speedscope.json": self.speedscope(),
+            out / f"{stem}.tasks.json": {
+                "peak": self.task_tree,
+                "counts": self.task_counts,
+            },
+            out / f"{stem}.blocking.json": [
+                call.__dict__ for call in self.top_blocking(len(self.blocking_calls))
+            ],
+        }
+        for path, payload in files.items():
+            path.write_text(json.dumps(payload, indent=1, default=str))
+        return list(files)
+
+
+# ---------------------------------------------------------------------------
+# Profiler ------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+class LoopProfiler:
+    """Sample the running event loop's thread from a background thread.
+
+    Args:
+        interval: Seconds between stack samples (and heartbeat ticks).
+        block_threshold: Heartbeat lateness (seconds) that counts as the loop
+            being blocked.
+        task_interval: Seconds between asyncio task-tree snapshots.
+        max_depth: Frames kept per sample (deepest frames win).
+        name: Label used in exported files.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 0.005,
+        block_threshold: float = 0.05,
+        task_interval: float = 0.1,
+        max_depth: int = 128,
+        name: str = "profile",
+    ) -> None:
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.task_interval = task_interval
+        self.max_depth = max_depth
+        self.name = name
+        self.report: Optional[ProfileReport] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_id: Optional[int] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._heartbeat: Optional[asyncio.TimerHandle] = None
+        self._last_tick = 0.0
+
+        self._frame_index: Dict[FrameKey, int] = {}
+        self._stack_cache: Dict[Tuple[int, ...], Stack] = {}
+        self._samples: List[Stack] = []
+        self._weights: List[float] = []
+        self._blocking: Dict[Tuple[str, ...], BlockingCall] = {}
+        self._task_tree: List[Dict[str, Any]] = []
+        self._task_peak = -1
+        self._task_counts: Counter[str] = Counter()
+        self._started = 0.0
+
+    # ------------------------------------------------------------------
+    # Lifecycle -----------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start sampling the *current* thread's running loop."""
+
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._started = self._last_tick = time.perf_counter()
+        self._stop.clear()
+        self._tick()
+        self._sampler = threading.Thread(
+            target=self._run, name="ice-loop-profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self) -> ProfileReport:
+        """Stop sampling and build the :class:`ProfileReport`."""
+
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+
+        frames: List[FrameKey] = [("", "", 0)] * len(self._frame_index)
+        for key, idx in self._frame_index.items():
+            frames[idx] = key
+        self.report = ProfileReport(
+            name=self.name,
+            duration=time.perf_counter() - self._started,
+            interval=self.interval,
+            frames=frames,
+            samples=self._samples,
+            weights=self._weights,
+            blocking_calls=list(self._blocking.values()),
+            task_tree=self._task_tree,
+            task_counts=dict(self._task_counts),
+        )
+        return self.report
+
+    async def __aenter__(self) -> "LoopProfiler":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Loop-thread callbacks -------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def _tick(self) -> None:
+        self._last_tick = time.perf_counter()
+        if not self._stop.is_set() and self._loop is not None:
+            self._heartbeat = self._loop.call_later(self.interval, self._tick)
+
+    def _snapshot_tasks(self) -> None:
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            self._task_counts[_coro_name(task)] += 1
+        if len(tasks) <= self._task_peak:
+            return
+        self._task_peak = len(tasks)
+        self._task_tree = _task_tree(tasks)
+
+    # ------------------------------------------------------------------
+    # Sampler thread --------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        loop, tid = self._loop, self._thread_id
+        assert loop is not None and tid is not None
+        last = time.perf_counter()
+        next_tasks = last
+        block_start: Optional[float] = None
+        block_key: Tuple[str, ...] = ()
+
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            frame = sys._current_frames().get(tid)
+            if frame is None:
+                break
+            stack = self._intern(frame)
+            self._samples.append(stack)
+            self._weights.append(now - last)
+            last = now
+
+            # Heartbeat overdue → the loop is running something that does not
+            # yield.  Attribute the block to the stack seen when first noticed.
+            lag = now - self._last_tick - self.interval
+            if lag > self.block_threshold:
+                if block_start is None:
+                    block_start = self._last_tick
+                    block_key = self._describe(stack)
+            elif block_start is not None:
+                held = max(0.0, self._last_tick - block_start - self.interval)
+                self._record_block(block_key, held)
+                block_start = None
+
+            if now >= next_tasks and not loop.is_closed():
+                next_tasks = now + self.task_interval
+                try:
+                    loop.call_soon_threadsafe(self._snapshot_tasks)
+                except RuntimeError:  # loop closed meanwhile
+                    break
+
+        if block_start is not None:
+            self._record_block(block_key, time.perf_counter() - block_start)
+
+    def _intern(self, frame: Optional[FrameType]) -> Stack:
+        keys: List[int] = []
+        index = self._frame_index
+        while frame is not None and len(keys) < self.max_depth:
+            code = frame.f_code
+            key = (
+                getattr(code, "co_qualname", code.co_name),
+                code.co_filename,
+                code.co_firstlineno,
+            )
+            idx = index.get(key)
+            if idx is None:
+                idx = index[key] = len(index)
+            keys.append(idx)
+            frame = frame.f_back
+        keys.reverse()
+        raw = tuple(keys)
+        # Share identical stacks so long runs stay compact in memory.
+        return self._stack_cache.setdefault(raw, raw)
+
+    def _describe(self, stack: Stack, depth: int = 6) -> Tuple[str, ...]:
+        frames = list(self._frame_index)
+        return tuple(
+            f"{frames[i][0]} ({frames[i][1]}:{frames[i][2]})" for i in stack[-depth:]
+        )
+
+    def _record_block(self, key: Tuple[str, ...], seconds: float) -> None:
+        ms = seconds * 1e3
+        if ms < self.block_threshold * 1e3:
+            return
+        call = self._blocking.get(key)
+        if call is None:
+            call = self._blocking[key] = BlockingCall(stack=list(key))
+        call.count += 1
+        call.total_ms += ms
+        call.max_ms = max(call.max_ms, ms)
+
+
+# ---------------------------------------------------------------------------
+# Task tree helpers ---------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _coro_name(task: "asyncio.Task[Any]") -> str:
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or type(coro).__name__
+
+
+def _awaited_tasks(task: "asyncio.Task[Any]") -> List["asyncio.Future[Any]"]:
+    """Futures *task* is currently blocked on (gather children expanded)."""
+
+    waiter = getattr(task, "_fut_waiter", None)
+    if waiter is None:
+        return []
+    children = getattr(waiter, "_children", None)  # asyncio.gather
+    return list(children) if children else [waiter]
+
+
+def _task_tree(tasks: "set[asyncio.Task[Any]]") -> List[Dict[str, Any]]:
+    children: Dict["asyncio.Future[Any]", List["asyncio.Future[Any]"]] = {}
+    awaited: set["asyncio.Future[Any]"] = set()
+    for task in tasks:
+        kids = [f for f in _awaited_tasks(task) if f in tasks]
+        children[task] = kids
+        awaited.update(kids)
+
+    def _node(task: "asyncio.Task[Any]", seen: set[Any]) -> Dict[str, Any]:
+        seen.add(task)
+        frames = task.get_stack(limit=1)
+        where = (
+            f"{frames[0].f_code.co_filename}:{frames[0].f_lineno}" if frames else ""
+        )
+        return {
+            "name": task.get_name(),
+            "coro": _coro_name(task),
+            "where": where,
+            "children": [
+                _node(child, seen)  # type: ignore[arg-type]
+                for child in children.get(task, [])
+                if child not in seen
+            ],
+        }
+
+    seen: set[Any] = set()
+    return [_node(t, seen) for t in tasks if t not in awaited]
+
+
+# ---------------------------------------------------------------------------
+# Environment switch ----------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def profile_from_env(name: str) -> Optional[LoopProfiler]:
+    """Return a configured profiler when ``ICE_PROFILE`` is enabled.
+
+    Variables (read on every call, so a restart with a new environment is all
+    that is needed):
+
+    * ``ICE_PROFILE`` – ``1``/``true``/``yes`` enables profiling.
+    * ``ICE_PROFILE_INTERVAL_MS`` – sampling interval (default 5).
+    * ``ICE_PROFILE_BLOCK_MS`` – blocking-call threshold (default 50).
+    """
+
+    if os.getenv("ICE_PROFILE", "").lower() not in {"1", "true", "yes", "on"}:
+        return None
+    return LoopProfiler(
+        interval=float(os.getenv("ICE_PROFILE_INTERVAL_MS", "5")) / 1e3,
+        block_threshold=float(os.getenv("ICE_PROFILE_BLOCK_MS", "50")) / 1e3,
+        name=name,
+    )
+
+
+def profile_dir() -> Path:
+    """Directory reports are written to (``ICE_PROFILE_DIR``, default ``profiles``)."""
+
+    return Path(os.getenv("ICE_PROFILE_DIR", "profiles"))
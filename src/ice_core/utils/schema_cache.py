@@ -0,0 +1,350 @@
+"""Process-wide cache of compiled JSON Schema validators.
+
+Building a ``jsonschema`` validator (meta-schema lookup, ``$ref`` resolver,
+keyword dispatch tables) costs far more than validating a typical payload.
+:func:`compile_schema` memoises validators keyed by a stable hash of the
+schema so every tool call, node output and WebSocket message re-uses the same
+compiled object.
+
+Each :class:`CompiledSchema` additionally carries an optional *fast checker* –
+a plain boolean predicate used on the happy path.  ``fastjsonschema`` is used
+when installed (optional dependency); otherwise a small built-in compiler
+handles the common keyword subset (``type``, ``properties``, ``required``,
+``items``, ``enum`` …).  Schemas using anything else simply have no fast
+checker.  Detailed error messages always come from ``jsonschema`` so output is
+identical regardless of the path taken.
+
+Example
+-------
+>>> compiled = compile_schema({"type": "object", "required": ["id"]})
+>>> compiled.is_valid({"id": 1})
+True
+>>> compiled.errors({}, fail_fast=True)
+["'id' is a required property"]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from ice_core.cache import LRUCache
+
+try:  # Optional – generated-code checkers
+    import fastjsonschema  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – optional dep
+    fastjsonschema = None  # type: ignore
+
+__all__: list[str] = [
+    "CompiledSchema",
+    "compile_schema",
+    "schema_fingerprint",
+    "clear_schema_cache",
+]
+
+Checker = Callable[[Any], bool]
+
+_CACHE = LRUCache(capacity=512)
+
+
+def schema_fingerprint(schema: Any) -> str:
+    """Return a stable SHA-256 hex digest for *schema*.
+
+    Non-JSON values (e.g. Python ``type`` objects used by dict-style node
+    schemas) are folded in via ``repr`` so they still hash deterministically.
+    """
+
+    blob = json.dumps(schema, sort_keys=True, default=repr, separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+@dataclass
+class CompiledSchema:
+    """A cached ``jsonschema`` validator plus optional fast checker."""
+
+    schema: Dict[str, Any]
+    fingerprint: str
+    validator: Any
+    fast_check: Optional[Checker] = field(default=None, repr=False)
+
+    def is_valid(self, data: Any) -> bool:
+        """Return *True* when *data* satisfies the schema."""
+
+        if self.fast_check is not None:
+            return self.fast_check(data)
+        return bool(self.validator.is_valid(data))
+
+    def errors(self, data: Any, *, fail_fast: bool = False) -> List[str]:
+        """Return error messages for *data* (empty list when valid).
+
+        With ``fail_fast`` validation stops at the first error instead of
+        collecting and ordering every violation.
+        """
+
+        if self.fast_check is not None and self.fast_check(data):
+            return []
+        iterator = self.validator.iter_errors(data)
+        if fail_fast:
+            first = next(iterator, None)
+            return [] if first is None else [first.message]
+        ordered = sorted(iterator, key=lambda e: [str(p) for p in e.path])
+        return [e.message for e in ordered]
+
+    def validate(self, data: Any) -> None:
+        """Raise ``jsonschema.ValidationError`` for the first violation."""
+
+        if self.fast_check is not None and self.fast_check(data):
+            return
+        self.validator.validate(data)
+
+
+def compile_schema(schema: Dict[str, Any], *, fast: bool = True) -> CompiledSchema:
+    """Return the cached :class:`CompiledSchema` for *schema*.
+
+    The validator class follows the schema's ``$schema`` declaration and
+    defaults to Draft 7.  Pass ``fast=False`` to skip fast-checker compilation
+    (the cached entry is shared, so this only matters on first use).
+    """
+
+    fingerprint = schema_fingerprint(schema)
+    cached = _CACHE.get(fingerprint)
+    if cached is not None:
+        return cached  # type: ignore[no-any-return]
+
+    from jsonschema import Draft7Validator  # type: ignore
+    from jsonschema.validators import validator_for  # type: ignore
+
+    validator_cls = validator_for(schema, default=Draft7Validator)
+    compiled = CompiledSchema(
+        schema=schema,
+        fingerprint=fingerprint,
+        validator=validator_cls(schema),
+        fast_check=_build_fast_check(schema, validator_cls) if fast else None,
+    )
+    _CACHE.set(fingerprint, compiled)
+    return compiled
+
+
+def clear_schema_cache() -> None:
+    """Drop every cached validator (mainly for tests)."""
+
+    _CACHE.clear()
+
+
+# ---------------------------------------------------------------------------
+# Fast checker compilation ---------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _build_fast_check(
+    schema: Dict[str, Any], validator_cls: type
+) -> Optional[Checker]:
+    if fastjsonschema is not None:
+        try:
+            check = fastjsonschema.compile(schema)
+        except Exception:  # – unsupported draft/keyword
+            pass
+        else:
+
+            def _generated(data: Any) -> bool:
+                try:
+                    check(data)
+                except fastjsonschema.JsonSchemaException:
+                    return False
+                return True
+
+            return _generated
+    # The built-in compiler follows draft 6+ semantics (e.g. ``1.0`` is an
+    # integer); leave older drafts to jsonschema.
+    if validator_cls.__name__ in {"Draft3Validator", "Draft4Validator"}:
+        return None
+    try:
+        return _compile_node(schema)
+    except _Unsupported:
+        return None
+
+
+class _Unsupported(Exception):
+    """Raised when a schema uses keywords the built-in compiler skips."""
+
+
+# Keywords with no effect on validation outcome.
+_ANNOTATIONS = frozenset(
+    {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+)
+
+_TYPE_CHECKS: Dict[str, Checker] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: (
+        isinstance(v, int)
+        and not isinstance(v, bool)
+        or isinstance(v, float)
+        and v.is_integer()
+    ),
+}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _json_equal(a: Any, b: Any) -> bool:
+    """JSON Schema equality: ``True`` never equals ``1``."""
+
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    if _is_number(a) and _is_number(b):
+        return a == b
+    return type(a) is type(b) and a == b
+
+
+def _compile_node(schema: Any) -> Checker:
+    if schema is True or schema == {}:
+        return lambda _v: True
+    if schema is False:
+        return lambda _v: False
+    if not isinstance(schema, dict):
+        raise _Unsupported()
+
+    checks: List[Checker] = []
+    for keyword, arg in schema.items():
+        if keyword in _ANNOTATIONS:
+            continue
+        builder = _KEYWORDS.get(keyword)
+        if builder is None:
+            raise _Unsupported()
+        checks.append(builder(arg, schema))
+
+    # ``additionalProperties`` depends on ``properties`` – keep it last.
+    checks.sort(key=lambda c: getattr(c, "_late", False))
+
+    def _check(value: Any) -> bool:
+        for check in checks:
+            if not check(value):
+                return False
+        return True
+
+    return _check
+
+
+def _kw_type(arg: Any, _schema: Dict[str, Any]) -> Checker:
+    names = [arg] if isinstance(arg, str) else list(arg)
+    try:
+        preds = [_TYPE_CHECKS[n] for n in names]
+    except (KeyError, TypeError):
+        raise _Unsupported() from None
+    return lambda v: any(p(v) for p in preds)
+
+
+def _kw_properties(arg: Any, _schema: Dict[str, Any]) -> Checker:
+    subs = {name: _compile_node(sub) for name, sub in arg.items()}
+
+    def _check(v: Any) -> bool:
+        if not isinstance(v, dict):
+            return True
+        for name, sub in subs.items():
+            if name in v and not sub(v[name]):
+                return False
+        return True
+
+    return _check
+
+
+def _kw_required(arg: Any, _schema: Dict[str, Any]) -> Checker:
+    names = tuple(arg)
+    return lambda v: not isinstance(v, dict) or all(n in v for n in names)
+
+
+def _kw_additional_properties(arg: Any, schema: Dict[str, Any]) -> Checker:
+    if "patternProperties" in schema:
+        raise _Unsupported()
+    known = frozenset(schema.get("properties", {}))
+    extra = _compile_node(arg)
+
+    def _check(v: Any) -> bool:
+        if not isinstance(v, dict):
+            return True
+        return all(extra(val) for key, val in v.items() if key not in known)
+
+    _check._late = True  # type: ignore[attr-defined]
+    return _check
+
+
+def _kw_items(arg: Any, _schema: Dict[str, Any]) -> Checker:
+    if isinstance(arg, list):  # tuple validation differs across drafts
+        raise _Unsupported()
+    sub = _compile_node(arg)
+    return lambda v: not isinstance(v, list) or all(sub(i) for i in v)
+
+
+def _kw_enum(arg: Any, _schema: Dict[str, Any]) -> Checker:
+    options = list(arg)
+    return lambda v: any(_json_equal(v, o) for o in options)
+
+
+def _kw_const(arg: Any, _schema: Dict[str, Any]) -> Checker:
+    return lambda v: _json_equal(v, arg)
+
+
+def _numeric(op: Callable[[float, float], bool]) -> Callable[..., Checker]:
+    def _builder(arg: Any, _schema: Dict[str, Any]) -> Checker:
+        if not _is_number(arg):  # draft-4 boolean exclusive* form
+            raise _Unsupported()
+        return lambda v: not _is_number(v) or op(v, arg)
+
+    return _builder
+
+
+def _sized(kind: type, op: Callable[[int, int], bool]) -> Callable[..., Checker]:
+    def _builder(arg: Any, _schema: Dict[str, Any]) -> Checker:
+        return lambda v: not isinstance(v, kind) or op(len(v), arg)
+
+    return _builder
+
+
+def _kw_multiple_of(arg: Any, _schema: Dict[str, Any]) -> Checker:
+    if not isinstance(arg, int) or isinstance(arg, bool):
+        raise _Unsupported()  # float divisors need jsonschema's rounding rules
+
+    def _check(v: Any) -> bool:
+        if not _is_number(v):
+            return True
+        if isinstance(v, float) and not math.isfinite(v):
+            return False
+        return v % arg == 0
+
+    return _check
+
+
+_KEYWORDS: Dict[str, Callable[[Any, Dict[str, Any]], Checker]] = {
+    "type": _kw_type,
+    "properties": _kw_properties,
+    "required": _kw_required,
+    "additionalProperties": _kw_additional_properties,
+    "items": _kw_items,
+    "enum": _kw_enum,
+    "const": _kw_const,
+    "minimum": _numeric(lambda v, a: v >= a),
+    "maximum": _numeric(lambda v, a: v <= a),
+    "exclusiveMinimum": _numeric(lambda v, a: v > a),
+    "exclusiveMaximum": _numeric(lambda v, a: v < a),
+    "multipleOf": _kw_multiple_of,
+    "minLength": _sized(str, lambda n, a: n >= a),
+    "maxLength": _sized(str, lambda n, a: n <= a),
+    "minItems": _sized(list, lambda n, a: n >= a),
+    "maxItems": _sized(list, lambda n, a: n <= a),
+    "minProperties": _sized(dict, lambda n, a: n >= a),
+    "maxProperties": _sized(dict, lambda n, a: n <= a),
+}
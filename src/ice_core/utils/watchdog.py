@@ -0,0 +1,403 @@
+"""Event-loop lag watchdog (dependency-free).
+
+Blocking work on the event loop (file locks, SQLite queries, model inference,
+template rendering …) stalls *every* running workflow.  :class:`LoopWatchdog`
+schedules a heartbeat on the loop and measures how late it fires; when the
+lag exceeds *threshold* the stall is recorded as a :class:`BlockEvent`,
+logged and aggregated in :meth:`LoopWatchdog.metrics`.
+
+Attribution: a monitor thread notices an overdue heartbeat *while* the loop
+is still blocked and captures the loop thread's stack plus the
+:class:`ExecutionScope` of the running task.  Scopes are declared by the
+orchestrator around node execution via :func:`execution_scope`; tasks
+spawned inside a scope inherit it while a watchdog is running.  Without a
+running watchdog scopes are a shared no-op, so the hot path pays nothing.
+
+Opt-in at runtime with ``ICE_LOOP_WATCHDOG_MS=<threshold>`` (see
+:func:`watchdog_from_env`), or guard a test / benchmark with
+:func:`assert_no_blocking`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import (
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+    nullcontext,
+)
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+__all__: list[str] = [
+    "BlockEvent",
+    "ExecutionScope",
+    "LoopBlockedError",
+    "LoopWatchdog",
+    "assert_no_blocking",
+    "execution_scope",
+    "watchdog_from_env",
+]
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Attribution -----------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ExecutionScope:
+    """What the orchestrator is running on behalf of the current task."""
+
+    node_id: str
+    node_type: str = ""
+    skill: Optional[str] = None
+    chain_id: Optional[str] = None
+
+
+_SCOPE: ContextVar[Optional[ExecutionScope]] = ContextVar(
+    "ice_execution_scope", default=None
+)
+# Context variables of another thread's task cannot be read, so the monitor
+# thread looks scopes up by task instead.
+_TASK_SCOPES: "weakref.WeakKeyDictionary[asyncio.Task[Any], ExecutionScope]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Running watchdogs; scopes are only tracked while this is non-zero.
+_WATCHERS = 0
+_WATCHERS_LOCK = threading.Lock()
+_NO_SCOPE: "AbstractContextManager[Optional[ExecutionScope]]" = nullcontext()
+
+
+def _current_task() -> Optional["asyncio.Task[Any]"]:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:  # no running loop
+        return None
+
+
+def execution_scope(
+    node_id: str,
+    *,
+    node_type: str = "",
+    skill: Optional[str] = None,
+    chain_id: Optional[str] = None,
+) -> "AbstractContextManager[Optional[ExecutionScope]]":
+    """Attribute loop stalls inside the block to *node_id* / *skill*.
+
+    Returns a shared no-op context (yielding ``None``) while no watchdog is
+    running; blocks entered before a watchdog starts stay unattributed.
+    """
+
+    if not _WATCHERS:
+        return _NO_SCOPE
+    return _scoped(ExecutionScope(node_id, node_type, skill, chain_id))
+
+
+@contextmanager
+def _scoped(scope: ExecutionScope) -> Iterator[ExecutionScope]:
+    token = _SCOPE.set(scope)
+    task = _current_task()
+    previous = _TASK_SCOPES.get(task) if task is not None else None
+    if task is not None:
+        _TASK_SCOPES[task] = scope
+    try:
+        yield scope
+    finally:
+        _SCOPE.reset(token)
+        if task is not None:
+            if previous is None:
+                _TASK_SCOPES.pop(task, None)
+            else:
+                _TASK_SCOPES[task] = previous
+
+
+# ---------------------------------------------------------------------------
+# Watchdog --------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BlockEvent:
+    """One stall of the event loop longer than the watchdog threshold."""
+
+    duration_ms: float
+    node_id: Optional[str] = None
+    node_type: Optional[str] = None
+    skill: Optional[str] = None
+    chain_id: Optional[str] = None
+    task: Optional[str] = None
+    stack: Tuple[str, ...] = ()
+
+    def describe(self) -> str:
+        where = self.stack[-1] if self.stack else "unknown location"
+        who = f"node={self.node_id or '-'} skill={self.skill or '-'}"
+        return f"{self.duration_ms:.1f} ms {who} at {where}"
+
+
+class LoopBlockedError(AssertionError):
+    """Raised by :func:`assert_no_blocking` when the loop exceeded its budget."""
+
+    def __init__(self, budget_ms: float, events: list[BlockEvent]) -> None:
+        self.budget_ms = budget_ms
+        self.events = events
+        lines = "\n".join(f"  {e.describe()}" for e in events)
+        super().__init__(
+            f"Event loop blocked longer than {budget_ms:.0f} ms "
+            f"{len(events)} time(s):\n{lines}"
+        )
+
+
+class LoopWatchdog:
+    """Measure event-loop lag and attribute stalls to the running node.
+
+    Args:
+        threshold: Lag in seconds above which a stall is reported.
+        interval: Heartbeat period in seconds.
+        on_block: Optional callback invoked (on the loop) for every event.
+        log: Emit a ``WARNING`` log record per event.
+        max_events: Number of recent events kept in :attr:`events`.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        *,
+        interval: float = 0.01,
+        on_block: Optional[Callable[[BlockEvent], None]] = None,
+        log: bool = True,
+        max_events: int = 256,
+    ) -> None:
+        self.threshold = threshold
+        self.interval = interval
+        self.on_block = on_block
+        self.log = log
+        self.events: Deque[BlockEvent] = deque(maxlen=max_events)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_id: Optional[int] = None
+        self._monitor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._expected = 0.0
+        self._captured: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._prev_factory: Any = None
+
+        self._beats = 0
+        self._max_lag = 0.0
+        self._by_scope: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    # ------------------------------------------------------------------
+    # Lifecycle -----------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start watching the *running* loop (call from the loop thread)."""
+
+        global _WATCHERS  # pylint: disable=global-statement
+        self._loop = loop = asyncio.get_running_loop()
+        with _WATCHERS_LOCK:
+            _WATCHERS += 1
+        self._thread_id = threading.get_ident()
+        self._prev_factory = loop.get_task_factory()
+        loop.set_task_factory(self._task_factory)
+        self._stop.clear()
+        self._schedule()
+        self._monitor = threading.Thread(
+            target=self._watch, name="ice-loop-watchdog", daemon=True
+        )
+        self._monitor.start()
+
+    def stop(self) -> None:
+        """Stop watching; a stall still in progress at this point is recorded."""
+
+        global _WATCHERS  # pylint: disable=global-statement
+        if self._loop is None:
+            return
+        with _WATCHERS_LOCK:
+            _WATCHERS -= 1
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._check(time.perf_counter())
+        if self._loop.get_task_factory() == self._task_factory:
+            self._loop.set_task_factory(self._prev_factory)
+        self._loop = None
+
+    async def __aenter__(self) -> "LoopWatchdog":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Metrics -------------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        """Aggregated counters, keyed ``"<node_id>/<skill>"`` per scope."""
+
+        return {
+            "threshold_ms": self.threshold * 1e3,
+            "heartbeats": self._beats,
+            "blocks": sum(int(s["count"]) for s in self._by_scope.values()),
+            "max_lag_ms": self._max_lag * 1e3,
+            "by_scope": {
+                f"{node}/{skill}": dict(stats)
+                for (node, skill), stats in self._by_scope.items()
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # Loop thread ---------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def _schedule(self) -> None:
+        assert self._loop is not None
+        self._expected = time.perf_counter() + self.interval
+        self._handle = self._loop.call_later(self.interval, self._beat)
+
+    def _beat(self) -> None:
+        self._beats += 1
+        self._check(time.perf_counter())
+        if not self._stop.is_set():
+            self._schedule()
+
+    def _check(self, now: float) -> None:
+        lag = max(0.0, now - self._expected)
+        self._max_lag = max(self._max_lag, lag)
+        captured, self._captured = self._captured, None
+        if lag <= self.threshold:
+            return
+        info = captured[1] if captured else {}
+        self._record(BlockEvent(duration_ms=lag * 1e3, **info))
+        # A stall can span a stop() or a missed beat – never report it twice.
+        self._expected = now
+
+    def _record(self, event: BlockEvent) -> None:
+        self.events.append(event)
+        key = (event.node_id or "-", event.skill or "-")
+        stats = self._by_scope.setdefault(
+            key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        stats["count"] += 1
+        stats["total_ms"] += event.duration_ms
+        stats["max_ms"] = max(stats["max_ms"], event.duration_ms)
+        if self.log:
+            logger.warning(
+                "Event loop blocked for %s",
+                event.describe(),
+                extra={"loop_block": asdict(event)},
+            )
+        if self.on_block is not None:
+            self.on_block(event)
+
+    def _task_factory(
+        self, loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any
+    ) -> "asyncio.Future[Any]":
+        if self._prev_factory is not None:
+            task = self._prev_factory(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        scope = _SCOPE.get()
+        if scope is not None:
+            _TASK_SCOPES[task] = scope
+        return task
+
+    # ------------------------------------------------------------------
+    # Monitor thread ------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def _watch(self) -> None:
+        loop, tid = self._loop, self._thread_id
+        poll = min(self.interval, self.threshold / 4)
+        while not self._stop.wait(poll):
+            expected = self._expected
+            if time.perf_counter() - expected <= self.threshold:
+                continue
+            if self._captured is not None and self._captured[0] == expected:
+                continue  # already captured this stall
+            task = asyncio.current_task(loop) if loop is not None else None
+            scope = _TASK_SCOPES.get(task) if task is not None else None
+            info: Dict[str, Any] = {
+                "task": task.get_name() if task is not None else None,
+                "stack": _stack(sys._current_frames().get(tid or 0)),
+            }
+            if scope is not None:
+                info.update(asdict(scope))
+            self._captured = (expected, info)
+
+
+def _stack(frame: Any, depth: int = 8) -> Tuple[str, ...]:
+    lines = []
+    while frame is not None and len(lines) < depth:
+        code = frame.f_code
+        name = getattr(code, "co_qualname", code.co_name)
+        lines.append(f"{name} ({code.co_filename}:{frame.f_lineno})")
+        frame = frame.f_back
+    return tuple(reversed(lines))
+
+
+# ---------------------------------------------------------------------------
+# Helpers ---------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+@asynccontextmanager
+async def assert_no_blocking(
+    budget_ms: float = 50.0, *, interval_ms: float = 5.0
+) -> AsyncIterator[LoopWatchdog]:
+    """Fail with :class:`LoopBlockedError` if the block stalls the loop.
+
+    Example::
+
+        async with assert_no_blocking(budget_ms=20):
+            await workflow.execute()
+    """
+
+    watchdog = LoopWatchdog(budget_ms / 1e3, interval=interval_ms / 1e3, log=False)
+    async with watchdog:
+        yield watchdog
+    if watchdog.events:
+        raise LoopBlockedError(budget_ms, list(watchdog.events))
+
+
+def watchdog_from_env() -> Optional[LoopWatchdog]:
+    """Return a watchdog when ``ICE_LOOP_WATCHDOG_MS`` is a positive number."""
+
+    raw = os.getenv("ICE_LOOP_WATCHDOG_MS", "").strip()
+    try:
+        threshold_ms = float(raw) if raw else 0.0
+    except ValueError:
+        logger.warning("Ignoring invalid ICE_LOOP_WATCHDOG_MS=%r", raw)
+        return None
+    if threshold_ms <= 0:
+        return None
+    return LoopWatchdog(threshold_ms / 1e3)
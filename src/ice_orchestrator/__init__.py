@@ -1,37 +1,88 @@
 """Ice Orchestrator package.
 
 This package provides workflow orchestration capabilities for iceOS.
+
+Public names are resolved lazily (PEP 562) so that importing a submodule such
+as ``ice_orchestrator.graph`` does not pull in the whole execution stack.
 """
 
-# ruff: noqa: E402
+from __future__ import annotations
 
-# Prefer BaseWorkflow
-from ice_orchestrator.base_workflow import BaseWorkflow, FailurePolicy  # type: ignore
-from ice_orchestrator.workflow_execution_context import WorkflowExecutionContext
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
-# Public contract facade (optional) ------------------------------------------
-try:
+if TYPE_CHECKING:  # pragma: no cover – static analysers see eager imports
+    from ice_orchestrator.base_workflow import BaseWorkflow, FailurePolicy
     from ice_orchestrator.contracts.mvp_contract import MVPContract
-except ModuleNotFoundError:  # pragma: no cover – optional component missing
+    from ice_orchestrator.workflow_execution_context import (
+        WorkflowExecutionContext,
+    )
+
+    from .core.chain_registry import get_chain, list_chains, register_chain
+    from .core.network_factory import NetworkFactory
+    from .errors.chain_errors import ScriptChainError as ChainError
+    from .graph.dependency_graph import DependencyGraph
+    from .workflow import Workflow
+
+# public name -> (defining submodule, attribute)
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    # Prefer BaseWorkflow
+    "BaseWorkflow": (".base_workflow", "BaseWorkflow"),
+    "FailurePolicy": (".base_workflow", "FailurePolicy"),
+    "WorkflowExecutionContext": (
+        ".workflow_execution_context",
+        "WorkflowExecutionContext",
+    ),
+    # Public contract facade (optional)
+    "MVPContract": (".contracts.mvp_contract", "MVPContract"),
+    # New exports
+    "get_chain": (".core.chain_registry", "get_chain"),
+    "list_chains": (".core.chain_registry", "list_chains"),
+    "register_chain": (".core.chain_registry", "register_chain"),
+    "NetworkFactory": (".core.network_factory", "NetworkFactory"),
+    "ChainError": (".errors.chain_errors", "ScriptChainError"),
+    "DependencyGraph": (".graph.dependency_graph", "DependencyGraph"),
+    # existing exports
+    "Workflow": (".workflow", "Workflow"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    entry = _LAZY_EXPORTS.get(name)
+    if entry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_path, attr = entry
+    try:
+        value = getattr(import_module(module_path, __name__), attr)
+    except ModuleNotFoundError:  # pragma: no cover – optional component missing
+        if name != "MVPContract":
+            raise
+
+        class MVPContract:  # type: ignore[no-redef]
+            """Placeholder when *contracts* submodule is absent."""
+
+            pass
+
+        MVPContract.__qualname__ = "MVPContract"
+        value = MVPContract
+    globals()[name] = value  # cache – later lookups bypass __getattr__
+    return value
+
 
-    class MVPContract:  # type: ignore
-        """Placeholder when *contracts* submodule is absent."""
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-        pass
 
+def _workflow_proto() -> Any:
+    from .workflow import Workflow
 
-# New exports ---------------------------------------------------------------
-from .core.chain_registry import get_chain, list_chains, register_chain
-from .core.network_factory import NetworkFactory
-from .errors.chain_errors import ScriptChainError as ChainError
-from .graph.dependency_graph import DependencyGraph
+    return Workflow
 
-# existing exports
-from .workflow import Workflow
 
 # ---------------------------------------------------------------------------
 # Runtime registration so lower layers can obtain the concrete implementation
-# via ServiceLocator without violating layer boundaries.
+# via ServiceLocator without violating layer boundaries.  The binding is lazy:
+# *Workflow* is only imported once the SDK first asks for it.
 # ---------------------------------------------------------------------------
 
 try:
@@ -39,7 +90,7 @@ try:
     # imported yet, so we guard against ImportError to avoid circular issues.
     from ice_sdk.services.locator import ServiceLocator
 
-    ServiceLocator.register("workflow_proto", Workflow)  # type: ignore[arg-type]
+    ServiceLocator.register_lazy("workflow_proto", _workflow_proto)
 except Exception:  # pragma: no cover – defensive: ignore if locator unavailable
     pass
 
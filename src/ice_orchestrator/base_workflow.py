@@ -64,10 +64,14 @@ class BaseWorkflow(ABC):
 
         if context_manager is None:
             try:
-                context_manager = ServiceLocator.get("context_manager")
+                shared_manager = ServiceLocator.get("context_manager")
             except KeyError:
-                context_manager = GraphContextManager()
-                ServiceLocator.register("context_manager", context_manager)
+                shared_manager = GraphContextManager()
+                ServiceLocator.register("context_manager", shared_manager)
+            # The process-wide manager only supplies registries; each workflow
+            # runs on its own child so concurrent runs cannot clobber the
+            # execution context or node outputs of one another.
+            context_manager = shared_manager.fork()
 
         self.context_manager = _cast(GraphContextManager, context_manager)
         self.max_parallel = max_parallel
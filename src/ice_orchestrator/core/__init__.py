@@ -1,3 +1,10 @@
 from .chain_factory import ChainFactory
+from .plan_cache import PlanCache, WorkflowPlan, build_plan, global_plan_cache
 
-__all__ = ["ChainFactory"]
+__all__ = [
+    "ChainFactory",
+    "PlanCache",
+    "WorkflowPlan",
+    "build_plan",
+    "global_plan_cache",
+]
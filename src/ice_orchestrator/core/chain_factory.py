@@ -39,6 +39,26 @@ class ChainFactory:  # – internal utility
         if not nodes_raw:
             raise ValueError("Workflow payload must contain 'nodes' key")
 
+        import hashlib
+        import json
+
+        from ice_core.utils.hashing import topology_hash as _topology_hash
+
+        from .plan_cache import global_plan_cache
+
+        # Compiled plans are keyed by id/version + topology hash (+ a digest
+        # of the specs so edits under the same id/version are picked up).
+        topology_hash = _topology_hash(
+            {nd.get("id"): nd.get("dependencies") or [] for nd in nodes_raw}
+        )
+        spec_digest = hashlib.sha256(
+            json.dumps(nodes_raw, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        plan_id = payload.get("blueprint_id") or payload.get("chain_id") or ""
+        plan_key = f"{plan_id}:{current_version}:{topology_hash}:{spec_digest[:16]}"
+        plan_cache = global_plan_cache()
+        plan = plan_cache.get(plan_key)
+
         # Discriminated union parsing (manual to avoid Annotated typing issues)
         from pydantic import BaseModel
 
@@ -63,7 +83,10 @@ class ChainFactory:  # – internal utility
             | ConditionNodeConfig
             | NestedChainConfig
         ] = []
-        for nd in nodes_raw:
+        if plan is not None:
+            # Cache hit – reuse the already validated node configs.
+            nodes = list(plan.nodes)  # type: ignore[arg-type]
+        for nd in nodes_raw if plan is None else ():
             node_type = nd.get("type")
             parser_cls = _parser_map.get(node_type)
             if parser_cls is None:
@@ -80,24 +103,18 @@ class ChainFactory:  # – internal utility
             )
 
         # 3. Instantiate chain -------------------------------------------
-        import hashlib
-        import json
-
         from ice_core.models.node_models import ChainMetadata
 
         # Local import to avoid circular import at module load time
         from ice_orchestrator.workflow import Workflow
 
-        # Compute basic DAG statistics & topology hash ------------------
+        if plan is None:
+            plan = plan_cache.get_or_build(plan_key, nodes)
+
+        # Compute basic DAG statistics ----------------------------------
         node_count = len(nodes)
         edge_count = sum(len(getattr(n, "dependencies", [])) for n in nodes)
 
-        # Deterministic hash of adjacency list (node id -> sorted deps)
-        adjacency = {n.id: sorted(getattr(n, "dependencies", [])) for n in nodes}
-        topology_hash = hashlib.sha256(
-            json.dumps(adjacency, sort_keys=True).encode()
-        ).hexdigest()
-
         chain_meta = ChainMetadata(
             chain_id=payload.get("chain_id", f"chain_{topology_hash[:8]}"),
             name=payload.get("name", "unnamed-chain"),
@@ -109,8 +126,8 @@ class ChainFactory:  # – internal utility
             tags=payload.get("tags", []),
         )
 
-        chain = Workflow(
-            nodes=nodes,
+        chain = Workflow.from_plan(
+            plan,
             name=payload.get("name"),
             version=payload.get("version", target_version),
             **kwargs,
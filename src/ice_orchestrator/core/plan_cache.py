@@ -0,0 +1,126 @@
+"""Compiled execution plans shared across runs of the same workflow.
+
+Constructing a :class:`~ice_orchestrator.workflow.Workflow` validates the
+dependency graph (cycle detection, schema alignment, tool access), assigns
+levels and compiles output validators.  None of that depends on run inputs, so
+:class:`WorkflowPlan` captures it once and :func:`global_plan_cache` keeps
+plans keyed by blueprint id/version plus topology hash.  A new run only
+allocates its per-run mutable state::
+
+    plan = global_plan_cache().get_or_build(key, nodes)
+    workflow = Workflow.from_plan(plan, name="checkout")
+
+Cached node configs are shared between runs and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from ice_core.cache import LRUCache
+from ice_core.utils.hashing import topology_hash
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ice_core.models import NodeConfig
+    from ice_orchestrator.graph.dependency_graph import DependencyGraph
+    from ice_orchestrator.validation import SchemaValidator
+
+__all__: list[str] = [
+    "WorkflowPlan",
+    "PlanCache",
+    "build_plan",
+    "global_plan_cache",
+    "node_topology_hash",
+]
+
+
+@dataclass(frozen=True)
+class WorkflowPlan:
+    """Immutable, run-independent part of a workflow."""
+
+    nodes: Tuple["NodeConfig", ...]
+    graph: "DependencyGraph"
+    levels: Dict[int, List[str]]
+    schema_validator: "SchemaValidator"
+    topology_hash: str
+    key: Optional[str] = None
+
+
+def node_topology_hash(nodes: Sequence[Any]) -> str:
+    """Return the topology hash for parsed node configs."""
+
+    return topology_hash({n.id: getattr(n, "dependencies", []) for n in nodes})
+
+
+def build_plan(
+    nodes: Sequence["NodeConfig"], *, key: Optional[str] = None
+) -> WorkflowPlan:
+    """Validate *nodes* and compile everything a run can share.
+
+    Performs the same static checks as ``Workflow.__init__`` and
+    ``Workflow.validate`` so a plan is only ever built for a valid workflow.
+    """
+
+    # Local imports – the orchestrator package imports this module eagerly.
+    from ice_orchestrator.base_workflow import FailurePolicy
+    from ice_orchestrator.graph.dependency_graph import DependencyGraph
+    from ice_orchestrator.validation import (
+        ChainValidator,
+        SafetyValidator,
+        SchemaValidator,
+    )
+
+    node_list = list(nodes)
+    SafetyValidator.validate_layer_boundaries()
+    SafetyValidator.validate_node_tool_access(node_list)
+
+    graph = DependencyGraph(node_list)
+    graph.validate_schema_alignment(node_list)
+    levels = graph.get_level_nodes()
+    ChainValidator(
+        FailurePolicy.CONTINUE_POSSIBLE, levels, {n.id: n for n in node_list}
+    ).validate_chain()
+
+    return WorkflowPlan(
+        nodes=tuple(node_list),
+        graph=graph,
+        levels=levels,
+        schema_validator=SchemaValidator(node_list),
+        topology_hash=node_topology_hash(node_list),
+        key=key,
+    )
+
+
+class PlanCache:
+    """Bounded LRU of :class:`WorkflowPlan` objects."""
+
+    def __init__(self, capacity: int = 256) -> None:
+        self._plans = LRUCache(capacity=capacity)
+
+    def get(self, key: str) -> Optional[WorkflowPlan]:
+        return self._plans.get(key)  # type: ignore[no-any-return]
+
+    def get_or_build(self, key: str, nodes: Sequence["NodeConfig"]) -> WorkflowPlan:
+        """Return the cached plan for *key*, compiling it from *nodes* on miss."""
+
+        plan = self.get(key)
+        if plan is None:
+            plan = build_plan(nodes, key=key)
+            self._plans.set(key, plan)
+        return plan
+
+    def clear(self) -> None:
+        self._plans.clear()
+
+
+_global_plan_cache: Optional[PlanCache] = None
+
+
+def global_plan_cache() -> PlanCache:
+    """Return the process-wide plan cache."""
+
+    global _global_plan_cache  # pylint: disable=global-statement
+    if _global_plan_cache is None:
+        _global_plan_cache = PlanCache()
+    return _global_plan_cache
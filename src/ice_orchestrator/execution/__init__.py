@@ -2,10 +2,13 @@
 
 from .agent_factory import AgentFactory
 from .executor import NodeExecutor
-from .metrics import ChainMetrics
+from .metrics import PHASES, ChainMetrics, Histogram, NodeTimer
 
 __all__ = [
     "ChainMetrics",
+    "Histogram",
+    "NodeTimer",
+    "PHASES",
     "NodeExecutor",
     "AgentFactory",
 ]
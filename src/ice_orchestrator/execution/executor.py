@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
+from time import perf_counter
 
 # ---------------------------------------------------------------------------
 # Local type alias to satisfy static analysis on forward reference annotations.
@@ -11,7 +12,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Any as _Any
-from typing import Dict, cast
+from typing import Dict, List, cast
 
 import structlog
 from opentelemetry import trace  # type: ignore[import-not-found]
@@ -20,6 +21,9 @@ from opentelemetry.trace import Status, StatusCode  # type: ignore[import-not-fo
 # Import globally to avoid local shadowing errors
 from ice_core.models import NodeConfig, NodeExecutionResult
 from ice_core.models.node_models import NodeMetadata
+from ice_core.utils.blobs import BlobRef, materialize, offload
+from ice_core.utils.deadline import DeadlineExceeded, deadline_scope, expired, remaining
+from ice_core.utils.watchdog import execution_scope
 
 # ---------------------------------------------------------------------------
 # Ensure built-in node executors are registered *before* any workflow runs.
@@ -30,6 +34,7 @@ from ice_orchestrator.execution.executors import (
     builtin as _exec_builtin,  # type: ignore
 )
 from ice_orchestrator.execution.executors import condition as _exec_cond  # type: ignore
+from ice_orchestrator.execution.metrics import NULL_TIMER, NodeTimer
 from ice_orchestrator.providers.budget_enforcer import BudgetEnforcer
 from ice_sdk.registry.node import get_executor
 
@@ -60,12 +65,24 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
     # ------------------------------------------------------------------
 
     async def execute_node(
-        self, node_id: str, input_data: Dict[str, Any]
+        self,
+        node_id: str,
+        input_data: Dict[str, Any],
+        *,
+        timer: NodeTimer | None = None,
     ) -> "NodeExecutionResult":
         """Delegate execution to the node registry while preserving all original
-        orchestration semantics (cache, retries, validation, etc.)."""
+        orchestration semantics (cache, retries, validation, etc.).
+
+        Phase timings are accumulated on *timer* (which may already hold the
+        caller's ``queue_wait`` / ``context_build``), stamped on the result's
+        metadata and exported as ``timing.*_ms`` attributes of the
+        ``node.execute`` span.  Without a timer nothing is timed.
+        """
 
         chain = self.chain  # local alias for brevity
+        timer = timer if timer is not None else NULL_TIMER
+        started_at = datetime.utcnow()
         emit = getattr(chain, "_emit_event", None)
         if callable(emit):
             emit(
@@ -89,7 +106,7 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                 node_type=str(getattr(node, "type", "")),
                 name=getattr(node, "name", None),
                 version="1.0.0",
-                start_time=datetime.utcnow(),
+                start_time=started_at,
                 end_time=datetime.utcnow(),
                 duration=0.0,
                 error_type=type(exc).__name__,
@@ -105,17 +122,50 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                 metadata=error_meta,
             )
 
+        with tracer.start_as_current_span(
+            "node.execute",
+            attributes={
+                "node_id": node_id,
+                "node_type": str(getattr(node, "type", "")),
+            },
+        ) as span, execution_scope(
+            node_id,
+            node_type=str(getattr(node, "type", "")),
+            skill=getattr(node, "tool_name", None),
+            chain_id=getattr(chain, "chain_id", None),
+        ):
+            result = await self._run_attempts(node_id, node, input_data, timer)
+            if timer.enabled:
+                self._stamp_timings(result, timer, started_at)
+                if span.is_recording():
+                    span.set_attributes(timer.span_attributes())
+        return result
+
+    async def _run_attempts(
+        self,
+        node_id: str,
+        node: NodeConfig,
+        input_data: Dict[str, Any],
+        timer: NodeTimer,
+    ) -> "NodeExecutionResult":
+        """Persist inputs, then run the node with cache lookup and retries."""
+
+        chain = self.chain
+
         # --------------------------------------------------------------
         # Persist *input_data* to the context store --------------------
         # --------------------------------------------------------------
+        # Phases are timed inline (``lap``) – no context managers on this path.
+        start = perf_counter()
         _ctx_cur = chain.context_manager.get_context()
         exec_id = _ctx_cur.execution_id if _ctx_cur is not None else None
 
         chain.context_manager.update_node_context(
             node_id=node_id,
-            content=input_data,
+            content=self._persistable(input_data),
             execution_id=exec_id,
         )
+        timer.lap("persist", start)
 
         max_retries: int = int(getattr(node, "retries", 0))
         base_backoff: float = float(getattr(node, "backoff_seconds", 0.0))
@@ -130,6 +180,7 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                 # --------------------------------------------------
                 cache_key: str | None = None
                 if chain.use_cache and getattr(node, "use_cache", True):
+                    start = perf_counter()
                     try:
                         from pydantic import BaseModel  # local import
 
@@ -146,118 +197,62 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                         serialized = json.dumps(payload, sort_keys=True, default=str)
                         cache_key = hashlib.sha256(serialized.encode()).hexdigest()
                         cached = chain._cache.get(cache_key)
-                        if cached is not None:
-                            return cast(NodeExecutionResult, cached)
                     except Exception:  # – never fail due to cache
                         cache_key = None
+                        cached = None
+                    timer.lap("cache_lookup", start)
+                    if cached is not None:
+                        # Cached objects are shared – timings are stamped on
+                        # copies.
+                        return self._own_metadata(
+                            cast(NodeExecutionResult, cached).model_copy()
+                        )
 
                 # --------------------------------------------------
                 # Dispatch to executor -----------------------------
                 # --------------------------------------------------
                 executor = get_executor(str(getattr(node, "type", "")))  # type: ignore[arg-type]
 
-                with tracer.start_as_current_span(
-                    "node.execute",
-                    attributes={
-                        "node_id": node_id,
-                        "node_type": str(getattr(node, "type", "")),
-                    },
-                ):
-                    # MyPy may not recognise that *executor* is an async callable – cast for clarity.
-
-                    result_raw = await executor(chain, node, input_data)
-
-                    # If the executor already returned a fully-formed
-                    # NodeExecutionResult, we can short-circuit all further
-                    # post-processing.  This avoids serialisation issues when
-                    # trying to treat the rich object as plain JSON.
-                    from ice_core.models import (
-                        NodeExecutionResult as _NER,  # local import
+                # MyPy may not recognise that *executor* is an async callable – cast for clarity.
+                start = perf_counter()
+                try:
+                    result_raw = await self._dispatch(
+                        executor, node_id, node, input_data
                     )
+                finally:
+                    timer.lap("execute", start)
 
-                    if isinstance(result_raw, _NER):
-                        # Allow budget tracking before returning ----------
-                        if node.type == "ai":
-                            cost = (
-                                getattr(result_raw.usage, "cost", 0.0)
-                                if result_raw.usage
-                                else 0.0
-                            )
-                            self.budget.register_llm_call(cost=cost)
-                        elif node.type == "tool":
-                            self.budget.register_tool_execution()
-
-                        return result_raw
-
-                # --------------------------------------------------
-                # Opportunistic JSON repair ------------------------
-                # --------------------------------------------------
-                if isinstance(result_raw, str) and getattr(node, "output_schema", None):
-                    import re
-
-                    raw = result_raw.strip()
-                    if raw.startswith("```") and raw.endswith("```"):
-                        raw = re.sub(r"^```.*?\n|\n```$", "", raw, count=1, flags=re.S)
-                    try:
-                        repaired = json.loads(raw)
-                        result_raw = repaired  # type: ignore[assignment]
-                    except Exception:
-                        pass  # leave unchanged – validation will handle
-
-                # New coercion layer
-                processed_output = self._coerce_output(node, result_raw)
+                # If the executor already returned a fully-formed
+                # NodeExecutionResult, we can short-circuit all further
+                # post-processing.  This avoids serialisation issues when
+                # trying to treat the rich object as plain JSON.
+                from ice_core.models import NodeExecutionResult as _NER  # local import
 
-                # Store in cache if enabled & succeeded -------------
+                if isinstance(result_raw, _NER):
+                    # Allow budget tracking before returning ----------
+                    if node.type == "ai":
+                        usage = result_raw.usage
+                        self.budget.register_llm_call(
+                            cost=getattr(usage, "cost", 0.0) if usage else 0.0,
+                            calls=getattr(usage, "api_calls", 1) if usage else 1,
+                        )
+                    elif node.type == "tool":
+                        self.budget.register_tool_execution()
 
-                # Emit finished event after successful execution
-                if callable(emit):
-                    emit(
-                        "workflow.nodeFinished",
-                        {
-                            "run_id": getattr(chain, "run_id", None),
-                            "node_id": node_id,
-                            "success": True,
-                        },
-                    )
+                    result_raw.output = self._offload(result_raw.output)
+                    return result_raw
 
-                # ------------------------------------------------------------------
-                # Apply *output_mappings* to make aliased keys available ----------
-                # ------------------------------------------------------------------
-                if (
-                    True  # Always apply mappings if output is not None
-                    and hasattr(node, "output_mappings")
-                    and node.output_mappings
-                ):
-                    from ice_orchestrator.utils.context_builder import ContextBuilder
-
-                    if isinstance(processed_output, dict):
-                        for alias, src_path in node.output_mappings.items():  # type: ignore[attr-defined]
-                            try:
-                                value = ContextBuilder.resolve_nested_path(
-                                    processed_output, src_path
-                                )
-                                # Add type validation
-                                expected_type = (
-                                    next(iter(node.output_schema.values()), None)
-                                    if node.output_schema
-                                    else None
-                                )
-                                if expected_type and not isinstance(
-                                    value, expected_type
-                                ):
-                                    raise TypeError(
-                                        f"Expected {expected_type} for path '{src_path}', got {type(value)}"
-                                    )
-                                processed_output[alias] = value
-                            except Exception:
-                                # Ignore unresolved paths – validation will catch downstream
-                                continue
+                start = perf_counter()
+                processed_output = self._postprocess(node, node_id, result_raw)
+                # Large values travel downstream by reference.
+                stored_output = self._offload(processed_output)
+                timer.lap("postprocess", start)
 
                 # Attach retry metadata -----------------------------
                 if processed_output:  # Only update if output was processed
                     result = NodeExecutionResult(  # type: ignore[call-arg]
                         success=True,
-                        output=processed_output,
+                        output=stored_output,
                         metadata=NodeMetadata(  # type: ignore[call-arg]
                             node_id=node_id,
                             node_type=str(getattr(node, "type", "")),
@@ -275,6 +270,7 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                         chain.persist_intermediate_outputs
                         and processed_output is not None
                     ):
+                        start = perf_counter()
                         # Safe retrieval of *execution_id* from optional context
                         _ctx_latest = chain.context_manager.get_context()
                         latest_exec_id = (
@@ -283,17 +279,17 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
 
                         chain.context_manager.update_node_context(
                             node_id=node_id,
-                            content=processed_output,
+                            content=self._persistable(processed_output),
                             execution_id=latest_exec_id,
                         )
+                        timer.lap("persist", start)
 
                     # Optional output validation ------------------------
                     if chain.validate_outputs and getattr(node, "output_schema", None):
-                        from ice_orchestrator.validation import SchemaValidator
-
-                        if not SchemaValidator().is_output_valid(
-                            node, processed_output
-                        ):
+                        start = perf_counter()
+                        valid = chain._schema_validator.check(node, processed_output)
+                        timer.lap("postprocess", start)
+                        if not valid:
                             result.success = False
                             err_msg = f"Output validation failed for node '{node_id}' against declared schema"
                             result.error = (
@@ -304,10 +300,11 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
 
                     # Add budget tracking
                     if node.type == "ai":
-                        cost = (
-                            getattr(result.usage, "cost", 0.0) if result.usage else 0.0
+                        usage = result.usage
+                        self.budget.register_llm_call(
+                            cost=getattr(usage, "cost", 0.0) if usage else 0.0,
+                            calls=getattr(usage, "api_calls", 1) if usage else 1,
                         )
-                        self.budget.register_llm_call(cost=cost)
                     elif node.type == "tool":
                         self.budget.register_tool_execution()
 
@@ -338,8 +335,15 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                     break
 
                 wait_seconds = base_backoff * (2**attempt) if base_backoff > 0 else 0
+                left = remaining()
+                if left is not None and wait_seconds >= left:
+                    break  # no budget left for another attempt
                 if wait_seconds > 0:
-                    await asyncio.sleep(wait_seconds)
+                    start = perf_counter()
+                    try:
+                        await asyncio.sleep(wait_seconds)
+                    finally:
+                        timer.lap("backoff", start)
 
                 attempt += 1
 
@@ -368,6 +372,178 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
             metadata=error_meta,
         )
 
+    async def _dispatch(
+        self, executor: Any, node_id: str, node: NodeConfig, input_data: Dict[str, Any]
+    ) -> Any:
+        """Run *executor* within the node's ``timeout_seconds`` and the chain deadline.
+
+        The tighter of the two becomes the active deadline for everything the
+        executor awaits (LLM/HTTP calls, nested chains); on expiry the call is
+        cancelled and :class:`DeadlineExceeded` raised.  Blob references in
+        *input_data* are materialised here, right before the executor reads
+        them (only when the run created any).
+        """
+
+        if getattr(self.chain, "_blob_refs", True):
+            input_data = materialize(input_data)
+        timeout = getattr(node, "timeout_seconds", None)
+        if timeout is None:
+            # No node budget – the inherited deadline applies unchanged, so
+            # skip the scope (a generator context manager per node), and
+            # without any deadline the extra coroutine too.
+            if remaining() is None:
+                return await executor(self.chain, node, input_data)
+            return await self._run_bounded(executor, node_id, node, input_data)
+        with deadline_scope(timeout):
+            return await self._run_bounded(executor, node_id, node, input_data)
+
+    async def _run_bounded(
+        self, executor: Any, node_id: str, node: NodeConfig, input_data: Dict[str, Any]
+    ) -> Any:
+        """Await *executor* under the active deadline (if any)."""
+
+        budget = remaining()
+        if budget is None:
+            return await executor(self.chain, node, input_data)
+        if budget <= 0:
+            raise DeadlineExceeded(f"Node '{node_id}' started past its deadline")
+        try:
+            return await asyncio.wait_for(
+                executor(self.chain, node, input_data), budget
+            )
+        except asyncio.TimeoutError as exc:
+            if not expired():
+                raise  # raised by the executor itself, not our deadline
+            raise DeadlineExceeded(
+                f"Node '{node_id}' timed out after {budget:.3f}s"
+            ) from exc
+
+    def _offload(self, output: Any) -> Any:
+        """Swap values above the chain's ``blob_threshold`` for blob refs.
+
+        New references are recorded on the chain's ``_blob_refs`` so the run
+        can release them when it finishes.
+        """
+
+        threshold = int(getattr(self.chain, "blob_threshold", 0) or 0)
+        if threshold <= 0:
+            return output
+        created: List[BlobRef] = []
+        stored = offload(output, threshold=threshold, created=created)
+        if created:
+            refs = getattr(self.chain, "_blob_refs", None)
+            if refs is not None:
+                refs.extend(created)
+        return stored
+
+    def _persistable(self, value: Any) -> Any:
+        """*value* with blob refs materialised, for the context store.
+
+        The store outlives the run, whose blobs are released when it ends –
+        persisted references would dangle.
+        """
+
+        if getattr(self.chain, "_blob_refs", True):
+            return materialize(value)
+        return value
+
+    def _postprocess(self, node: NodeConfig, node_id: str, result_raw: Any) -> Any:
+        """JSON repair, coercion and *output_mappings* for raw executor output."""
+
+        chain = self.chain
+        emit = getattr(chain, "_emit_event", None)
+
+        # --------------------------------------------------
+        # Opportunistic JSON repair ------------------------
+        # --------------------------------------------------
+        if isinstance(result_raw, str) and getattr(node, "output_schema", None):
+            import re
+
+            raw = result_raw.strip()
+            if raw.startswith("```") and raw.endswith("```"):
+                raw = re.sub(r"^```.*?\n|\n```$", "", raw, count=1, flags=re.S)
+            try:
+                repaired = json.loads(raw)
+                result_raw = repaired  # type: ignore[assignment]
+            except Exception:
+                pass  # leave unchanged – validation will handle
+
+        # New coercion layer
+        processed_output = self._coerce_output(node, result_raw)
+
+        # Store in cache if enabled & succeeded -------------
+
+        # Emit finished event after successful execution
+        if callable(emit):
+            emit(
+                "workflow.nodeFinished",
+                {
+                    "run_id": getattr(chain, "run_id", None),
+                    "node_id": node_id,
+                    "success": True,
+                },
+            )
+
+        # ------------------------------------------------------------------
+        # Apply *output_mappings* to make aliased keys available ----------
+        # ------------------------------------------------------------------
+        if (
+            True  # Always apply mappings if output is not None
+            and hasattr(node, "output_mappings")
+            and node.output_mappings
+        ):
+            from ice_orchestrator.utils.context_builder import ContextBuilder
+
+            if isinstance(processed_output, dict):
+                for alias, src_path in node.output_mappings.items():  # type: ignore[attr-defined]
+                    try:
+                        value = ContextBuilder.resolve_nested_path(
+                            processed_output, src_path
+                        )
+                        # Add type validation
+                        expected_type = (
+                            next(iter(node.output_schema.values()), None)
+                            if node.output_schema
+                            else None
+                        )
+                        if expected_type and not isinstance(value, expected_type):
+                            raise TypeError(
+                                f"Expected {expected_type} for path '{src_path}', got {type(value)}"
+                            )
+                        processed_output[alias] = value
+                    except Exception:
+                        # Ignore unresolved paths – validation will catch downstream
+                        continue
+        return processed_output
+
+    @staticmethod
+    def _own_metadata(result: "NodeExecutionResult") -> "NodeExecutionResult":
+        """Give *result* a private metadata copy before timings are stamped."""
+
+        if result.metadata is not None:
+            result.metadata = result.metadata.model_copy()
+        return result
+
+    @staticmethod
+    def _stamp_timings(
+        result: "NodeExecutionResult", timer: NodeTimer, started_at: datetime
+    ) -> None:
+        """Replace placeholder timestamps with the measured run time (timed runs).
+
+        Metadata is updated in place: executors build it per call and cache
+        hits are copied first (see :meth:`_own_metadata`).
+        """
+
+        run_time = timer.run_time
+        meta = result.metadata
+        if meta is not None:
+            meta.start_time = started_at
+            meta.end_time = started_at + timedelta(seconds=run_time)
+            meta.duration = run_time
+            # Per-run timer – shared with ChainMetrics.node_timings, no copy.
+            meta.phase_timings = timer.phases
+        result.execution_time = run_time
+
     def _coerce_output(self, node: NodeConfig, raw_output: Any) -> Any:
         if not node.output_schema:
             return raw_output
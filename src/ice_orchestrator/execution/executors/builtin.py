@@ -143,7 +143,8 @@ async def ai_executor(  # type: ignore[type-var]
             f"Prompt for node '{cfg.id}' contains unresolved placeholders after rendering: {rendered_prompt}"
         )
 
-    cfg.prompt = rendered_prompt  # type: ignore[assignment]
+    # Copy rather than mutate – node configs may be shared via the plan cache.
+    cfg = cfg.model_copy(update={"prompt": rendered_prompt})
 
     agent = _build_agent(chain, cfg)
     ai_output = await agent.execute(ctx)
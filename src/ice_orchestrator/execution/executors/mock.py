@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+"""Network-free ``llm``/``ai`` executor for profiling and benchmarks.
+
+Not registered on import: :func:`install_mock_llm` replaces the builtin
+LLM executors on request (``ice run --mock``, ``ice profile``, the
+benchmark harness).  The prompt is still rendered against the node context
+so template work stays part of the measurement; only the provider
+round-trip is handed to a stand-in :class:`BaseLLMHandler`.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from ice_core.models import LLMOperatorConfig, NodeExecutionResult
+from ice_core.models.node_models import NodeMetadata
+from ice_sdk.models.config import LLMConfig
+from ice_sdk.providers.llm_providers.base_handler import BaseLLMHandler
+from ice_sdk.registry.node import NODE_REGISTRY
+from ice_sdk.utils.prompt_renderer import render_prompt
+
+__all__: list[str] = ["CannedLLMHandler", "install_mock_llm"]
+
+
+class CannedLLMHandler(BaseLLMHandler):
+    """Handler echoing the model and the start of the prompt."""
+
+    async def generate_text(
+        self,
+        llm_config: LLMConfig,
+        prompt: str,
+        context: Dict[str, Any],
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> Tuple[str, Optional[Dict[str, int]], Optional[str]]:
+        await asyncio.sleep(0)
+        return f"[mock {llm_config.model}] {prompt[:80]}", {}, None
+
+
+def install_mock_llm(handler: Optional[BaseLLMHandler] = None) -> None:
+    """Route ``llm``/``ai`` nodes through *handler* (default: canned text).
+
+    The handler receives ``{"node_id": ...}`` as context; its *(text,
+    usage, error)* becomes the node output ``{"text", "usage"}``.
+    """
+
+    # Register the builtins first so they do not overwrite the mock later.
+    import ice_orchestrator.execution.executors  # noqa: F401
+
+    stand_in = handler or CannedLLMHandler()
+
+    async def _mock_llm(chain: Any, cfg: Any, ctx: Dict[str, Any]) -> Any:
+        if not isinstance(cfg, LLMOperatorConfig):
+            raise TypeError("mock llm executor received incompatible cfg type")
+        start = datetime.utcnow()
+        prompt = await render_prompt(cfg.prompt, ctx)
+        provider = str(getattr(cfg.provider, "value", cfg.provider))
+        text, usage, error = await stand_in.generate_text(
+            LLMConfig(provider=provider, model=cfg.model),
+            prompt,
+            {"node_id": cfg.id},
+        )
+        end = datetime.utcnow()
+        return NodeExecutionResult(  # type: ignore[call-arg]
+            success=error is None,
+            error=error,
+            output={"text": text, "usage": usage},
+            metadata=NodeMetadata(
+                node_id=cfg.id,
+                node_type="llm",
+                name=cfg.name,
+                start_time=start,
+                end_time=end,
+            ),
+            execution_time=(end - start).total_seconds(),
+        )
+
+    for mode in ("llm", "ai"):
+        NODE_REGISTRY[mode] = _mock_llm
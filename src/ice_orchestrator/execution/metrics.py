@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # NOTE: To avoid a heavy import chain, we import NodeExecutionResult lazily in update()
 # to keep this utility lightweight and free from orchestrator dependencies at import time.
@@ -11,13 +14,189 @@ if TYPE_CHECKING:
     from ice_core.models.node_models import NodeExecutionResult
 
 
+# ---------------------------------------------------------------------------
+# Per-node phase timings ------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+#: Orchestration phases timed for every node, in execution order.
+#:
+#: * ``queue_wait``    – waiting for a parallelism slot (semaphore)
+#: * ``context_build`` – assembling the node's input context
+#: * ``cache_lookup``  – cache-key hashing and lookup
+#: * ``execute``       – the registered node executor itself
+#: * ``postprocess``   – JSON repair, coercion, output mappings, validation
+#: * ``persist``       – writes to the context store
+#: * ``backoff``       – sleeping between retries
+PHASES: Tuple[str, ...] = (
+    "queue_wait",
+    "context_build",
+    "cache_lookup",
+    "execute",
+    "postprocess",
+    "persist",
+    "backoff",
+)
+
+# Histogram bucket upper bounds in seconds (1-2.5-5 steps, 50µs … 100s)
+_BUCKETS: Tuple[float, ...] = (
+    5e-05, 1e-04, 2.5e-04, 5e-04,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0,
+)  # fmt: skip
+
+
+class NodeTimer:
+    """Accumulate monotonic per-phase durations for one node run.
+
+    Hot paths time phases inline with :meth:`lap`::
+
+        start = time.perf_counter()
+        ...
+        timer.lap("execute", start)
+
+    :meth:`phase` is a convenience for cold paths (it allocates a generator
+    per use).
+    """
+
+    __slots__ = ("phases",)
+
+    #: ``False`` for :data:`NULL_TIMER` – callers skip stamping and recording.
+    enabled = True
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        phases = self.phases
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def lap(self, phase: str, start: float) -> float:
+        """Add the time since *start* to *phase*; return the current clock."""
+
+        now = time.perf_counter()
+        phases = self.phases
+        phases[phase] = phases.get(phase, 0.0) + (now - start)
+        return now
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.lap(phase, start)
+
+    @property
+    def run_time(self) -> float:
+        """Time spent on the node once it held a parallelism slot."""
+
+        phases = self.phases
+        return sum(phases.values()) - phases.get("queue_wait", 0.0)
+
+    def span_attributes(self) -> Dict[str, float]:
+        """Phase timings as OpenTelemetry span attributes (milliseconds)."""
+
+        return {f"timing.{k}_ms": v * 1e3 for k, v in self.phases.items()}
+
+
+class _NullTimer(NodeTimer):
+    """Timer used while phase timings are off: laps read no clock, keep nothing."""
+
+    __slots__ = ()
+    enabled = False
+
+    def add(self, phase: str, seconds: float) -> None:
+        return None
+
+    def lap(self, phase: str, start: float) -> float:
+        return start
+
+
+#: Shared no-op timer for runs without ``node_timings`` (see ``Workflow``).
+NULL_TIMER: NodeTimer = _NullTimer()
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (seconds) with bucket-interpolated quantiles.
+
+    A plain slotted class rather than a model: :meth:`observe` runs several
+    times per node and pydantic attribute assignment is comparatively slow.
+    """
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        # buckets[i] counts observations <= _BUCKETS[i]; the last slot is overflow
+        self.buckets: List[int] = [0] * (len(_BUCKETS) + 1)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self.buckets[bisect_left(_BUCKETS, value)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate the *q*-quantile (0..1) by interpolating within its bucket."""
+
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= target:
+                lower = _BUCKETS[i - 1] if i else 0.0
+                upper = _BUCKETS[i] if i < len(_BUCKETS) else self.max
+                estimate = lower + (upper - lower) * (target - seen) / n
+                return min(estimate, self.max)
+            seen += n
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
 class ChainMetrics(BaseModel):
-    """Metrics for ScriptChain execution (tokens, cost, per-node usage)."""
+    """Metrics for ScriptChain execution (tokens, cost, per-node usage, timings)."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     total_tokens: int = 0
     total_cost: float = 0.0
     node_metrics: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
     subdag_execution_time: float = 0.0
+    # phase -> histogram over every node run of this chain
+    phase_histograms: Dict[str, Histogram] = Field(default_factory=dict)
+    # node_id -> phase -> seconds (latest run of the node)
+    node_timings: Dict[str, Dict[str, float]] = Field(default_factory=dict)
+
+    def record_timings(self, node_id: str, timer: NodeTimer) -> None:
+        """Fold one node run's phase timings into the per-phase histograms."""
+
+        hists = self.phase_histograms
+        for phase, seconds in timer.phases.items():
+            hist = hists.get(phase)
+            if hist is None:
+                hist = hists[phase] = Histogram()
+            hist.observe(seconds)
+        node_hist = hists.get("node_total")
+        if node_hist is None:
+            node_hist = hists["node_total"] = Histogram()
+        node_hist.observe(timer.run_time)
+        # Timers are per run, so the dict is shared (not copied) with the
+        # result's ``metadata.phase_timings``.
+        self.node_timings[node_id] = timer.phases
 
     def update(self, node_id: str, result: "NodeExecutionResult") -> None:
         """Merge *result.usage* stats into cumulative metrics.
@@ -52,6 +231,10 @@ class ChainMetrics(BaseModel):
             "total_cost": self.total_cost,
             "node_metrics": self.node_metrics,
             "subdag_execution_time": self.subdag_execution_time,
+            "phase_timings": {
+                phase: hist.summary() for phase, hist in self.phase_histograms.items()
+            },
+            "node_timings": self.node_timings,
         }
 
 
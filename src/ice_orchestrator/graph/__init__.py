@@ -1,7 +1,14 @@
+from .csr import CSRGraph
 from .dependency_graph import DependencyGraph
+from .failure_tracker import FailureTracker
 from .level_resolver import BranchGatingResolver
+from .topology import Topology, analyze_topology
 
 __all__ = [
+    "CSRGraph",
     "DependencyGraph",
+    "FailureTracker",
     "BranchGatingResolver",
+    "Topology",
+    "analyze_topology",
 ]
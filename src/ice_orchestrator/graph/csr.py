@@ -0,0 +1,161 @@
+"""Compact, immutable CSR adjacency for the orchestrator hot path.
+
+Nodes are addressed by their integer position (declaration order).  The
+predecessor and successor lists of every node live in two flat ``array``
+buffers each (offsets + indices, i.e. *compressed sparse row*), so a query is
+a zero-copy slice instead of a fresh Python list built from a networkx view::
+
+    csr = CSRGraph.from_topology(analyze_topology(ids, deps))
+    for dep in csr.predecessors(csr.index["summarise"]):
+        ...
+
+Root and leaf sets are computed once at construction.  networkx is only
+needed for tooling – see :meth:`CSRGraph.to_networkx`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .topology import Topology
+
+__all__: list[str] = ["CSRGraph"]
+
+
+def _pack(rows: Sequence[Sequence[int]]) -> Tuple[array, array]:
+    offsets = array("l", [0])
+    indices = array("l")
+    for row in rows:
+        indices.extend(row)
+        offsets.append(len(indices))
+    return offsets, indices
+
+
+class CSRGraph:
+    """Immutable integer-indexed DAG with predecessor/successor arrays."""
+
+    __slots__ = (
+        "ids",
+        "index",
+        "roots",
+        "leaves",
+        "root_set",
+        "leaf_set",
+        "_pred_offsets",
+        "_pred_indices",
+        "_succ_offsets",
+        "_succ_indices",
+        "_pred_view",
+        "_succ_view",
+        "_pred_ids",
+        "_succ_ids",
+    )
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        predecessors: Sequence[Sequence[int]],
+        successors: Sequence[Sequence[int]],
+    ) -> None:
+        self.ids: Tuple[str, ...] = tuple(ids)
+        self.index: Dict[str, int] = {node_id: i for i, node_id in enumerate(ids)}
+        self._pred_offsets, self._pred_indices = _pack(predecessors)
+        self._succ_offsets, self._succ_indices = _pack(successors)
+        self._pred_view = memoryview(self._pred_indices)
+        self._succ_view = memoryview(self._succ_indices)
+        # Id-resolved mirrors of the index buffers (shared string refs) so
+        # id-level queries are a single tuple slice.
+        self._pred_ids = tuple(self.ids[i] for i in self._pred_indices)
+        self._succ_ids = tuple(self.ids[i] for i in self._succ_indices)
+
+        po, so = self._pred_offsets, self._succ_offsets
+        n = len(self.ids)
+        # Declaration order is preserved – callers rely on ``leaves[0]``.
+        self.roots: Tuple[str, ...] = tuple(
+            self.ids[i] for i in range(n) if po[i] == po[i + 1]
+        )
+        self.leaves: Tuple[str, ...] = tuple(
+            self.ids[i] for i in range(n) if so[i] == so[i + 1]
+        )
+        self.root_set: FrozenSet[str] = frozenset(self.roots)
+        self.leaf_set: FrozenSet[str] = frozenset(self.leaves)
+
+    # ------------------------------------------------------------------
+    # Construction -------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_topology(cls, topology: "Topology") -> "CSRGraph":
+        return cls(topology.ids, topology.predecessors, topology.successors)
+
+    @classmethod
+    def from_networkx(cls, graph: Any) -> "CSRGraph":
+        """Build from a networkx ``DiGraph`` (node insertion order is kept)."""
+
+        ids = list(graph.nodes())
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        preds = [[index[p] for p in graph.predecessors(n)] for n in ids]
+        succs = [[index[s] for s in graph.successors(n)] for n in ids]
+        return cls(ids, preds, succs)
+
+    def to_networkx(self) -> Any:
+        """Return an equivalent ``networkx.DiGraph`` (tooling only)."""
+
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.ids)
+        graph.add_edges_from(
+            (self.ids[p], node_id)
+            for i, node_id in enumerate(self.ids)
+            for p in self.predecessors(i)
+        )
+        return graph
+
+    # ------------------------------------------------------------------
+    # Queries -------------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._pred_indices)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the integer offset/index buffers."""
+
+        return sum(
+            buf.itemsize * len(buf)
+            for buf in (
+                self._pred_offsets,
+                self._pred_indices,
+                self._succ_offsets,
+                self._succ_indices,
+            )
+        )
+
+    def predecessors(self, i: int) -> memoryview:
+        """Return the predecessor indices of node *i* (zero-copy)."""
+
+        return self._pred_view[self._pred_offsets[i] : self._pred_offsets[i + 1]]
+
+    def successors(self, i: int) -> memoryview:
+        """Return the successor indices of node *i* (zero-copy)."""
+
+        return self._succ_view[self._succ_offsets[i] : self._succ_offsets[i + 1]]
+
+    def predecessor_ids(self, node_id: str) -> Tuple[str, ...]:
+        i = self.index[node_id]
+        return self._pred_ids[self._pred_offsets[i] : self._pred_offsets[i + 1]]
+
+    def successor_ids(self, node_id: str) -> Tuple[str, ...]:
+        i = self.index[node_id]
+        return self._succ_ids[self._succ_offsets[i] : self._succ_offsets[i + 1]]
+
+    def __repr__(self) -> str:
+        return f"<CSRGraph nodes={len(self.ids)} edges={self.edge_count}>"
@@ -1,40 +1,30 @@
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
-import networkx as nx
-
-from ice_orchestrator.errors.chain_errors import CircularDependencyError
+from .csr import CSRGraph
+from .topology import Topology, analyze_topology, node_dependencies
 
 
 class DependencyGraph:
     """
     Handles dependency graph construction, cycle detection, level assignment, and queries for ScriptChain.
+
+    Validation runs in linear time via :func:`analyze_topology`.  Runtime
+    queries are answered from an immutable :class:`CSRGraph`; the networkx
+    view (:attr:`graph`) is only materialised on demand for tooling.
     """
 
     def __init__(self, nodes: List[Any]):
-        self.graph = nx.DiGraph()
         # Mapping of node_id -> topological level (depth) ------------------
         self.node_levels: Dict[str, int] = {}
+        self._nx_graph: Optional[Any] = None
         self._build_graph(nodes)
-        self._assign_levels(nodes)
 
     def _build_graph(self, nodes: List[Any]) -> None:
-        node_ids = {node.id for node in nodes}
-        for node in nodes:
-            self.graph.add_node(node.id, level=0)
-            for dep in getattr(node, "dependencies", []):
-                if dep not in node_ids:
-                    raise ValueError(f"Dependency {dep} not found for node {node.id}")
-                self.graph.add_edge(dep, node.id)
-        # Check for cycles
-        try:
-            cycles = list(nx.simple_cycles(self.graph))
-            if cycles:
-                cycle_str = " -> ".join(cycles[0])
-                raise CircularDependencyError(
-                    f"Circular dependency detected: {cycle_str}"
-                )
-        except nx.NetworkXNoCycle:
-            pass
+        # Single Kahn pass: unknown deps, cycle witness, order and levels.
+        topology = analyze_topology(
+            [node.id for node in nodes], [node_dependencies(n) for n in nodes]
+        )
+        self.csr = CSRGraph.from_topology(topology)
 
         # --------------------------------------------------------------
         # Security & compliance validations ----------------------------
@@ -42,25 +32,24 @@ class DependencyGraph:
         self._validate_no_sensitive_data_flows(nodes)
         self._enforce_airgap_compliance(nodes)
 
-    def _assign_levels(self, nodes: List[Any]) -> None:
-        node_map = {node.id: node for node in nodes}
-        for node_id in nx.topological_sort(self.graph):
-            node = node_map[node_id]
-            node.level = (
-                max(
-                    (
-                        node_map[dep].level
-                        for dep in (
-                            getattr(node, "dependencies", [])
-                            if isinstance(getattr(node, "dependencies", []), list)
-                            else [getattr(node, "dependencies", [])]
-                        )
-                    ),
-                    default=-1,
-                )
-                + 1
-            )
-            self.node_levels[node_id] = node.level
+        self._assign_levels(nodes, topology)
+
+    def _assign_levels(self, nodes: List[Any], topology: Topology) -> None:
+        for idx in topology.order:
+            node = nodes[idx]
+            node.level = topology.levels[idx]
+            self.node_levels[node.id] = node.level
+        self._level_nodes = topology.level_nodes()
+
+    @property
+    def graph(self) -> Any:
+        """networkx ``DiGraph`` view of the dependencies (built lazily)."""
+
+        if self._nx_graph is None:
+            self._nx_graph = self.csr.to_networkx()
+            for node_id, level in self.node_levels.items():
+                self._nx_graph.nodes[node_id]["level"] = level
+        return self._nx_graph
 
     def get_level_nodes(self) -> Dict[int, List[str]]:
         """Return mapping of *level → node_ids*.
@@ -71,18 +60,29 @@ class DependencyGraph:
             {0: ["root"], 1: ["child1", "child2"]}
         """
 
-        levels: Dict[int, List[str]] = {}
-        for node_id, level in self.node_levels.items():
-            if level not in levels:
-                levels[level] = []
-            levels[level].append(node_id)
-        return levels
+        return {level: list(ids) for level, ids in self._level_nodes.items()}
+
+    def remaining_path_lengths(self, cost: Callable[[str], float]) -> Dict[str, float]:
+        """Return the longest *cost*-weighted path from each node to a leaf.
+
+        The node's own cost is included, so roots of the critical path carry
+        the largest value.  Linear in nodes + edges (reverse level order).
+        """
+
+        csr = self.csr
+        lengths = [0.0] * len(csr)
+        for level in sorted(self._level_nodes, reverse=True):
+            for node_id in self._level_nodes[level]:
+                idx = csr.index[node_id]
+                tail = max((lengths[s] for s in csr.successors(idx)), default=0.0)
+                lengths[idx] = cost(node_id) + tail
+        return dict(zip(csr.ids, lengths))
 
     def get_node_dependencies(self, node_id: str) -> List[str]:
-        return list(self.graph.predecessors(node_id))
+        return list(self.csr.predecessor_ids(node_id))
 
     def get_node_dependents(self, node_id: str) -> List[str]:
-        return list(self.graph.successors(node_id))
+        return list(self.csr.successor_ids(node_id))
 
     def get_node_level(self, node_id: str) -> int:
         return self.node_levels[node_id]
@@ -96,10 +96,12 @@ class DependencyGraph:
             ["final"]
         """
 
-        # NetworkX typing stubs treat ``out_degree`` as *Mapping[node, int]* rather than
-        # an iterable of *(node, degree)* tuples.  Avoid the unpacking to satisfy
-        # Pyright by querying degree per node explicitly.
-        return [n for n in self.graph.nodes() if self.graph.out_degree(n) == 0]
+        return list(self.csr.leaves)
+
+    def get_root_nodes(self) -> List[str]:
+        """Return nodes without dependencies (entry points)."""
+
+        return list(self.csr.roots)
 
     def validate_schema_alignment(self, nodes: List[Any]) -> None:
         node_map = {node.id: node for node in nodes}
@@ -161,13 +163,13 @@ class DependencyGraph:
         """Placeholder – Ensure nodes flagged as *contains_sensitive_data*
         do not feed into external calls without explicit approval."""
 
-        for node in nodes:
+        csr = self.csr
+        for idx, node in enumerate(nodes):
             if getattr(node, "contains_sensitive_data", False):
-                for succ in self.get_node_dependents(node.id):
-                    succ_node = next((n for n in nodes if n.id == succ), None)
-                    if succ_node and getattr(succ_node, "requires_external_io", False):
+                for succ_idx in csr.successors(idx):
+                    if getattr(nodes[succ_idx], "requires_external_io", False):
                         raise ValueError(
-                            f"Sensitive data from node '{node.id}' flows into external I/O node '{succ}'."
+                            f"Sensitive data from node '{node.id}' flows into external I/O node '{csr.ids[succ_idx]}'."
                         )
 
     def _enforce_airgap_compliance(self, nodes: List[Any]) -> None:
@@ -190,7 +192,7 @@ class DependencyGraph:
 
     def __repr__(self) -> str:
         return (
-            f"<DependencyGraph nodes={self.graph.number_of_nodes()} "
-            f"edges={self.graph.number_of_edges()} "
+            f"<DependencyGraph nodes={len(self.csr)} "
+            f"edges={self.csr.edge_count} "
             f"levels={len(self.node_levels)}>"
         )
@@ -0,0 +1,85 @@
+"""Structured per-run failure tracking for workflow execution.
+
+Every node is *pending* until its level has run; it then becomes *done* or
+*failed*.  A failure immediately marks every pending descendant *blocked*, so
+the number of nodes that can still run is maintained incrementally and the
+continue/halt decision is a counter check rather than a rescan of all levels.
+Each node changes state at most once, hence the whole run costs O(V + E).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, Optional
+
+__all__: list[str] = ["FailureTracker"]
+
+_PENDING, _DONE, _FAILED, _BLOCKED = 0, 1, 2, 3
+
+
+class FailureTracker:
+    """Track failed and blocked nodes for a single workflow run."""
+
+    def __init__(self, csr: Any) -> None:
+        self._csr = csr
+        self._state = bytearray(len(csr))
+        self._remaining = len(csr)
+        # node_id → error message, in failure order
+        self.failed: Dict[str, Optional[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Mutation helpers --------------------------------------------------
+    # ------------------------------------------------------------------
+
+    def mark_done(self, node_id: str) -> None:
+        """Record that *node_id* ran (or was skipped) without failing."""
+
+        i = self._csr.index[node_id]
+        if self._state[i] == _PENDING:
+            self._state[i] = _DONE
+            self._remaining -= 1
+
+    def mark_failed(self, node_id: str, error: Optional[str] = None) -> None:
+        """Record a failure and block every pending descendant."""
+
+        i = self._csr.index[node_id]
+        state = self._state
+        if state[i] == _FAILED:
+            return
+        if state[i] == _PENDING:
+            self._remaining -= 1
+        state[i] = _FAILED
+        self.failed[node_id] = error
+
+        stack = list(self._csr.successors(i))
+        while stack:
+            j = stack.pop()
+            # Blocked/failed nodes already had their descendants visited.
+            if state[j] != _PENDING:
+                continue
+            state[j] = _BLOCKED
+            self._remaining -= 1
+            stack.extend(self._csr.successors(j))
+
+    # ------------------------------------------------------------------
+    # Query helpers -----------------------------------------------------
+    # ------------------------------------------------------------------
+
+    @property
+    def remaining_runnable(self) -> int:
+        """Number of nodes that have not run and are not blocked."""
+
+        return self._remaining
+
+    @property
+    def has_failures(self) -> bool:
+        return bool(self.failed)
+
+    def is_blocked(self, node_id: str) -> bool:
+        return self._state[self._csr.index[node_id]] == _BLOCKED
+
+    @property
+    def blocked(self) -> FrozenSet[str]:
+        ids = self._csr.ids
+        return frozenset(
+            ids[i] for i, s in enumerate(self._state) if s == _BLOCKED
+        )
@@ -2,11 +2,18 @@
 
 Extracted from the original `ScriptChain._is_node_active` implementation.  The
 behaviour is *identical* but lives in a dedicated, test-friendly module.
+
+A node is inactive when it sits on the branch a condition did *not* take, or
+when any of its (transitive) dependencies is inactive.  Both rules collapse
+into one set of flags: each decision contributes the reachable set (branch
+nodes plus all their descendants) of the untaken branch.  Recording a
+decision marks those nodes in a ``bytearray`` indexed by CSR position, so
+:meth:`is_node_active` is a single O(1) lookup.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Iterable, Mapping, Tuple
 
 from ice_core.models.node_models import ConditionNodeConfig  # avoid heavy import cycles
 
@@ -16,21 +23,32 @@ class BranchGatingResolver:
         # We keep references to the chain's *nodes* mapping and *DependencyGraph*
         self._nodes = nodes
         self._graph = graph
+        self._csr = graph.csr
         # Decision cache keyed by *condition node id* → bool
         self._branch_decisions: Dict[str, bool] = {}
-        # Memoisation cache: node_id → bool (active?)
-        self._active_cache: Dict[str, bool] = {}
+        # (condition id, decision) → CSR indices that decision deactivates
+        self._gate_masks: Dict[Tuple[str, bool], Tuple[int, ...]] = {}
+        # Union of the gated indices of every recorded decision (1 = inactive)
+        self._inactive = bytearray(len(self._csr.ids))
 
     # ------------------------------------------------------------------
     # Mutation helpers --------------------------------------------------
     # ------------------------------------------------------------------
 
     def record_decision(self, condition_node_id: str, decision: bool) -> None:
-        """Persist the runtime outcome of *condition_node_id* and invalidate caches."""
-
-        self._branch_decisions[str(condition_node_id)] = decision
-        # Conservative approach – drop memoisation; will be recomputed lazily
-        self._active_cache.clear()
+        """Persist the runtime outcome of *condition_node_id* and deactivate
+        the untaken branch."""
+
+        cond_id = str(condition_node_id)
+        previous = self._branch_decisions.get(cond_id)
+        self._branch_decisions[cond_id] = decision
+        if previous is None:
+            self._mark_inactive(self._gate_mask(cond_id, decision))
+        elif previous != decision:
+            # A condition re-evaluated differently – rebuild from scratch.
+            self._inactive = bytearray(len(self._csr.ids))
+            for cid, dec in self._branch_decisions.items():
+                self._mark_inactive(self._gate_mask(cid, dec))
 
     # ------------------------------------------------------------------
     # Query helpers -----------------------------------------------------
@@ -39,33 +57,44 @@ class BranchGatingResolver:
     def is_node_active(self, node_id: str) -> bool:  # – helper
         """Return *True* when *node_id* should run given current branch decisions."""
 
-        # 1. Explicit branch gating ------------------------------------
-        for cond_id, decision in self._branch_decisions.items():
-            cond_cfg = self._nodes.get(cond_id)
-            if not isinstance(cond_cfg, ConditionNodeConfig):
-                continue
-
-            if decision and cond_cfg.false_branch and node_id in cond_cfg.false_branch:
-                return False
-            if (
-                not decision
-                and cond_cfg.true_branch
-                and node_id in cond_cfg.true_branch
-            ):
-                return False
+        return not self._inactive[self._csr.index[node_id]]
 
-        # 2. Propagation via dependencies ------------------------------
-        if node_id in self._active_cache:
-            return self._active_cache[node_id]
+    # ------------------------------------------------------------------
+    # Internals ---------------------------------------------------------
+    # ------------------------------------------------------------------
 
-        deps = self._graph.get_node_dependencies(node_id)
-        for dep_id in deps:
-            if not self.is_node_active(dep_id):
-                self._active_cache[node_id] = False
-                return False
+    def _mark_inactive(self, indices: Tuple[int, ...]) -> None:
+        inactive = self._inactive
+        for i in indices:
+            inactive[i] = 1
 
-        self._active_cache[node_id] = True
-        return True
+    def _gate_mask(self, cond_id: str, decision: bool) -> Tuple[int, ...]:
+        key = (cond_id, decision)
+        mask = self._gate_masks.get(key)
+        if mask is None:
+            cond_cfg = self._nodes.get(cond_id)
+            mask = ()
+            if isinstance(cond_cfg, ConditionNodeConfig):
+                untaken = cond_cfg.false_branch if decision else cond_cfg.true_branch
+                mask = self._reachable_mask(untaken or ())
+            self._gate_masks[key] = mask
+        return mask
+
+    def _reachable_mask(self, node_ids: Iterable[str]) -> Tuple[int, ...]:
+        """CSR indices of *node_ids* and every node downstream of them."""
+
+        csr = self._csr
+        stack = [csr.index[nid] for nid in node_ids if nid in csr.index]
+        seen = bytearray(len(csr.ids))
+        reached = []
+        while stack:
+            i = stack.pop()
+            if seen[i]:
+                continue
+            seen[i] = 1
+            reached.append(i)
+            stack.extend(csr.successors(i))
+        return tuple(reached)
 
     # ------------------------------------------------------------------
     # Exposed internals (for B/C) --------------------------------------
@@ -77,4 +106,7 @@ class BranchGatingResolver:
 
     @property
     def active_cache(self) -> Dict[str, bool]:
-        return self._active_cache
+        """Snapshot of node activity derived from the inactive flags."""
+
+        inactive = self._inactive
+        return {node_id: not inactive[i] for i, node_id in enumerate(self._csr.ids)}
@@ -0,0 +1,127 @@
+"""Linear-time topology analysis for workflow DAGs.
+
+:func:`analyze_topology` runs a single Kahn pass over integer-indexed
+adjacency lists.  The same pass yields a topological order *and* the level
+(longest distance from a root) of every node; when the pass stalls, one
+witness cycle is extracted from the leftover nodes in O(V + E).  This replaces
+``networkx.simple_cycles`` which enumerates *every* elementary cycle and can
+grow exponentially with graph size.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from ice_orchestrator.errors.chain_errors import CircularDependencyError
+
+__all__: list[str] = ["Topology", "analyze_topology", "node_dependencies"]
+
+
+@dataclass(frozen=True)
+class Topology:
+    """Integer-indexed view of a DAG produced by :func:`analyze_topology`."""
+
+    ids: Tuple[str, ...]
+    index: Dict[str, int]
+    predecessors: Tuple[Tuple[int, ...], ...]
+    successors: Tuple[Tuple[int, ...], ...]
+    order: Tuple[int, ...]
+    levels: Tuple[int, ...]
+
+    def level_nodes(self) -> Dict[int, List[str]]:
+        """Return ``{level: [node_id, ...]}`` preserving declaration order."""
+
+        grouped: Dict[int, List[str]] = {}
+        for idx, node_id in enumerate(self.ids):
+            grouped.setdefault(self.levels[idx], []).append(node_id)
+        return dict(sorted(grouped.items()))
+
+
+def node_dependencies(node: Any) -> List[str]:
+    """Return *node*'s dependency ids as a list (tolerates scalar values)."""
+
+    deps = getattr(node, "dependencies", None) or []
+    if isinstance(deps, (list, tuple)):
+        return list(deps)
+    return [deps]
+
+
+def analyze_topology(
+    ids: Sequence[str], dependencies: Iterable[Iterable[str]]
+) -> Topology:
+    """Index the graph, order it and assign levels in one pass.
+
+    Args:
+        ids: Node ids in declaration order.
+        dependencies: For each id (same order), the ids it depends on.
+
+    Raises:
+        ValueError: When a dependency references an unknown node.
+        CircularDependencyError: When the graph has a cycle; the message
+            names one witness cycle, e.g. ``a -> b -> c -> a``.
+    """
+
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    n = len(ids)
+    preds: List[Tuple[int, ...]] = []
+    succs: List[List[int]] = [[] for _ in range(n)]
+    for i, deps in enumerate(dependencies):
+        row: List[int] = []
+        for dep in deps:
+            j = index.get(dep)
+            if j is None:
+                raise ValueError(f"Dependency {dep} not found for node {ids[i]}")
+            row.append(j)
+            succs[j].append(i)
+        preds.append(tuple(row))
+
+    indegree = [len(p) for p in preds]
+    levels = [0] * n
+    queue = deque(i for i in range(n) if indegree[i] == 0)
+    order: List[int] = []
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        next_level = levels[i] + 1
+        for j in succs[i]:
+            if levels[j] < next_level:
+                levels[j] = next_level
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                queue.append(j)
+
+    if len(order) < n:
+        cycle = _witness_cycle(preds, indegree)
+        cycle_str = " -> ".join(ids[i] for i in cycle)
+        raise CircularDependencyError(f"Circular dependency detected: {cycle_str}")
+
+    return Topology(
+        ids=tuple(ids),
+        index=index,
+        predecessors=tuple(preds),
+        successors=tuple(tuple(s) for s in succs),
+        order=tuple(order),
+        levels=tuple(levels),
+    )
+
+
+def _witness_cycle(preds: Sequence[Tuple[int, ...]], indegree: List[int]) -> List[int]:
+    """Return one cycle among the nodes Kahn's pass could not release.
+
+    Every leftover node still has a leftover predecessor, so walking
+    predecessors from any of them must revisit a node within ``V`` steps.
+    """
+
+    start = next(i for i, d in enumerate(indegree) if d > 0)
+    seen: Dict[int, int] = {}
+    path: List[int] = []
+    current = start
+    while current not in seen:
+        seen[current] = len(path)
+        path.append(current)
+        current = next(p for p in preds[current] if indegree[p] > 0)
+    # ``path`` follows edges backwards; flip it into dependency order.
+    cycle = path[seen[current] :][::-1]
+    return cycle + [cycle[0]]
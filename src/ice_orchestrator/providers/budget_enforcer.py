@@ -67,8 +67,10 @@ class BudgetEnforcer:  # – runtime helper
         return int(value) if value else default
 
     # --------------------------------------------------------------------- Public API
-    def register_llm_call(self, cost: float = 0.0) -> None:
-        self._llm_calls += 1
+    def register_llm_call(self, cost: float = 0.0, calls: int = 1) -> None:
+        """Account *calls* provider requests (>1 for hedged calls) costing *cost*."""
+
+        self._llm_calls += calls
         self._total_cost += cost
 
         if self._llm_calls > self.max_llm_calls:
@@ -13,6 +13,8 @@ import structlog
 
 from ice_core.models import NodeConfig
 from ice_core.services.contracts import IWorkflowService
+from ice_core.utils.profiling import profile_dir, profile_from_env
+from ice_orchestrator.core.plan_cache import global_plan_cache
 from ice_orchestrator.workflow import Workflow
 from ice_sdk.context import GraphContextManager
 
@@ -28,7 +30,12 @@ class WorkflowService(IWorkflowService):
     """
 
     def __init__(self):
-        """Initialize the workflow service."""
+        """Initialize the workflow service.
+
+        The service-level manager holds shared registries only; every
+        :meth:`execute` call runs on a :meth:`~GraphContextManager.fork` of it
+        so many runs can proceed concurrently on one worker.
+        """
         self._context_manager = GraphContextManager()
 
     async def execute(
@@ -39,6 +46,7 @@ class WorkflowService(IWorkflowService):
         *,
         run_id: str | None = None,
         event_emitter: Any | None = None,
+        plan_key: str | None = None,
     ) -> Dict[str, Any]:
         """Execute a workflow with the given nodes.
 
@@ -46,6 +54,8 @@ class WorkflowService(IWorkflowService):
             nodes: List of NodeConfig objects or compatible dicts
             name: Name of the workflow
             max_parallel: Maximum parallel execution (default: 5)
+            plan_key: Optional blueprint plan key; when given the validated
+                graph is reused from the process-wide plan cache.
 
         Returns:
             Dictionary containing execution results with metrics
@@ -71,12 +81,21 @@ class WorkflowService(IWorkflowService):
                 if event_emitter:
                     event_emitter(event_name, payload)
 
-            workflow = Workflow(
-                nodes=node_configs,
-                name=name,
-                chain_id=run_id,
-                context_manager=self._context_manager,
-            )
+            if plan_key is not None:
+                plan = global_plan_cache().get_or_build(plan_key, node_configs)
+                workflow = Workflow.from_plan(
+                    plan,
+                    name=name,
+                    chain_id=run_id,
+                    context_manager=self._context_manager.fork(),
+                )
+            else:
+                workflow = Workflow(
+                    nodes=node_configs,
+                    name=name,
+                    chain_id=run_id,
+                    context_manager=self._context_manager.fork(),
+                )
 
             # Validate workflow before execution
             if hasattr(workflow, "validate"):
@@ -84,8 +103,18 @@ class WorkflowService(IWorkflowService):
 
             start_time = datetime.utcnow()
 
-            # Execute the workflow
-            result = await workflow.execute()
+            # Execute the workflow – sampled when ``ICE_PROFILE`` is set.  The
+            # profiler sees the whole event loop, so concurrent runs show up
+            # in each other's flamegraphs.
+            profiler = profile_from_env(run_id or name)
+            if profiler is None:
+                result = await workflow.execute()
+            else:
+                async with profiler:
+                    result = await workflow.execute()
+                assert profiler.report is not None
+                paths = [str(p) for p in profiler.report.write(profile_dir())]
+                logger.info("Profile written", workflow_name=name, files=paths)
 
             end_time = datetime.utcnow()
             execution_time = (end_time - start_time).total_seconds()
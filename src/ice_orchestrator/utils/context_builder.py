@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, List
 
+from ice_core.utils.blobs import BlobRef
 from ice_orchestrator.errors.chain_errors import ChainError
 from ice_sdk.exceptions import ErrorCode
 
@@ -83,11 +84,16 @@ class ContextBuilder:  # – utility helper
         Special cases
         -------------
         * ``path in ("", ".")`` → return *data* unchanged.
+        * Blob references are materialised only when the path descends into
+          them; a path ending on a reference returns the reference.
         """
         if not path or path == ".":
             return data
 
         for key in path.split("."):
+            ref = BlobRef.coerce(data)
+            if ref is not None:
+                data = ref.materialize()
             if isinstance(data, dict):
                 data = data[key]
             elif isinstance(data, list):
@@ -6,7 +6,7 @@ inside `script_chain.py`, improving separation of concerns and testability.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Mapping, Set
+from typing import TYPE_CHECKING, List, Mapping, Optional, Set
 
 from structlog import get_logger
 
@@ -16,6 +16,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from ice_core.models.node_models import NodeConfig
     from ice_core.models.script_chain import ChainSpec, ValidationResult
     from ice_orchestrator.base_workflow import FailurePolicy
+    from ice_orchestrator.graph.failure_tracker import FailureTracker
 
 logger = get_logger(__name__)
 
@@ -35,8 +36,15 @@ class ChainValidator:  # – internal utility
     # Runtime continuation logic ---------------------------------------
     # ------------------------------------------------------------------
 
-    def should_continue(self, errors: List[str]) -> bool:
-        """Determine whether chain execution should proceed after *errors*."""
+    def should_continue(
+        self, errors: List[str], failures: Optional["FailureTracker"] = None
+    ) -> bool:
+        """Determine whether chain execution should proceed after *errors*.
+
+        When the run's :class:`FailureTracker` is supplied the
+        CONTINUE_POSSIBLE decision is an O(1) check of its remaining-runnable
+        counter; otherwise node ids are parsed back out of *errors*.
+        """
 
         if not errors:
             return True
@@ -47,6 +55,15 @@ class ChainValidator:  # – internal utility
             return True
 
         # CONTINUE_POSSIBLE logic below ---------------------------------
+        if failures is not None:
+            if failures.remaining_runnable > 0:
+                return True
+            logger.warning(
+                "Chain execution stopping: All remaining nodes depend on failed nodes: %s",
+                set(failures.failed),
+            )
+            return False
+
         failed_nodes: Set[str] = set()
         for error in errors:
             if "Node " in error and " failed:" in error:
@@ -1,89 +1,234 @@
 """Schema validation for ScriptChain node outputs.
 
 Extracted from `ScriptChain._is_output_valid` to improve separation of concerns.
+
+Validators are *compiled* once per node (see :meth:`SchemaValidator.compile`):
+string type names are resolved without ``eval``, dotted paths are pre-split
+and Pydantic ``TypeAdapter`` instances are cached per model, so validating an
+output is a single direct call.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import builtins
+import json
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple
+
+from ice_core.cache import LRUCache
+from ice_core.utils.schema_cache import compile_schema, schema_fingerprint
 
 if TYPE_CHECKING:  # pragma: no cover
     from ice_core.models.node_models import NodeConfig
 
+OutputCheck = Callable[[Any], bool]
 
-class SchemaValidator:  # – internal utility
-    """Validates node outputs against declared schemas."""
+# Compiled dict-schema checks keyed by schema hash ----------------------------
+_CHECK_CACHE = LRUCache(capacity=256)
 
-    @staticmethod
-    def is_output_valid(node: "NodeConfig", output: Any) -> bool:
-        """Validate *output* against ``node.output_schema``.  Returns *True* when
-        validation succeeds or no schema declared.
+_MISSING = object()
+_TYPE_ALIASES: Dict[str, Any] = {
+    "any": object,
+    "none": type(None),
+    "nonetype": type(None),
+    "null": type(None),
+}
 
-        Supports both *dict*-based schemas and Pydantic ``BaseModel`` subclasses to
-        stay in sync with the flexible input validation strategy.
-        """
 
-        schema = getattr(node, "output_schema", None)
-        if not schema:
-            return True
-
-        # --------------------------------------------------------------
-        # Attempt to coerce *str* outputs into JSON when a schema exists
-        # --------------------------------------------------------------
-        # Many LLM calls return raw strings even when the prompt asks for
-        # JSON.  To provide a consistent developer experience, we try to
-        # parse such strings as JSON **once** before any further type
-        # validation.  When parsing fails, the output is considered
-        # invalid for schema-validated nodes so downstream mappings do
-        # not break at runtime.
+def _accept(_output: Any) -> bool:
+    return True
+
+
+def _is_json_schema(schema: Dict[str, Any]) -> bool:
+    """Return *True* for JSON Schema documents (vs ``{path: type}`` maps)."""
+
+    return "$schema" in schema or isinstance(schema.get("properties"), dict)
+
+
+def _resolve_type(expected: Any) -> Any:
+    """Map a declared type to something usable with ``isinstance``.
+
+    Strings such as ``"int"``, ``"list[str]"`` or ``"str | None"`` resolve to
+    builtin types (generic parameters are ignored); anything unresolvable
+    becomes ``object`` so only presence is enforced.
+    """
+
+    if not isinstance(expected, str):
+        try:
+            isinstance(None, expected)
+        except TypeError:  # e.g. subscripted generics
+            return object
+        return expected
+
+    resolved: List[type] = []
+    for part in expected.split("|"):
+        name = re.split(r"[\[\s]", part.strip(), maxsplit=1)[0]
+        name = name.rsplit(".", 1)[-1]  # "typing.Dict" → "Dict"
+        candidate = _TYPE_ALIASES.get(name.lower(), getattr(builtins, name, None))
+        if candidate is None:
+            candidate = getattr(builtins, name.lower(), None)  # Dict → dict
+        if not isinstance(candidate, type) or candidate is object:
+            return object
+        resolved.append(candidate)
+    return resolved[0] if len(resolved) == 1 else tuple(resolved)
+
+
+def _lookup(output: Any, segments: Tuple[str, ...]) -> Any:
+    current = output
+    for segment in segments:
+        if isinstance(current, dict) and segment in current:
+            current = current[segment]
+        elif isinstance(current, list) and segment.isdigit():
+            index = int(segment)
+            if index >= len(current):
+                return _MISSING
+            current = current[index]
+        else:
+            return _MISSING
+    return current
+
+
+def _compile_type_map(schema: Dict[str, Any]) -> OutputCheck:
+    """Compile a ``{dotted.path: type}`` schema into a single predicate."""
+
+    plain: List[Tuple[Tuple[str, ...], Any]] = []
+    wildcard: Dict[str, type] = {}
+    for path, expected in schema.items():
+        resolved = _resolve_type(expected)
+        if "*" in path:
+            wildcard[path] = resolved
+        else:
+            plain.append((tuple(path.split(".")), resolved))
+
+    def _check(output: Any) -> bool:
         if isinstance(output, str):
             try:
-                import json  # local import to avoid startup overhead
+                output = json.loads(output)
+            except json.JSONDecodeError:
+                return False
+        for segments, expected in plain:
+            value = _lookup(output, segments)
+            if value is _MISSING:
+                return False
+            if expected is not object and not isinstance(value, expected):
+                return False
+        if wildcard:
+            from ice_core.utils.nested_validation import validate_nested_output
+
+            return not validate_nested_output(output, wildcard)
+        return True
+
+    return _check
+
+
+@lru_cache(maxsize=256)
+def _adapter_for(model: type) -> Any:
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(model)
+
+
+def _compile_model(model: type) -> OutputCheck:
+    from pydantic import ValidationError
 
+    adapter = _adapter_for(model)
+
+    def _check(output: Any) -> bool:
+        try:
+            if isinstance(output, str):
+                adapter.validate_json(output)
+            else:
+                adapter.validate_python(output)
+        except ValidationError:
+            return False
+        return True
+
+    return _check
+
+
+def _compile_json_schema(schema: Dict[str, Any]) -> OutputCheck:
+    compiled = compile_schema(schema)
+
+    def _check(output: Any) -> bool:
+        if isinstance(output, str):
+            try:
                 output = json.loads(output)
             except json.JSONDecodeError:
-                # Raw string could not be parsed – treat as validation
-                # failure so callers can surface helpful error messages.
                 return False
+        return compiled.is_valid(output)
+
+    return _check
+
+
+class SchemaValidator:  # – internal utility
+    """Validates node outputs against declared schemas.
+
+    Construct with the workflow's nodes to compile every validator up front;
+    :meth:`check` then dispatches straight to the compiled predicate.
+    """
+
+    def __init__(self, nodes: Iterable["NodeConfig"] = ()) -> None:
+        self._compiled: Dict[str, OutputCheck] = {
+            node.id: self.compile(node) for node in nodes
+        }
+
+    def check(self, node: "NodeConfig", output: Any) -> bool:
+        """Validate *output* using the validator compiled for *node*."""
+
+        compiled = self._compiled.get(node.id)
+        if compiled is None:
+            compiled = self._compiled[node.id] = self.compile(node)
+        return compiled(output)
+
+    @staticmethod
+    def compile(node: "NodeConfig") -> OutputCheck:
+        """Return a predicate validating outputs against ``node.output_schema``.
+
+        Supports both *dict*-based schemas (``{path: type}`` maps or JSON
+        Schema documents) and Pydantic ``BaseModel`` subclasses.  String
+        outputs are treated as JSON – many LLM calls return raw strings even
+        when the prompt asks for JSON – and fail validation when they do not
+        parse.
+        """
+
+        schema = getattr(node, "output_schema", None)
+        if not schema:
+            return _accept
 
         # ------------------------------------------------------------------
         # 1. Pydantic model --------------------------------------------------
         # ------------------------------------------------------------------
         try:
-            from pydantic import BaseModel, ValidationError
+            from pydantic import BaseModel
 
             if isinstance(schema, type) and issubclass(schema, BaseModel):
-                try:
-                    schema.model_validate(output)  # type: ignore[arg-type]
-                    return True
-                except ValidationError:
-                    return False
-        except Exception:
+                return _compile_model(schema)
+        except ImportError:
             # Pydantic may not be importable in constrained envs – fall back.
             pass
 
         # ------------------------------------------------------------------
-        # 2. dict schema – leverage nested validation helper -----------------
+        # 2. dict schema – JSON Schema or {path: type} map (cached by hash) --
         # ------------------------------------------------------------------
         if isinstance(schema, dict):
-            # Accept both {key: "type"} and {key: <type>} formats ------------
-            normalized_schema: dict[str, type] = {}
-            for key, expected in schema.items():
-                if isinstance(expected, str):
-                    try:
-                        normalized_schema[key] = eval(expected)
-                    except Exception:
-                        # Fallback to 'Any' when type string cannot be resolved
-                        from typing import Any  # local import to avoid top-level
-
-                        normalized_schema[key] = Any  # type: ignore[assignment]
+            key = schema_fingerprint(schema)
+            cached = _CHECK_CACHE.get(key)
+            if cached is None:
+                if _is_json_schema(schema):
+                    cached = _compile_json_schema(schema)
                 else:
-                    normalized_schema[key] = expected  # type: ignore[assignment]
+                    cached = _compile_type_map(schema)
+                _CHECK_CACHE.set(key, cached)
+            return cached  # type: ignore[no-any-return]
 
-            from ice_core.utils.nested_validation import validate_nested_output
+        # Unknown schema format – consider valid to avoid false negatives
+        return _accept
 
-            errors = validate_nested_output(output, normalized_schema)
-            return len(errors) == 0
+    @staticmethod
+    def is_output_valid(node: "NodeConfig", output: Any) -> bool:
+        """Validate *output* against ``node.output_schema``.  Returns *True* when
+        validation succeeds or no schema declared.
+        """
 
-        # Unknown schema format – consider valid to avoid false negatives
-        return True
+        return SchemaValidator.compile(node)(output)
@@ -8,6 +8,7 @@ propagation and agent integration.  `Workflow` is the new preferred name;
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -24,13 +25,28 @@ from ice_core.models import (
     NodeExecutionResult,
 )
 from ice_core.models.node_models import NodeMetadata
-from ice_core.utils.perf import WeightedSemaphore, estimate_complexity
+from ice_core.utils.blobs import (
+    BlobRef,
+    blob_threshold_from_env,
+    contains_refs,
+    global_blob_store,
+    materialize,
+)
+from ice_core.utils.deadline import DeadlineExceeded, deadline_scope
+from ice_core.utils.deadline import expired as deadline_expired
+from ice_core.utils.deadline import remaining as deadline_remaining
+from ice_core.utils.perf import (
+    PrioritySemaphore,
+    estimate_complexity,
+    global_cost_model,
+)
 from ice_orchestrator.base_workflow import BaseWorkflow, FailurePolicy
-from ice_orchestrator.core import ChainFactory
+from ice_orchestrator.core import ChainFactory, WorkflowPlan
 from ice_orchestrator.execution.agent_factory import AgentFactory
 from ice_orchestrator.execution.executor import NodeExecutor
-from ice_orchestrator.execution.metrics import ChainMetrics
+from ice_orchestrator.execution.metrics import NULL_TIMER, ChainMetrics, NodeTimer
 from ice_orchestrator.graph.dependency_graph import DependencyGraph
+from ice_orchestrator.graph.failure_tracker import FailureTracker
 from ice_orchestrator.graph.level_resolver import BranchGatingResolver
 from ice_orchestrator.utils.context_builder import ContextBuilder
 from ice_orchestrator.validation import ChainValidator, SafetyValidator, SchemaValidator
@@ -86,6 +102,10 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         depth_guard: Any | None = None,
         session_id: Optional[str] = None,
         use_cache: bool = True,
+        plan: Optional[WorkflowPlan] = None,
+        deadline_seconds: Optional[float] = None,
+        blob_threshold: Optional[int] = None,
+        node_timings: Optional[bool] = None,
     ) -> None:
         """Initialize script chain.
 
@@ -109,14 +129,30 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
             depth_guard: Depth guard for chain execution
             session_id: Session identifier
             use_cache: Chain-level cache toggle
+            plan: Pre-compiled :class:`WorkflowPlan` for *nodes*; skips graph
+                construction and static validation (see :meth:`from_plan`)
+            deadline_seconds: Wall-clock budget for :meth:`execute`.  The
+                remaining time bounds node timeouts, LLM/HTTP calls and nested
+                chains; nodes still running at the deadline are cancelled.
+            blob_threshold: Node output values larger than this many bytes
+                are stored once in the blob store and passed downstream by
+                reference (default ``ICE_BLOB_THRESHOLD``, off; ``0`` disables).
+            node_timings: Record per-node phase timings (result metadata,
+                ``get_metrics()`` histograms) and feed the cost model that
+                learns slot weights and critical-path priorities (default
+                ``ICE_NODE_TIMINGS``, off).
         """
         self.chain_id = chain_id or f"chain_{datetime.utcnow().isoformat()}"
         # Semantic version for migration tracking -----------------------
         self.version: str = version
 
+        self._plan = plan
+
         # Safety checks BEFORE super().__init__ builds runtime structures ----
-        SafetyValidator.validate_layer_boundaries()
-        SafetyValidator.validate_node_tool_access(nodes)
+        # (already performed when the plan was compiled)
+        if plan is None:
+            SafetyValidator.validate_layer_boundaries()
+            SafetyValidator.validate_node_tool_access(nodes)
 
         # Ensure _chain_tools is set before any use
         self._chain_skills = tools or []  # Updated from _chain_tools
@@ -137,28 +173,49 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         )
         self.validate_outputs = validate_outputs
         self.use_cache = use_cache
+        self.deadline_seconds = deadline_seconds
+        self.blob_threshold = (
+            blob_threshold if blob_threshold is not None else blob_threshold_from_env()
+        )
+        self.node_timings = (
+            node_timings if node_timings is not None else runtime_config.node_timings
+        )
+        # Blob references created by the current run (released at its end)
+        self._blob_refs: List[BlobRef] = []
         self.token_ceiling = token_ceiling or runtime_config.max_tokens
         self.depth_ceiling = depth_ceiling or runtime_config.max_depth
         # External guard callbacks --------------------------------------
         self._token_guard = token_guard
         self._depth_guard = depth_guard
 
-        # Build dependency graph
-        self.graph = DependencyGraph(nodes)
-        self.graph.validate_schema_alignment(nodes)
-        self.levels = self.graph.get_level_nodes()
+        # Build dependency graph (shared read-only when running from a plan)
+        if plan is not None:
+            self.graph = plan.graph
+            self.levels = plan.levels
+        else:
+            self.graph = DependencyGraph(nodes)
+            self.graph.validate_schema_alignment(nodes)
+            self.levels = self.graph.get_level_nodes()
 
         # Validator helper ----------------------------------------------------
         self._validator = ChainValidator(self.failure_policy, self.levels, self.nodes)
 
         # Metrics & events
         self.metrics = ChainMetrics()
+        # Learned node latency/tokens – drives slot weights and priorities
+        # (fed only by runs with node_timings)
+        self._cost_model = global_cost_model()
+        self._priorities: Dict[str, float] = {}
         # Executor helper -----------------------------------------------------
         self._executor = NodeExecutor(self)
         # Agent factory helper ------------------------------------------------
         self._agent_factory = AgentFactory(self.context_manager, self._chain_skills)
-        # Schema validator helper ---------------------------------------------
-        self._schema_validator = SchemaValidator()
+        # Schema validator helper (output validators compiled per node) -------
+        self._schema_validator = (
+            plan.schema_validator
+            if plan is not None
+            else SchemaValidator(self.nodes.values())
+        )
         # Agent instance cache -------------------------------------------
         self._agent_cache: Dict[str, AgentNode] = {}
         # Track decisions made by *condition* nodes -----------------------
@@ -181,11 +238,22 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
             len(self.levels),
         )
 
+    @classmethod
+    def from_plan(cls, plan: WorkflowPlan, **kwargs: Any) -> "Workflow":
+        """Create a run-ready workflow from a compiled :class:`WorkflowPlan`.
+
+        Only per-run state (context, metrics, caches, branch decisions) is
+        allocated; graph, levels and validators are shared with the plan.
+        """
+
+        return cls(nodes=list(plan.nodes), plan=plan, **kwargs)
+
     async def execute(self) -> NodeExecutionResult:
         """Execute the workflow and return a ChainExecutionResult."""
         start_time = datetime.utcnow()
         results: Dict[str, NodeExecutionResult] = {}
         errors: List[str] = []
+        failures = FailureTracker(self.graph.csr)
 
         logger.info(
             "Starting execution of chain '%s' (ID: %s)", self.name, self.chain_id
@@ -198,8 +266,15 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
                 "chain_name": self.name,
                 "node_count": len(self.nodes),
             },
-        ) as chain_span:
+        ) as chain_span, deadline_scope(self.deadline_seconds):
+            # Critical-path priorities are computed on the first contended
+            # level (see _execute_level).
+            self._priorities = {}
             for level_idx, level_num in enumerate(sorted(self.levels.keys()), start=1):
+                if deadline_expired():
+                    errors.append("Deadline exceeded")
+                    break
+
                 # External depth guard takes priority --------------------
                 if self._depth_guard and not self._depth_guard(
                     level_idx, self.depth_ceiling
@@ -270,8 +345,15 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
                     # When the node execution failed, collect error information
                     if not result.success:
                         errors.append(f"Node {node_id} failed: {result.error}")
+                        failures.mark_failed(node_id, result.error)
+
+                # Everything else in this level (run or gated off) is settled.
+                for nid in level_node_ids:
+                    failures.mark_done(nid)
 
-                if errors and not self._validator.should_continue(errors):
+                if errors and not self._validator.should_continue(
+                    errors, failures=failures
+                ):
                     break
 
             end_time = datetime.utcnow()
@@ -290,6 +372,19 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
 
         final_node_id = self.graph.get_leaf_nodes()[0]
 
+        # Callers read the chain output directly – hand them real values.
+        # Runs that offloaded nothing skip the walk.
+        if self._blob_refs:
+            for node_id, result in results.items():
+                if contains_refs(result.output):
+                    results[node_id] = result.model_copy(
+                        update={"output": materialize(result.output)}
+                    )
+            store = global_blob_store()
+            for ref in self._blob_refs:
+                store.release(ref.digest)
+            self._blob_refs = []
+
         # Wrap ChainExecutionResult as NodeExecutionResult for ABC compliance
         chain_result = ChainExecutionResult(
             success=len(errors) == 0,
@@ -325,29 +420,79 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         level_nodes: List[NodeConfig],
         accumulated_results: Dict[str, NodeExecutionResult],
     ) -> Dict[str, NodeExecutionResult]:
-        """Execute all processors at a given level in parallel."""
-        semaphore = asyncio.Semaphore(self.max_parallel)
+        """Execute all processors at a given level in parallel.
 
-        async def process_node(node: NodeConfig) -> Tuple[str, NodeExecutionResult]:
-            weight = max(1, estimate_complexity(node))
-            async with WeightedSemaphore(semaphore, weight):
-                result = await self.execute_node(
-                    node.id,
-                    self._build_node_context(node, accumulated_results),
+        When ready nodes outnumber the ``max_parallel`` slots, nodes with the
+        longest expected remaining path are admitted first; slot weights and
+        path lengths are learned from past runs with ``node_timings``.
+        """
+        semaphore = PrioritySemaphore(self.max_parallel)
+        cost_model = self._cost_model
+        if len(level_nodes) * cost_model.max_weight <= self.max_parallel:
+            # Even maximal weights fit – slots never bind, skip the estimates.
+            weights = dict.fromkeys((n.id for n in level_nodes), 1)
+        else:
+            weights = {n.id: estimate_complexity(n, cost_model) for n in level_nodes}
+        if sum(weights.values()) > self.max_parallel:
+            if not self._priorities:
+                # Longest expected remaining path per node, once per run.
+                self._priorities = self.graph.remaining_path_lengths(
+                    lambda nid: self._cost_model.latency(self.nodes[nid])
                 )
-                return node.id, result
+            # Tasks start in creation order and the first wave takes free
+            # slots without queueing, so create them critical-path first.
+            level_nodes = sorted(
+                level_nodes,
+                key=lambda n: self._priorities.get(n.id, 0.0),
+                reverse=True,
+            )
+        priorities = self._priorities
 
-            # The context manager above always returns; this line is never
-            # reached but satisfies static analysis that a return statement
-            # exists on all code paths (mypy + pyright).
-            raise RuntimeError("unreachable")  # pragma: no cover
+        timed = self.node_timings
 
-        tasks = [process_node(node) for node in level_nodes]
-        # Gather with *return_exceptions* so that a single processor failure does not
-        # crash the entire level when *failure_policy* allows continuation.  Any
-        # exception is immediately converted into a failed *NodeExecutionResult*
-        # so downstream bookkeeping remains consistent.
-        gathered = await asyncio.gather(*tasks, return_exceptions=True)
+        async def process_node(node: NodeConfig) -> Tuple[str, NodeExecutionResult]:
+            weight = weights[node.id]
+            timer = NodeTimer() if timed else NULL_TIMER
+            queued_at = time.perf_counter()
+            acquired = await semaphore.acquire(weight, priorities.get(node.id, 0.0))
+            try:
+                start = timer.lap("queue_wait", queued_at)
+                node_ctx = self._build_node_context(node, accumulated_results)
+                timer.lap("context_build", start)
+                result = await self.execute_node(node.id, node_ctx, timer=timer)
+            finally:
+                semaphore.release(acquired)
+            if timed and result.success:
+                usage = getattr(result, "usage", None)
+                self._cost_model.observe(
+                    node,
+                    timer.run_time,
+                    int(getattr(usage, "total_tokens", 0) or 0),
+                )
+            return node.id, result
+
+        tasks = [asyncio.ensure_future(process_node(node)) for node in level_nodes]
+        # Wait without propagating exceptions so that a single processor failure
+        # does not crash the entire level when *failure_policy* allows
+        # continuation.  Any exception is immediately converted into a failed
+        # *NodeExecutionResult* so downstream bookkeeping remains consistent.
+        # Nodes still running at the chain deadline are cancelled so they stop
+        # holding parallelism slots.
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=deadline_remaining())
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        gathered: List[Any] = []
+        for node, task in zip(level_nodes, tasks):
+            if task.cancelled():
+                exc = DeadlineExceeded(f"Node '{node.id}' cancelled at deadline")
+                gathered.append((node.id, exc))
+            elif task.exception() is not None:
+                gathered.append((node.id, task.exception()))
+            else:
+                gathered.append(task.result())
 
         level_results: Dict[str, NodeExecutionResult] = {}
         for item in gathered:
@@ -478,15 +623,23 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         return self.levels.get(level, [])
 
     def get_metrics(self) -> Dict[str, Any]:
-        """Get execution metrics."""
+        """Get execution metrics (tokens, cost and per-phase timing histograms)."""
         return self.metrics.as_dict()
 
     async def execute_node(
-        self, node_id: str, input_data: Dict[str, Any]
+        self,
+        node_id: str,
+        input_data: Dict[str, Any],
+        *,
+        timer: NodeTimer | None = None,
     ) -> NodeExecutionResult:
         """Execute a single processor – now delegated to *NodeExecutor* utility."""
 
-        result = await self._executor.execute_node(node_id, input_data)
+        if timer is None:
+            timer = NodeTimer() if self.node_timings else NULL_TIMER
+        result = await self._executor.execute_node(node_id, input_data, timer=timer)
+        if timer.enabled:
+            self.metrics.record_timings(node_id, timer)
 
         # Handle SubDAG results
         if hasattr(result, "output") and result.output is not None:
@@ -528,11 +681,10 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
 
         return self._agent_factory.make_agent(node)
 
-    @staticmethod
-    def _is_output_valid(node: NodeConfig, output: Any) -> bool:
+    def _is_output_valid(self, node: NodeConfig, output: Any) -> bool:
         """Delegate to :class:`SchemaValidator`."""
 
-        return SchemaValidator().is_output_valid(node, output)
+        return self._schema_validator.check(node, output)
 
     # ---------------------------------------------------------------------
     # Branch gating helpers -------------------------------------------------
@@ -625,6 +777,9 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         # triggering AttributeError: 'str' object has no attribute 'id'.
         # We need the *values*.
 
+        if self._plan is not None:
+            return  # validated once when the plan was compiled
+
         self.graph.validate_schema_alignment(list(self.nodes.values()))
         SafetyValidator.validate_node_tool_access(list(self.nodes.values()))
         ChainValidator(self.failure_policy, self.levels, self.nodes).validate_chain()
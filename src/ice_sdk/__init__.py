@@ -1,49 +1,64 @@
-"""iceOS SDK."""
+"""iceOS SDK.
 
-# ---------------------------------------------------------------------------
-# Public agent-facing exports (moved from deprecated ``ice_sdk.agents`` package)
-# ---------------------------------------------------------------------------
+Public names are resolved lazily (PEP 562): ``import ice_sdk`` is cheap and
+heavy submodules (agents, context manager, skills) load on first attribute
+access, e.g. ``ice_sdk.ToolService``.
+"""
 
+from __future__ import annotations
 
-# Keep AgentConfig & ModelSettings re-export unchanged (order after AgentNode)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict
 
-# Re-export AgentNode for orchestrator compatibility
-from .agents.agent_node import AgentNode
-from .base_node import BaseNode
-from .context import GraphContextManager
-from .models.config import LLMConfig, MessageTemplate
-from .models.node_models import NodeConfig, NodeExecutionResult, NodeMetadata
+if TYPE_CHECKING:  # pragma: no cover – static analysers see eager imports
+    from .agents.agent_node import AgentNode
+    from .base_node import BaseNode
+    from .context import GraphContextManager
+    from .models.config import LLMConfig, MessageTemplate
+    from .models.node_models import NodeConfig, NodeExecutionResult, NodeMetadata
+    from .services.locator import ServiceLocator
+    from .skills import SkillBase
+    from .skills.service import ToolService
 
-# from .models.network import NetworkSpec
-from .skills import SkillBase
-from .skills.service import ToolService
-
-# NOTE: Lazy import of IceCopilot to avoid circular dependencies with ice_orchestrator.
+# ---------------------------------------------------------------------------
+# Public agent-facing exports (moved from deprecated ``ice_sdk.agents`` package)
+# ---------------------------------------------------------------------------
 
-__all__ = [
+# name -> defining submodule (relative to this package)
+_LAZY_EXPORTS: Dict[str, str] = {
     # Core abstractions
-    "BaseNode",
-    "SkillBase",  # supplant BaseTool alias
-    "ToolService",
-    "AgentNode",
+    "BaseNode": ".base_node",
+    "SkillBase": ".skills",  # supplant BaseTool alias
+    "ToolService": ".skills.service",
+    "AgentNode": ".agents.agent_node",
     # Data models
-    "NodeConfig",
-    "NodeExecutionResult",
-    "NodeMetadata",
-    # "NetworkSpec",  # not yet stable
-    "LLMConfig",
-    "MessageTemplate",
+    "NodeConfig": ".models.node_models",
+    "NodeExecutionResult": ".models.node_models",
+    "NodeMetadata": ".models.node_models",
+    "LLMConfig": ".models.config",
+    "MessageTemplate": ".models.config",
     # Context
-    "GraphContextManager",
+    "GraphContextManager": ".context",
+    # Services
+    "ServiceLocator": ".services.locator",
     # (RuntimeConfig & BudgetEnforcer intentionally NOT part of stable API)
-]
+}
+
+__all__ = list(_LAZY_EXPORTS)
 
 # Removed IceCopilot – Copilot package deprecated
 
-# NOTE: The previous dynamic __getattr__ hook was removed to make dependencies
-# explicit and avoid hidden import side-effects. Downstream code must now import
-# `IceCopilot` explicitly or receive it via dependency injection.
+# Nested chain features intentionally not part of stable public surface yet
+
 
-__all__.extend(["ServiceLocator"])
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value  # cache – later lookups bypass __getattr__
+    return value
 
-# Nested chain features intentionally not part of stable public surface yet
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,22 +3,68 @@
 The registry is NOT a singleton by design; callers create an instance, add
 cards (or pull them from *ToolService.cards()*) and then perform look-ups.
 If we need a process-wide default we can wire it later via *ice_sdk.cache*.
+
+Look-ups are index-backed: ``add``/``extend`` maintain an inverted index of
+word tokens, and :meth:`CapabilityRegistry.search` resolves each query term
+against the (much smaller) token vocabulary – prefix, suffix and infix alike –
+so it touches only matching cards.  Cards that
+carry an ``embedding`` are also stacked into a matrix (NumPy when installed)
+for :meth:`CapabilityRegistry.semantic_search` and vector-ranked search.
 """
 
 from __future__ import annotations
 
 import fnmatch
+import math
 import re
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ice_core.cache import LRUCache
 
 from .card import CapabilityCard
 
+try:  # Optional – vectorised similarity
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – optional dep
+    np = None  # type: ignore
+
 __all__ = ["CapabilityRegistry"]
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Distinct query terms whose vocabulary matches are memoised per registry.
+_INFIX_CACHE_SIZE = 1024
+
+
+def _card_tokens(card: CapabilityCard) -> Set[str]:
+    """Searchable tokens for *card* (words plus whole ids/tags)."""
+
+    texts = [card.id, card.name, card.description, card.purpose or ""]
+    texts.extend(str(sample) for sample in card.examples or [])
+    texts.extend(card.tags)
+    tokens: Set[str] = set()
+    for text in texts:
+        tokens.update(_TOKEN_RE.findall(text.lower()))
+    # Whole values keep ``web_search`` / ``web*`` style queries exact.
+    tokens.add(card.id.lower())
+    tokens.update(tag.lower() for tag in card.tags)
+    return tokens
+
 
 class CapabilityRegistry:  # – simple data holder
     def __init__(self) -> None:
         self._cards: dict[str, CapabilityCard] = {}
+        # Insertion sequence so index hits come back in registry order.
+        self._order: Dict[str, int] = {}
+        self._seq = 0
+        # Inverted index: token → card ids; plus per-card tokens for removal.
+        self._postings: Dict[str, Set[str]] = {}
+        self._card_tokens: Dict[str, Set[str]] = {}
+        # term → vocabulary tokens containing it (cleared when tokens change)
+        self._infix_cache = LRUCache(capacity=_INFIX_CACHE_SIZE)
+        # Embedding matrix (rebuilt lazily after mutations).
+        self._vec_ids: List[str] = []
+        self._matrix: Any = None
+        self._vec_dirty = True
 
     # ------------------------------------------------------------------
     # Mutation helpers --------------------------------------------------
@@ -37,9 +83,15 @@ class CapabilityRegistry:  # – simple data holder
             same *id* already exists.  When *True* the existing entry is
             replaced (used when re-loading updated metadata).
         """
-        if card.id in self._cards and not overwrite:
-            raise ValueError(f"Capability '{card.id}' already registered")
+        if card.id in self._cards:
+            if not overwrite:
+                raise ValueError(f"Capability '{card.id}' already registered")
+            self._unindex(card.id)
+        else:
+            self._order[card.id] = self._seq
+            self._seq += 1
         self._cards[card.id] = card
+        self._index(card)
 
     def extend(
         self, cards: Iterable[CapabilityCard], *, overwrite: bool = False
@@ -48,6 +100,30 @@ class CapabilityRegistry:  # – simple data holder
         for card in cards:
             self.add(card, overwrite=overwrite)
 
+    def _index(self, card: CapabilityCard) -> None:
+        tokens = _card_tokens(card)
+        self._card_tokens[card.id] = tokens
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                self._infix_cache.clear()
+            posting.add(card.id)
+        if card.embedding:
+            self._vec_dirty = True
+
+    def _unindex(self, card_id: str) -> None:
+        for token in self._card_tokens.pop(card_id, ()):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(card_id)
+            if not posting:
+                del self._postings[token]
+                self._infix_cache.clear()
+        if self._cards[card_id].embedding:
+            self._vec_dirty = True
+
     # ------------------------------------------------------------------
     # Query helpers -----------------------------------------------------
     # ------------------------------------------------------------------
@@ -60,42 +136,153 @@ class CapabilityRegistry:  # – simple data holder
         return list(self._cards.values())
 
     # ------------------------------------------------- search ----------
-    def search(self, query: str) -> List[CapabilityCard]:
+    def search(
+        self, query: str, *, query_embedding: Optional[Sequence[float]] = None
+    ) -> List[CapabilityCard]:
         """Very small search util.
 
-        Matching strategy (quick & dirty):
-        1. Case-insensitive substring against *id*, *name* and *description*.
-        2. Wild-cards via :pymod:`fnmatch` (``web*``).
-        3. Tag match if *query* exactly equals a tag.
+        Matching strategy:
+        1. Every whitespace-separated term must occur inside a token of the
+           card (id, name, description, purpose, examples, tags) – prefix,
+           suffix or infix, so ``search`` finds both ``web_search`` and
+           "deep research".
+        2. Wild-cards (``web*``) are matched against the token vocabulary.
+        3. Queries that hit no indexed token (e.g. phrases spanning
+           punctuation) fall back to a case-insensitive substring scan.
+        4. An empty query returns every card.
+
+        Results are in registry order, or ranked by cosine similarity when
+        *query_embedding* is given (cards without embeddings last).
+        """
+        query_low = query.lower().strip()
+        if not query_low:
+            cards = self.list()
+        elif hits := self._lookup(query_low):
+            cards = [self._cards[cid] for cid in sorted(hits, key=self._order.get)]
+        else:
+            cards = self._scan(query_low)
+
+        if query_embedding is not None and cards:
+            scores = dict(self._similarities(query_embedding))
+            cards.sort(key=lambda c: -scores.get(c.id, -math.inf))
+        return cards
+
+    def semantic_search(
+        self, query_embedding: Sequence[float], *, top_k: int = 5
+    ) -> List[Tuple[CapabilityCard, float]]:
+        """Return the *top_k* cards most similar to *query_embedding*.
+
+        Only cards with an ``embedding`` of matching dimension participate.
+        """
+        scored = sorted(self._similarities(query_embedding), key=lambda t: -t[1])
+        return [(self._cards[cid], score) for cid, score in scored[:top_k]]
+
+    def _lookup(self, query_low: str) -> Set[str]:
+        result: Optional[Set[str]] = None
+        for term in query_low.split():
+            matched = self._match_term(term)
+            result = matched if result is None else result & matched
+            if not result:
+                return set()
+        return result or set()
+
+    def _match_term(self, term: str) -> Set[str]:
+        if "*" in term:
+            # Unanchored like the substring scan: ``web*`` ≙ ``*web*``.
+            tokens = self._infix_tokens(term)
+        else:
+            # ``web-search`` → every word must match (AND).
+            words = _TOKEN_RE.findall(term)
+            if len(words) > 1 and term not in self._postings:
+                out: Optional[Set[str]] = None
+                for word in words:
+                    sub = self._match_term(word)
+                    out = sub if out is None else out & sub
+                return out or set()
+            tokens = self._infix_tokens(term)
+        matched: Set[str] = set()
+        for token in tokens:
+            matched |= self._postings[token]
+        return matched
+
+    def _infix_tokens(self, term: str) -> List[str]:
+        """Vocabulary tokens containing *term* (or matching it as a glob).
+
+        Scans the token vocabulary – far smaller than the card texts – and
+        memoises the answer (LRU-bounded) until the vocabulary changes.
         """
-        query_low = query.lower()
+        tokens = self._infix_cache.get(term)
+        if tokens is None:
+            if "*" in term:
+                pattern = f"*{term.strip('*')}*"
+                tokens = [t for t in self._postings if fnmatch.fnmatch(t, pattern)]
+            else:
+                tokens = [t for t in self._postings if term in t]
+            self._infix_cache.set(term, tokens)
+        return tokens
+
+    def _scan(self, query_low: str) -> List[CapabilityCard]:
+        """Legacy linear substring/fnmatch scan (index miss fallback)."""
         pattern = re.escape(query_low).replace("\\*", ".*")  # allow '*' wild-card
         regex = re.compile(pattern)
 
         def _match(card: CapabilityCard) -> bool:
-            if regex.search(card.id.lower()):
-                return True
-            if regex.search(card.name.lower()):
-                return True
-            if regex.search(card.description.lower()):
-                return True
-            if card.purpose and regex.search(card.purpose.lower()):
-                return True
-            if card.examples and any(
-                regex.search(str(sample).lower()) for sample in card.examples
-            ):
+            fields = [card.id, card.name, card.description, card.purpose or ""]
+            fields.extend(str(sample) for sample in card.examples or [])
+            if any(regex.search(f.lower()) for f in fields):
                 return True
-            if any(tag.lower() == query_low for tag in card.tags):
-                return True
-            # fallback to fnmatch on id & tags --------------------------
-            if fnmatch.fnmatch(card.id.lower(), query_low):
-                return True
-            if any(fnmatch.fnmatch(tag.lower(), query_low) for tag in card.tags):
-                return True
-            return False
+            return any(fnmatch.fnmatch(tag.lower(), query_low) for tag in card.tags)
 
         return [card for card in self._cards.values() if _match(card)]
 
+    # ------------------------------------------------------------------
+    # Embeddings --------------------------------------------------------
+    # ------------------------------------------------------------------
+    def _similarities(self, query: Sequence[float]) -> List[Tuple[str, float]]:
+        """Cosine similarity of *query* against every embedded card."""
+        if self._vec_dirty:
+            self._build_matrix()
+        if not self._vec_ids or len(query) != self._dim():
+            return []
+        q_norm = math.sqrt(sum(x * x for x in query)) or 1.0
+        if np is not None:
+            q = np.asarray(query, dtype=np.float32) / q_norm
+            scores = self._matrix @ q
+            return list(zip(self._vec_ids, scores.tolist()))
+        unit = [x / q_norm for x in query]
+        return [
+            (cid, sum(a * b for a, b in zip(row, unit)))
+            for cid, row in zip(self._vec_ids, self._matrix)
+        ]
+
+    def _dim(self) -> int:
+        if np is not None:
+            return int(self._matrix.shape[1])
+        return len(self._matrix[0])
+
+    def _build_matrix(self) -> None:
+        rows: List[List[float]] = []
+        ids: List[str] = []
+        dim: Optional[int] = None
+        for cid, card in self._cards.items():
+            vec = card.embedding
+            if not vec:
+                continue
+            if dim is None:
+                dim = len(vec)
+            if len(vec) != dim:
+                continue  # mixed embedding models – keep the first dimension
+            norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+            rows.append([x / norm for x in vec])
+            ids.append(cid)
+        self._vec_ids = ids
+        if np is not None:
+            matrix = np.asarray(rows, dtype=np.float32)
+            self._matrix = matrix.reshape(len(rows), dim or 0)
+        else:
+            self._matrix = rows
+        self._vec_dirty = False
+
     # ------------------------------------------------------------------
     # Representation ----------------------------------------------------
     # ------------------------------------------------------------------
@@ -22,6 +22,24 @@ class RuntimeConfig(BaseModel):
         default=None, description="Maximum execution depth allowed (ICE_MAX_DEPTH)"
     )
 
+    # CPU-bound skill execution
+    skill_process_workers: Optional[int] = Field(
+        default=None,
+        description="Worker processes for cpu_process skills; None = CPU count (ICE_SKILL_PROCESS_WORKERS)",
+    )
+
+    # Template rendering
+    jinja_bytecode_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the shared Jinja bytecode cache; None disables it (ICE_JINJA_BYTECODE_DIR)",
+    )
+
+    # Observability
+    node_timings: bool = Field(
+        default=False,
+        description="Record per-node phase timings and learn node costs (ICE_NODE_TIMINGS)",
+    )
+
     # Budget enforcement
     org_budget_usd: Optional[float] = Field(
         default=None, description="Organization budget in USD (ORG_BUDGET_USD)"
@@ -62,6 +80,10 @@ class RuntimeConfig(BaseModel):
         # Resource limits
         max_tokens = os.getenv("ICE_MAX_TOKENS")
         max_depth = os.getenv("ICE_MAX_DEPTH")
+        skill_process_workers = os.getenv("ICE_SKILL_PROCESS_WORKERS")
+        jinja_bytecode_dir = os.getenv("ICE_JINJA_BYTECODE_DIR") or None
+        node_timings_raw = os.getenv("ICE_NODE_TIMINGS", "0")
+        node_timings = node_timings_raw.lower() in ["true", "1", "yes", "on"]
 
         # Budget settings
         org_budget_usd = os.getenv("ORG_BUDGET_USD")
@@ -76,6 +98,11 @@ class RuntimeConfig(BaseModel):
         return cls(
             max_tokens=int(max_tokens) if max_tokens else None,
             max_depth=int(max_depth) if max_depth else None,
+            skill_process_workers=(
+                int(skill_process_workers) if skill_process_workers else None
+            ),
+            jinja_bytecode_dir=jinja_bytecode_dir,
+            node_timings=node_timings,
             org_budget_usd=float(org_budget_usd) if org_budget_usd else None,
             runtime_mode=runtime_mode,
             budget_fail_open=budget_fail_open,
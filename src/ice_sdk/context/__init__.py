@@ -7,11 +7,13 @@ from ice_sdk.context.session_state import SessionState
 
 from .async_manager import GraphContextManager  # async-first implementation
 from .async_manager import AsyncGraphContextManager
+from .embedders import HashingEmbedder, SentenceTransformerEmbedder
 from .memory import (  # re-export for convenience
     BaseMemory,
     NullMemory,
     SQLiteVectorMemory,
 )
+from .vector_index import FileVectorIndex
 
 __all__: list[str] = [
     "GraphContextManager",
@@ -21,4 +23,7 @@ __all__: list[str] = [
     "SQLiteVectorMemory",
     "NullMemory",
     "AsyncGraphContextManager",
+    "FileVectorIndex",
+    "HashingEmbedder",
+    "SentenceTransformerEmbedder",
 ]
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pydantic import Field
 
 # Import *sync* base class under a private alias to avoid shadowing
 from .manager import GraphContext
 from .manager import GraphContextManager as _SyncGraphContextManager
+from .store_base import BaseContextStore
 
 
 class BranchContext(GraphContext):
@@ -50,6 +51,13 @@ class GraphContextManager(_SyncGraphContextManager):
         # branch_id -> BranchContext
         self._branch_stores: Dict[str, BranchContext] = {}
 
+    def fork(self, *, store: Optional[BaseContextStore] = None) -> "GraphContextManager":
+        """Run-scoped child with its own lock and branch contexts."""
+        child = super().fork(store=store)
+        child._async_lock = asyncio.Lock()
+        child._branch_stores = {}
+        return child  # type: ignore[return-value]
+
     # ---------------------------------------------------------------------
     # Branch helpers
     # ---------------------------------------------------------------------
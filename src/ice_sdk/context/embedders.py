@@ -0,0 +1,104 @@
+"""Concrete :class:`~ice_sdk.interfaces.embedder.IEmbedder` implementations.
+
+* :class:`HashingEmbedder` – dependency-free feature hashing of word and
+  character n-grams.  Deterministic across processes, good enough for
+  near-duplicate detection and keyword-ish recall in tests and small setups.
+* :class:`SentenceTransformerEmbedder` – local *sentence-transformers* model,
+  loaded lazily and run off the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import re
+from typing import Any, List, Optional
+
+from ice_sdk.models.embedding import Embedding
+
+__all__: list[str] = ["HashingEmbedder", "SentenceTransformerEmbedder"]
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """Signed feature hashing into a *dim*-dimensional unit vector.
+
+    Args:
+        dim: Output dimension.
+        char_ngram: Length of the character n-grams hashed alongside words
+            (``0`` disables them).
+    """
+
+    def __init__(self, dim: int = 256, *, char_ngram: int = 3) -> None:
+        if dim < 1:
+            raise ValueError("dim must be ≥1")
+        self.dim = dim
+        self.char_ngram = char_ngram
+        self.model_version = f"hashing-{dim}-{char_ngram}"
+
+    def _features(self, text: str) -> List[str]:
+        words = _WORD_RE.findall(text.lower())
+        features = [f"w:{word}" for word in words]
+        n = self.char_ngram
+        if n:
+            for word in words:
+                padded = f" {word} "
+                features.extend(
+                    f"c:{padded[i : i + n]}" for i in range(len(padded) - n + 1)
+                )
+        return features
+
+    def embed_sync(self, text: str) -> List[float]:
+        vector = [0.0] * self.dim
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            vector[value % self.dim] += 1.0 if value >> 63 else -1.0
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0.0:
+            # Empty text still needs a valid (non-zero) vector.
+            vector[0] = norm = 1.0
+        return [x / norm for x in vector]
+
+    async def embed(self, text: str) -> Embedding:
+        return Embedding(vector=self.embed_sync(text), model_version=self.model_version)
+
+    def estimate_cost(self, text: str) -> float:
+        return 0.0
+
+
+class SentenceTransformerEmbedder:
+    """Embed with a local *sentence-transformers* model.
+
+    The model is loaded on first use; encoding runs in a worker thread so
+    the event loop is never blocked by inference.
+    """
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+        self.model_name = model_name
+        self.model_version = model_name
+        self._model: Optional[Any] = None
+
+    def _load(self) -> Any:
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer  # type: ignore
+            except ModuleNotFoundError as exc:  # pragma: no cover – optional dep
+                raise ImportError(
+                    "sentence-transformers required for SentenceTransformerEmbedder. "
+                    "Install via 'pip install sentence-transformers'."
+                ) from exc
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    async def embed(self, text: str) -> Embedding:
+        def _encode() -> List[float]:
+            return [float(x) for x in self._load().encode(text)]
+
+        vector = await asyncio.to_thread(_encode)
+        return Embedding(vector=vector, model_version=self.model_version)
+
+    def estimate_cost(self, text: str) -> float:
+        return 0.0  # local inference – no per-call spend
@@ -1,9 +1,11 @@
 """Context manager for graph execution."""
 
+import copy
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
 
 import networkx as nx
 from pydantic import BaseModel, Field
@@ -17,10 +19,13 @@ from ice_sdk.skills.service import ToolRequest, ToolService
 # Local first-party imports (alphabetical) ---------------------------
 from .formatter import ContextFormatter
 from .memory import BaseMemory, SQLiteVectorMemory  # – optional adapter
-from .store import ContextStore
+from .store import ContextStore, InMemoryContextStore
+from .store_base import BaseContextStore
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..agents import AgentNode
+    from ..interfaces.embedder import IEmbedder
+    from ..interfaces.vector_index import IVectorIndex
 
 logger = logging.getLogger(__name__)
 
@@ -47,10 +52,12 @@ class GraphContextManager:
         *,
         max_sessions: int = 10,
         graph: Optional[nx.DiGraph] = None,
-        store: Optional[ContextStore] = None,
+        store: Optional[BaseContextStore] = None,
         formatter: Optional[ContextFormatter] = None,
         memory: Optional[BaseMemory] = None,
         tool_service: Optional[ToolService] = None,
+        vector_index: Optional["IVectorIndex"] = None,
+        embedder: Optional["IEmbedder"] = None,
     ):
         """Create a ``GraphContextManager``.
 
@@ -59,9 +66,11 @@ class GraphContextManager:
             max_sessions: Number of distinct *session_id*s to keep in memory
                 before evicting the least-recently-used.  Old sessions can still
                 be re-created on demand but any cached context is dropped.
+            vector_index: Retrieval backend for :meth:`index_text` /
+                :meth:`retrieve`; falls back to *memory* when omitted.
+            embedder: Embeds text for *vector_index* (defaults to a
+                :class:`~ice_sdk.context.embedders.HashingEmbedder`).
         """
-        from collections import OrderedDict
-
         self.max_tokens = max_tokens
         self.max_sessions = max_sessions
         self.graph = graph or nx.DiGraph()
@@ -69,11 +78,20 @@ class GraphContextManager:
         self.formatter = formatter or ContextFormatter()
         # Memory adapter ---------------------------------------------------
         self.memory: BaseMemory = memory or SQLiteVectorMemory()
+        self.vector_index = vector_index
+        if vector_index is not None and embedder is None:
+            from .embedders import HashingEmbedder
+
+            embedder = HashingEmbedder()
+        self.embedder = embedder
         self._agents: Dict[str, "AgentNode"] = {}
         self._tools: Dict[str, SkillBase] = {}
         # Map of session_id -> GraphContext (acts as LRU cache) --------------
         self._contexts: "OrderedDict[str, GraphContext]" = OrderedDict()
         self._context: Optional[GraphContext] = None
+        # Set on run-scoped children: registries are borrowed from the parent
+        # and copied on first write (see :meth:`fork`).
+        self._shared_registries = False
 
         # Unified ToolService instance ----------------------------------
         if tool_service is None:
@@ -98,8 +116,88 @@ class GraphContextManager:
             # continue so orchestrator startup is resilient.
             pass
 
+    def fork(self, *, store: Optional[BaseContextStore] = None) -> "GraphContextManager":
+        """Return a run-scoped child manager.
+
+        The child shares this manager's tool/agent registries, ToolService,
+        memory, vector index and formatter but owns its execution context and
+        node-context store (an :class:`InMemoryContextStore` unless *store* is
+        given), so concurrent runs never overwrite each other's ``_context`` or
+        node outputs.  Registries are copy-on-write: registering a tool on the
+        child leaves the parent untouched.  Forking skips ``__init__`` and
+        therefore tool discovery, making it cheap enough to do per run.
+        """
+        child = copy.copy(self)
+        child._context = None
+        child._contexts = OrderedDict()
+        child.store = store if store is not None else InMemoryContextStore()
+        child._shared_registries = True
+        return child
+
+    # ------------------------------------------------------------------
+    # Retrieval ---------------------------------------------------------
+    # ------------------------------------------------------------------
+    def _retrieval_scope(self, scope: Optional[str]) -> str:
+        """Explicit *scope*, else the current tenant, else the session."""
+        if scope:
+            return scope
+        ctx = self._context
+        if ctx is not None:
+            return ctx.tenant or ctx.session_id
+        return "default"
+
+    async def index_text(
+        self,
+        key: str,
+        text: str,
+        *,
+        scope: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        dedup: bool = True,
+    ) -> None:
+        """Embed *text* and store it under *key* for later :meth:`retrieve`."""
+        if self.vector_index is None or self.embedder is None:
+            await self.memory.add(text, {**(metadata or {}), "key": key})
+            return
+        embedding = await self.embedder.embed(text)
+        await self.vector_index.upsert(
+            self._retrieval_scope(scope),
+            key,
+            embedding.vector,
+            model_version=embedding.model_version,
+            dedup=dedup,
+            metadata=metadata,
+        )
+
+    async def retrieve(
+        self,
+        query: str,
+        *,
+        k: int = 5,
+        scope: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[str, float]]:
+        """Top-*k* ``(key, score)`` pairs similar to *query* in *scope*.
+
+        Without a vector index the memory adapter answers (returning stored
+        content rather than keys, and ignoring *scope*/*filter*).
+        """
+        if self.vector_index is None or self.embedder is None:
+            return await self.memory.retrieve(query, k)
+        embedding = await self.embedder.embed(query)
+        return await self.vector_index.query(
+            self._retrieval_scope(scope), embedding.vector, k=k, filter=filter
+        )
+
+    def _own_registries(self) -> None:
+        if self._shared_registries:
+            self._agents = dict(self._agents)
+            self._tools = dict(self._tools)
+            self._shared_registries = False
+
     def register_agent(self, agent: "AgentNode") -> None:
         """Register an agent for lookup by other agents."""
+        self._own_registries()
         if agent.config.name in self._agents:
             raise ValueError(f"Agent '{agent.config.name}' already registered")
         self._agents[agent.config.name] = agent
@@ -110,6 +208,7 @@ class GraphContextManager:
         Args:
             tool: Tool to register
         """
+        self._own_registries()
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' already registered")
         self._tools[tool.name] = tool
@@ -197,3 +197,65 @@ class ContextStore(BaseContextStore):
                 with open(self.context_store_path, "w") as f:
                     json.dump({}, f)
         self._run_hooks("clear", node_id or "ALL", None)
+
+
+class InMemoryContextStore(BaseContextStore):
+    """Process-local node-context store without file persistence.
+
+    Used for run-scoped managers (see :meth:`GraphContextManager.fork`): each
+    run owns one instance, so concurrent runs never share mutable state and
+    updates never touch disk.
+    """
+
+    def __init__(self, formatter: Optional[ContextFormatter] = None) -> None:
+        self.context_cache: Dict[str, Dict[str, Any]] = {}
+        self.hooks: List[Callable[[str, str, Any], None]] = []
+        self.formatter = formatter or ContextFormatter()
+
+    def register_hook(self, hook: Callable[[str, str, Any], None]) -> None:
+        """Register a hook to be called on every context operation."""
+        self.hooks.append(hook)
+
+    def _run_hooks(self, op: str, node_id: str, content: Any) -> None:
+        for hook in self.hooks:
+            hook(op, node_id, content)
+
+    def get(self, node_id: str) -> Any:
+        self._run_hooks("get", node_id, None)
+        return self.context_cache.get(node_id, {}).get("data", {})
+
+    def set(
+        self,
+        node_id: str,
+        context: Dict[str, Any],
+        schema: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.update(node_id, context, schema=schema)
+
+    def update(
+        self,
+        node_id: str,
+        content: Any,
+        execution_id: Optional[str] = None,
+        schema: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if schema and not self.formatter.validate_schema(content, schema):
+            raise ContextStoreError(
+                f"Context for node {node_id} does not match schema."
+            )
+        entry: Dict[str, Any] = {
+            "data": content,
+            "version": str(uuid4()),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+        if execution_id:
+            entry["execution_id"] = execution_id
+        self.context_cache[node_id] = entry
+        self._run_hooks("update", node_id, content)
+
+    def clear(self, node_id: Optional[str] = None) -> None:
+        if node_id:
+            self.context_cache.pop(node_id, None)
+        else:
+            self.context_cache.clear()
+        self._run_hooks("clear", node_id or "ALL", None)
@@ -0,0 +1,492 @@
+"""Local, file-backed :class:`~ice_sdk.interfaces.vector_index.IVectorIndex`.
+
+Vectors live in one *partition* per ``(scope, model_version)`` so tenants
+never see each other's rows and embeddings from different models are never
+compared.  Each partition is a directory holding:
+
+``partition.json``
+    Dimension, scope and model version (written once).
+``vectors.f32``
+    Row-major float32 matrix of unit vectors, memory-mapped.  When NumPy is
+    installed the mapping is viewed as an ``ndarray`` and scored with a
+    single mat-vec product; otherwise rows are scored in pure Python.
+``rows.jsonl``
+    Append-only log of ``{"row", "key", "meta"}`` assignments and deletions,
+    replayed on open.
+
+Metadata filters are answered from a column index (``field -> value ->
+rows``) so only matching rows are scored.  ``dedup=True`` upserts skip
+near-exact duplicates (cosine ≥ ``dedup_threshold``) found through
+random-hyperplane LSH buckets – the cosine analogue of MinHash banding.
+
+Example::
+
+    index = FileVectorIndex(".ice/vectors")
+    await index.upsert("tenant-a", "doc-1", vec, model_version="minilm",
+                       metadata={"lang": "en"})
+    hits = await index.query("tenant-a", vec, k=3, filter={"lang": "en"})
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import mmap
+import os
+import random
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+try:  # Optional – vectorised scoring
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – optional dep
+    np = None  # type: ignore
+
+__all__: list[str] = ["FileVectorIndex"]
+
+logger = logging.getLogger(__name__)
+
+_ITEM = 4  # bytes per float32
+_INITIAL_ROWS = 64
+_LSH_BANDS = 4
+_LSH_BITS = 4  # hyperplanes per band
+
+
+def _normalise(embedding: Iterable[float]) -> List[float]:
+    vec = [float(x) for x in embedding]
+    norm = math.sqrt(sum(x * x for x in vec))
+    if not vec or norm == 0.0:
+        raise ValueError("embedding must be a non-empty, non-zero vector")
+    return [x / norm for x in vec]
+
+
+def _index_values(value: Any) -> List[Any]:
+    """Hashable values *value* is indexed under (list items individually)."""
+
+    items = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+    out = []
+    for item in items:
+        try:
+            hash(item)
+        except TypeError:
+            continue  # nested dicts/lists are stored but not filterable
+        out.append(item)
+    return out
+
+
+class _Partition:
+    """Vectors of one ``(scope, model_version)`` pair (not thread-safe)."""
+
+    def __init__(self, path: Path, dim: int) -> None:
+        self.path = path
+        self.dim = dim
+        self.keys: Dict[str, int] = {}
+        self.row_keys: Dict[int, str] = {}
+        self.meta: Dict[int, Dict[str, Any]] = {}
+        self.columns: Dict[str, Dict[Any, Set[int]]] = {}
+        self.free: List[int] = []
+        self.rows = 0  # high-water mark of used rows
+        self._lsh: Optional[Dict[Tuple[int, int], Set[int]]] = None
+        self._planes: Optional[List[List[float]]] = None
+        self._mm: Optional[mmap.mmap] = None
+        self._view: Any = None
+        self._matrix: Any = None
+        self._log = None
+        self._open()
+
+    # ------------------------------------------------------------------
+    # Storage -----------------------------------------------------------
+    # ------------------------------------------------------------------
+    def _open(self) -> None:
+        vectors = self.path / "vectors.f32"
+        if not vectors.exists():
+            with open(vectors, "wb") as fh:
+                fh.truncate(_INITIAL_ROWS * self.dim * _ITEM)
+        log_path = self.path / "rows.jsonl"
+        if log_path.exists():
+            with open(log_path, encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        self._replay(json.loads(line))
+        self.free = sorted(set(range(self.rows)) - set(self.row_keys), reverse=True)
+        self._log = open(log_path, "a", encoding="utf-8")
+        self._map(vectors)
+
+    def _map(self, vectors: Path) -> None:
+        with open(vectors, "r+b") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0)
+        self._view = memoryview(self._mm).cast("f")
+        if np is not None:
+            self._matrix = np.frombuffer(self._mm, dtype=np.float32).reshape(
+                -1, self.dim
+            )
+
+    def _unmap(self) -> None:
+        self._matrix = None
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+
+    @property
+    def capacity(self) -> int:
+        return len(self._view) // self.dim if self._view is not None else 0
+
+    def _grow(self, rows: int) -> None:
+        capacity = max(self.capacity, _INITIAL_ROWS)
+        while capacity < rows:
+            capacity *= 2
+        self._unmap()
+        vectors = self.path / "vectors.f32"
+        with open(vectors, "r+b") as fh:
+            fh.truncate(capacity * self.dim * _ITEM)
+        self._map(vectors)
+
+    def _replay(self, entry: Dict[str, Any]) -> None:
+        row, key = entry["row"], entry["key"]
+        if entry.get("deleted"):
+            self._unassign(row)
+            return
+        self._unassign(row)
+        old = self.keys.get(key)
+        if old is not None and old != row:
+            self._unassign(old)
+        self._assign(row, key, entry.get("meta") or {})
+
+    def _write_log(self, entry: Dict[str, Any]) -> None:
+        assert self._log is not None
+        self._log.write(json.dumps(entry, default=str) + "\n")
+        self._log.flush()
+
+    # ------------------------------------------------------------------
+    # Row bookkeeping ---------------------------------------------------
+    # ------------------------------------------------------------------
+    def _assign(self, row: int, key: str, meta: Dict[str, Any]) -> None:
+        self.keys[key] = row
+        self.row_keys[row] = key
+        self.meta[row] = meta
+        self.rows = max(self.rows, row + 1)
+        for field, value in meta.items():
+            column = self.columns.setdefault(field, {})
+            for item in _index_values(value):
+                column.setdefault(item, set()).add(row)
+
+    def _unassign(self, row: int) -> None:
+        key = self.row_keys.pop(row, None)
+        if key is None:
+            return
+        self.keys.pop(key, None)
+        for field, value in self.meta.pop(row, {}).items():
+            column = self.columns.get(field, {})
+            for item in _index_values(value):
+                rows = column.get(item)
+                if rows is not None:
+                    rows.discard(row)
+                    if not rows:
+                        del column[item]
+        if self._lsh is not None:
+            for bucket in self._lsh.values():
+                bucket.discard(row)
+
+    def vector(self, row: int) -> List[float]:
+        return list(self._view[row * self.dim : (row + 1) * self.dim])
+
+    # ------------------------------------------------------------------
+    # Near-duplicate detection -------------------------------------------
+    # ------------------------------------------------------------------
+    def _signature(self, vec: List[float]) -> List[Tuple[int, int]]:
+        if self._planes is None:
+            rng = random.Random(self.dim)  # deterministic across processes
+            self._planes = [
+                [rng.gauss(0.0, 1.0) for _ in range(self.dim)]
+                for _ in range(_LSH_BANDS * _LSH_BITS)
+            ]
+        bits = [sum(p * x for p, x in zip(plane, vec)) >= 0.0 for plane in self._planes]
+        bands = []
+        for band in range(_LSH_BANDS):
+            code = 0
+            for bit in bits[band * _LSH_BITS : (band + 1) * _LSH_BITS]:
+                code = (code << 1) | bit
+            bands.append((band, code))
+        return bands
+
+    def _buckets(self) -> Dict[Tuple[int, int], Set[int]]:
+        if self._lsh is None:  # built lazily – only dedup upserts need it
+            self._lsh = {}
+            for row in self.row_keys:
+                for band in self._signature(self.vector(row)):
+                    self._lsh.setdefault(band, set()).add(row)
+        return self._lsh
+
+    def find_duplicate(self, vec: List[float], threshold: float) -> Optional[str]:
+        buckets = self._buckets()
+        candidates: Set[int] = set()
+        for band in self._signature(vec):
+            candidates |= buckets.get(band, set())
+        for row in candidates:
+            score = sum(a * b for a, b in zip(self.vector(row), vec))
+            if score >= threshold:
+                return self.row_keys[row]
+        return None
+
+    # ------------------------------------------------------------------
+    # Public operations -------------------------------------------------
+    # ------------------------------------------------------------------
+    def upsert(self, key: str, vec: List[float], meta: Dict[str, Any]) -> None:
+        row = self.keys.get(key)
+        if row is None:
+            row = self.free.pop() if self.free else self.rows
+        if row >= self.capacity:
+            self._grow(row + 1)
+        self._view[row * self.dim : (row + 1) * self.dim] = array("f", vec)
+        self._unassign(row)
+        self._assign(row, key, meta)
+        if self._lsh is not None:
+            for band in self._signature(vec):
+                self._lsh.setdefault(band, set()).add(row)
+        self._write_log({"row": row, "key": key, "meta": meta})
+
+    def delete(self, key: str) -> bool:
+        row = self.keys.get(key)
+        if row is None:
+            return False
+        self._unassign(row)
+        self.free.append(row)
+        self._write_log({"row": row, "key": key, "deleted": True})
+        return True
+
+    def candidates(self, filter: Optional[Dict[str, Any]]) -> List[int]:
+        if not filter:
+            return sorted(self.row_keys)
+        selected: Optional[Set[int]] = None
+        for field, wanted in filter.items():
+            column = self.columns.get(field, {})
+            values = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            rows: Set[int] = set()
+            for value in _index_values(values):
+                rows |= column.get(value, set())
+            selected = rows if selected is None else selected & rows
+            if not selected:
+                return []
+        return sorted(selected or ())
+
+    def search(
+        self, vec: List[float], k: int, filter: Optional[Dict[str, Any]]
+    ) -> List[Tuple[str, float]]:
+        rows = self.candidates(filter)
+        if not rows or k <= 0:
+            return []
+        if self._matrix is not None:
+            scores = self._matrix[rows] @ np.asarray(vec, dtype=np.float32)
+            top = np.argsort(-scores, kind="stable")[:k]
+            return [(self.row_keys[rows[i]], float(scores[i])) for i in top]
+        scored = [
+            (self.row_keys[row], sum(a * b for a, b in zip(self.vector(row), vec)))
+            for row in rows
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:k]
+
+    def close(self) -> None:
+        self._unmap()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+class FileVectorIndex:
+    """Scoped, model-versioned vector index persisted under *root*.
+
+    Args:
+        root: Directory holding one sub-directory per scope.
+        dedup_threshold: Cosine similarity at or above which ``dedup=True``
+            upserts are treated as duplicates of an existing row.
+
+    ``query`` searches the partition written most recently for the scope
+    unless *model_version* is given, so re-embedding a corpus with a new
+    model switches retrieval over once the first new vector lands.
+
+    The async methods run in a worker thread: partition files are read,
+    written and mapped there, and the index lock is never taken on the
+    event loop.
+    """
+
+    def __init__(self, root: str | Path, *, dedup_threshold: float = 0.995) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.dedup_threshold = dedup_threshold
+        self._partitions: Dict[Tuple[str, str], _Partition] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Partition management ----------------------------------------------
+    # ------------------------------------------------------------------
+    def _scope_dir(self, scope: str) -> Path:
+        return self.root / quote(scope, safe="")
+
+    def _partition(
+        self, scope: str, model_version: str, dim: Optional[int] = None
+    ) -> Optional[_Partition]:
+        part = self._partitions.get((scope, model_version))
+        if part is not None:
+            return part
+        path = self._scope_dir(scope) / quote(model_version, safe="")
+        info_path = path / "partition.json"
+        if info_path.exists():
+            info = json.loads(info_path.read_text(encoding="utf-8"))
+        elif dim is None:
+            return None
+        else:
+            path.mkdir(parents=True, exist_ok=True)
+            info = {"scope": scope, "model_version": model_version, "dim": dim}
+            info_path.write_text(json.dumps(info), encoding="utf-8")
+        part = self._partitions[(scope, model_version)] = _Partition(
+            path, int(info["dim"])
+        )
+        return part
+
+    def _active_version(self, scope: str) -> Optional[str]:
+        active = self._scope_dir(scope) / "ACTIVE"
+        if not active.exists():
+            return None
+        return active.read_text(encoding="utf-8").strip() or None
+
+    def _set_active(self, scope: str, model_version: str) -> None:
+        if self._active_version(scope) == model_version:
+            return
+        active = self._scope_dir(scope) / "ACTIVE"
+        tmp = active.with_suffix(".tmp")
+        tmp.write_text(model_version, encoding="utf-8")
+        os.replace(tmp, active)
+
+    # ------------------------------------------------------------------
+    # IVectorIndex ------------------------------------------------------
+    # ------------------------------------------------------------------
+    async def upsert(
+        self,
+        scope: str,
+        key: str,
+        embedding: List[float],
+        *,
+        model_version: str,
+        dedup: bool = False,
+        metadata: Dict[str, Any] | None = None,
+    ) -> None:
+        """Insert or replace *key* in the ``(scope, model_version)`` partition.
+
+        With *dedup* a new key whose vector nearly equals an existing row is
+        skipped (replacing an existing key is never skipped).
+        """
+
+        vec = _normalise(embedding)
+        meta = dict(metadata or {})
+
+        def _upsert() -> None:
+            with self._lock:
+                part = self._partition(scope, model_version, dim=len(vec))
+                assert part is not None
+                if len(vec) != part.dim:
+                    raise ValueError(
+                        f"embedding has {len(vec)} dimensions, partition "
+                        f"{scope!r}/{model_version!r} expects {part.dim}"
+                    )
+                if dedup and key not in part.keys:
+                    duplicate = part.find_duplicate(vec, self.dedup_threshold)
+                    if duplicate is not None:
+                        logger.debug(
+                            "Skipping %s in %s: near-duplicate of %s",
+                            key,
+                            scope,
+                            duplicate,
+                        )
+                        return
+                part.upsert(key, vec, meta)
+                self._set_active(scope, model_version)
+
+        await asyncio.to_thread(_upsert)
+
+    async def query(
+        self,
+        scope: str,
+        embedding: List[float],
+        *,
+        k: int = 5,
+        filter: Dict[str, Any] | None = None,
+        model_version: str | None = None,
+    ) -> List[Tuple[str, float]]:
+        """Top-*k* ``(key, cosine)`` pairs in *scope* matching *filter*.
+
+        *filter* maps metadata fields to a value or a list of accepted
+        values; list-valued metadata matches when any item is accepted.
+        """
+
+        vec = _normalise(embedding)
+
+        def _search() -> List[Tuple[str, float]]:
+            version = model_version or self._active_version(scope)
+            if version is None:
+                return []
+            with self._lock:
+                part = self._partition(scope, version)
+                if part is None:
+                    return []
+                if len(vec) != part.dim:
+                    raise ValueError(
+                        f"query has {len(vec)} dimensions, partition "
+                        f"{scope!r}/{version!r} expects {part.dim}"
+                    )
+                return part.search(vec, k, filter)
+
+        return await asyncio.to_thread(_search)
+
+    # ------------------------------------------------------------------
+    # Maintenance -------------------------------------------------------
+    # ------------------------------------------------------------------
+    async def delete(
+        self, scope: str, key: str, *, model_version: str | None = None
+    ) -> bool:
+        """Remove *key* from *scope*; returns ``False`` when it was absent."""
+
+        def _delete() -> bool:
+            version = model_version or self._active_version(scope)
+            with self._lock:
+                part = self._partition(scope, version) if version else None
+                return part.delete(key) if part is not None else False
+
+        return await asyncio.to_thread(_delete)
+
+    def count(self, scope: str, *, model_version: str | None = None) -> int:
+        version = model_version or self._active_version(scope)
+        with self._lock:
+            part = self._partition(scope, version) if version else None
+            return len(part.keys) if part is not None else 0
+
+    def model_versions(self, scope: str) -> List[str]:
+        """Model versions with a partition in *scope*."""
+
+        scope_dir = self._scope_dir(scope)
+        if not scope_dir.is_dir():
+            return []
+        return sorted(
+            json.loads((p / "partition.json").read_text(encoding="utf-8"))[
+                "model_version"
+            ]
+            for p in scope_dir.iterdir()
+            if (p / "partition.json").exists()
+        )
+
+    def close(self) -> None:
+        """Flush and unmap every open partition."""
+
+        with self._lock:
+            for part in self._partitions.values():
+                part.close()
+            self._partitions.clear()
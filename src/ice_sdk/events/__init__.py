@@ -7,13 +7,27 @@ introducing tight coupling or blocking IO.
 
 from __future__ import annotations
 
-from .dispatcher import Subscriber, publish, subscribe  # – re-export
+from .dispatcher import (  # – re-export
+    OverflowPolicy,
+    Subscriber,
+    Subscription,
+    drain,
+    get_metrics,
+    publish,
+    subscribe,
+    unsubscribe,
+)
 from .models import CLICommandEvent, EventEnvelope  # – re-export
 
 __all__ = [
     "CLICommandEvent",
     "EventEnvelope",
+    "OverflowPolicy",
+    "Subscription",
+    "drain",
+    "get_metrics",
     "publish",
     "subscribe",
+    "unsubscribe",
     "Subscriber",
 ]
@@ -1,47 +1,275 @@
 """Minimal async event dispatcher used by iceOS CLI & runtime.
 
 Design goals:
-1. **Non-blocking** – publishes never block callers; callbacks are scheduled via
-   ``asyncio.create_task``.
-2. **In-process** – no external broker; suitable for unit tests and simple
+1. **Bounded** – every subscriber owns a bounded queue drained by a single
+   worker task, so bursts never pile up unbounded pending tasks and every
+   task is referenced until it finishes.
+2. **Back-pressure** – when a subscriber's queue is full the overflow policy
+   decides: ``BLOCK`` makes ``publish`` wait for room, ``DROP_NEWEST`` /
+   ``DROP_OLDEST`` discard (and count) events instead.
+3. **In-process** – no external broker; suitable for unit tests and simple
    extensions like WebhookEmitterTool.
-3. **Tiny surface** – just ``subscribe`` and ``publish`` so we can replace it
-   later with a more powerful bus without large refactors.
+4. **Tiny surface** – ``subscribe`` and ``publish`` plus ``drain`` /
+   ``get_metrics`` for tests and dashboards.
+
+Subscribers that opt into batching receive a ``list`` of envelopes::
+
+    async def flush(batch: list[EventEnvelope]) -> None: ...
+
+    subscribe("cli.command", flush, batch_size=50, batch_timeout=0.2)
 """
 
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import defaultdict
-from typing import Awaitable, Callable, Dict, List
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
 from .models import EventEnvelope
 
+__all__ = [
+    "OverflowPolicy",
+    "Subscriber",
+    "Subscription",
+    "SubscriberMetrics",
+    "subscribe",
+    "unsubscribe",
+    "publish",
+    "drain",
+    "get_metrics",
+]
+
 Subscriber = Callable[[EventEnvelope], Awaitable[None]]
+BatchSubscriber = Callable[[List[EventEnvelope]], Awaitable[None]]
+
+DEFAULT_MAX_QUEUE = 1000
+
+
+class OverflowPolicy(str, Enum):
+    """What ``publish`` does when a subscriber queue is full."""
+
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+
+@dataclass
+class SubscriberMetrics:
+    """Delivery counters for one subscription."""
+
+    delivered: int = 0
+    dropped: int = 0
+    failed: int = 0
+    max_depth: int = 0
+    # Enqueue → callback completion, in seconds
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def latency_avg(self) -> float:
+        return self.latency_total / self.delivered if self.delivered else 0.0
+
+
+@dataclass(eq=False)
+class Subscription:
+    """A callback plus its bounded queue and worker."""
+
+    event_name: str
+    callback: Callable[[Any], Awaitable[None]]
+    max_queue: int = DEFAULT_MAX_QUEUE
+    policy: OverflowPolicy = OverflowPolicy.BLOCK
+    batch_size: Optional[int] = None
+    batch_timeout: float = 0.05
+    metrics: SubscriberMetrics = field(default_factory=SubscriberMetrics)
+
+    _queue: Optional["asyncio.Queue[Tuple[float, EventEnvelope]]"] = field(
+        default=None, repr=False
+    )
+    _worker: Optional["asyncio.Task[None]"] = field(default=None, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False)
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    # ------------------------------------------------------------------
+    # Producer side -----------------------------------------------------
+    # ------------------------------------------------------------------
+
+    async def offer(self, envelope: EventEnvelope) -> None:
+        queue = self._ensure_worker()
+        item = (time.perf_counter(), envelope)
+        if self.policy is OverflowPolicy.BLOCK:
+            await queue.put(item)
+        else:
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                if self.policy is OverflowPolicy.DROP_OLDEST:
+                    queue.get_nowait()
+                    queue.task_done()
+                    queue.put_nowait(item)
+                self.metrics.dropped += 1
+        depth = queue.qsize()
+        if depth > self.metrics.max_depth:
+            self.metrics.max_depth = depth
+
+    def _ensure_worker(self) -> "asyncio.Queue[Tuple[float, EventEnvelope]]":
+        loop = asyncio.get_running_loop()
+        worker = self._worker
+        stale = self._queue is None or self._loop is not loop
+        if stale or worker is None or worker.done():
+            # First use, a new event loop (queues are loop-bound) or a dead worker.
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue  # type: ignore[return-value]
+
+    # ------------------------------------------------------------------
+    # Consumer side -----------------------------------------------------
+    # ------------------------------------------------------------------
+
+    async def _run(self, queue: "asyncio.Queue[Tuple[float, EventEnvelope]]") -> None:
+        while True:
+            batch = [await queue.get()]
+            if self.batch_size:
+                deadline = time.perf_counter() + self.batch_timeout
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            try:
+                await self._deliver(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _deliver(self, batch: List[Tuple[float, EventEnvelope]]) -> None:
+        try:
+            if self.batch_size:
+                await self.callback([env for _, env in batch])
+            else:
+                await self.callback(batch[0][1])
+        except Exception:
+            # Subscriber errors never propagate to publishers.
+            self.metrics.failed += len(batch)
+            return
+        now = time.perf_counter()
+        m = self.metrics
+        for enqueued, _ in batch:
+            latency = now - enqueued
+            m.latency_total += latency
+            if latency > m.latency_max:
+                m.latency_max = latency
+        m.delivered += len(batch)
+
+    async def join(self) -> None:
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+        self._worker = None
+        self._queue = None
+
 
 # Internal registry ---------------------------------------------------------
-_subscribers: Dict[str, List[Subscriber]] = defaultdict(list)
+_subscribers: Dict[str, List[Subscription]] = defaultdict(list)
 
 
-def subscribe(event_name: str, callback: Subscriber) -> None:
-    """Register *callback* for *event_name*."""
+def subscribe(
+    event_name: str,
+    callback: Subscriber | BatchSubscriber,
+    *,
+    max_queue: int = DEFAULT_MAX_QUEUE,
+    policy: OverflowPolicy | str = OverflowPolicy.BLOCK,
+    batch_size: Optional[int] = None,
+    batch_timeout: float = 0.05,
+) -> Subscription:
+    """Register *callback* for *event_name*.
 
-    _subscribers[event_name].append(callback)
+    Args:
+        max_queue: Capacity of the subscriber's queue.
+        policy: Overflow behaviour once the queue is full.
+        batch_size: When set, *callback* receives lists of up to this many
+            envelopes, collected for at most *batch_timeout* seconds.
+    """
+
+    if max_queue < 1:
+        raise ValueError("max_queue must be >= 1")
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    sub = Subscription(
+        event_name=event_name,
+        callback=callback,
+        max_queue=max_queue,
+        policy=OverflowPolicy(policy),
+        batch_size=batch_size,
+        batch_timeout=batch_timeout,
+    )
+    _subscribers[event_name].append(sub)
+    return sub
+
+
+def unsubscribe(subscription: Subscription) -> None:
+    """Remove *subscription* and stop its worker (queued events are dropped)."""
+
+    subs = _subscribers.get(subscription.event_name, [])
+    if subscription in subs:
+        subs.remove(subscription)
+    subscription.close()
 
 
 async def publish(event_name: str, payload: BaseModel) -> None:
-    """Publish *payload* under *event_name* without blocking the caller."""
+    """Publish *payload* under *event_name*.
+
+    Returns once the event is queued for every subscriber; only waits when a
+    ``BLOCK`` subscriber's queue is full.
+    """
 
+    subs = _subscribers.get(event_name)
+    if not subs:
+        return
     envelope = EventEnvelope(name=event_name, payload=payload)
+    for sub in list(subs):
+        await sub.offer(envelope)
 
-    for cb in list(_subscribers.get(event_name, [])):
 
-        async def _run_callback(callback: Subscriber, env: EventEnvelope) -> None:
-            try:
-                await callback(env)
-            except Exception:
-                pass
+async def drain() -> None:
+    """Wait until every queued event has been handled."""
+
+    for subs in list(_subscribers.values()):
+        for sub in list(subs):
+            await sub.join()
+
+
+def get_metrics() -> Dict[str, List[Dict[str, Any]]]:
+    """Return queue depth, drop and latency metrics per event name."""
 
-        asyncio.create_task(_run_callback(cb, envelope))
+    out: Dict[str, List[Dict[str, Any]]] = {}
+    for event_name, subs in _subscribers.items():
+        out[event_name] = [
+            {
+                "callback": getattr(sub.callback, "__qualname__", repr(sub.callback)),
+                "policy": sub.policy.value,
+                "depth": sub.depth,
+                "max_depth": sub.metrics.max_depth,
+                "delivered": sub.metrics.delivered,
+                "dropped": sub.metrics.dropped,
+                "failed": sub.metrics.failed,
+                "latency_avg": sub.metrics.latency_avg,
+                "latency_max": sub.metrics.latency_max,
+            }
+            for sub in subs
+        ]
+    return out
@@ -15,6 +15,7 @@ class IVectorIndex(Protocol):
         *,
         model_version: str,
         dedup: bool = False,
+        metadata: Dict[str, Any] | None = None,
     ) -> None: ...
 
     async def query(
@@ -24,4 +25,5 @@ class IVectorIndex(Protocol):
         *,
         k: int = 5,
         filter: Dict[str, Any] | None = None,
+        model_version: str | None = None,
     ) -> List[Tuple[str, float]]: ...
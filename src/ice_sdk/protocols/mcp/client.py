@@ -5,18 +5,23 @@ Example::
     from ice_core.models.mcp import Blueprint, NodeSpec
     from ice_sdk.protocols.mcp.client import MCPClient
 
-    client = MCPClient()
-    bp = Blueprint(nodes=[NodeSpec(id="echo", type="tool", command="echo hi")])
-    ack = await client.create_blueprint(bp)
-    run = await client.start_run(blueprint_id=ack.blueprint_id)
-    result = await client.await_result(run.run_id)
+    async with MCPClient() as client:
+        bp = Blueprint(nodes=[NodeSpec(id="echo", type="tool", command="echo hi")])
+        ack = await client.create_blueprint(bp)
+        run = await client.start_run(blueprint_id=ack.blueprint_id)
+        result = await client.await_result(run.run_id)
+
+The client keeps one pooled ``httpx.AsyncClient`` for its lifetime (close it
+with ``aclose()`` or use it as an async context manager).  ``await_result``
+subscribes to the run's SSE stream and falls back to server-side long-polling
+(``GET /runs/{id}?wait=``) – no fixed-interval polling.
 """
 
 from __future__ import annotations
 
 import asyncio
 import os
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 
@@ -24,21 +29,102 @@ from ice_core.models.mcp import Blueprint, BlueprintAck, RunAck, RunRequest, Run
 
 __all__ = ["MCPClient"]
 
+_API_PREFIX = "/api/v1/mcp"
+
+
+def _sse_field(line: str) -> Tuple[str, str]:
+    name, _, value = line.partition(":")
+    return name, value[1:] if value.startswith(" ") else value
+
+
+async def _iter_sse_events(
+    lines: AsyncIterator[str],
+) -> AsyncIterator[Tuple[str, str]]:
+    """Yield ``(event, data)`` per Server-Sent Events message.
+
+    Fields accumulate until a blank line dispatches the message; the event
+    name defaults to ``message``.  A message whose data is itself a framed
+    ``event:``/``data:`` block (servers that hand pre-formatted strings to
+    *sse_starlette*) is unwrapped.
+    """
+
+    event, data = "", []
+    async for raw in lines:
+        line = raw.rstrip("\r")
+        if line:
+            if line.startswith(":"):
+                continue  # comment / keep-alive ping
+            name, value = _sse_field(line)
+            if name == "event":
+                event = value
+            elif name == "data":
+                data.append(value)
+            continue
+        if not event and not data:
+            continue
+        payload = "\n".join(data)
+        if not event and payload.startswith("event:"):
+            fields = [_sse_field(inner) for inner in payload.splitlines()]
+            event = next((v for k, v in fields if k == "event"), "")
+            payload = "\n".join(v for k, v in fields if k == "data")
+        yield event or "message", payload
+        event, data = "", []
+
 
 class MCPClient:  # – thin wrapper
-    def __init__(self, base_url: str | None = None, *, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        *,
+        timeout: float = 30.0,
+        long_poll: float = 25.0,
+        max_connections: int = 20,
+    ) -> None:
         self.base_url = base_url or os.getenv("ICEOS_API", "http://localhost:8000")
         self.timeout = timeout
+        # Seconds the server may hold a ``GET /runs/{id}?wait=`` request open.
+        self.long_poll = long_poll
+        self.max_connections = max_connections
+        self._client: httpx.AsyncClient | None = None
+
+    # ------------------------------------------------------------------
+    # Connection lifecycle ----------------------------------------------
+    # ------------------------------------------------------------------
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Shared, lazily created connection pool."""
+
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "MCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     # ------------------------------------------------------------------
     # Blueprint helpers -------------------------------------------------
     # ------------------------------------------------------------------
     async def create_blueprint(self, blueprint: Blueprint) -> BlueprintAck:
-        url = f"{self.base_url}/api/v1/mcp/blueprints"
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.post(url, json=blueprint.model_dump(mode="json"))
-            resp.raise_for_status()
-            return BlueprintAck.model_validate(resp.json())
+        resp = await self.http.post(
+            f"{_API_PREFIX}/blueprints", json=blueprint.model_dump(mode="json")
+        )
+        resp.raise_for_status()
+        return BlueprintAck.model_validate(resp.json())
 
     # ------------------------------------------------------------------
     # Run helpers -------------------------------------------------------
@@ -57,24 +143,107 @@ class MCPClient:  # – thin wrapper
             blueprint=blueprint,
             options=RunOptions(max_parallel=max_parallel),
         )
-        url = f"{self.base_url}/api/v1/mcp/runs"
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.post(url, json=req.model_dump(mode="json"))
-            resp.raise_for_status()
-            return RunAck.model_validate(resp.json())
-
-    async def get_result(self, run_id: str) -> Optional[RunResult]:
-        url = f"{self.base_url}/api/v1/mcp/runs/{run_id}"
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(url, params={"wait": False})
-            if resp.status_code == 202:
-                return None
-            resp.raise_for_status()
-            return RunResult.model_validate(resp.json())
-
-    async def await_result(self, run_id: str, poll_interval: float = 0.5) -> RunResult:
+        resp = await self.http.post(
+            f"{_API_PREFIX}/runs", json=req.model_dump(mode="json")
+        )
+        resp.raise_for_status()
+        return RunAck.model_validate(resp.json())
+
+    async def get_result(
+        self, run_id: str, *, wait: float = 0.0
+    ) -> Optional[RunResult]:
+        """Fetch the result; with *wait* > 0 the server long-polls that long."""
+
+        resp = await self.http.get(
+            f"{_API_PREFIX}/runs/{run_id}",
+            params={"wait": wait},
+            # The read must outlast the server-side hold.
+            timeout=httpx.Timeout(self.timeout, read=wait + self.timeout),
+        )
+        if resp.status_code == 202:
+            return None
+        resp.raise_for_status()
+        return RunResult.model_validate(resp.json())
+
+    async def await_result(
+        self,
+        run_id: str,
+        poll_interval: float | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> RunResult:
+        """Wait for *run_id* to finish and return its result.
+
+        Completion is detected via the run's SSE event stream, falling back
+        to long-poll requests.  *poll_interval* is accepted for backwards
+        compatibility and ignored.
+        """
+
+        return await asyncio.wait_for(self._await_result(run_id), timeout)
+
+    async def _await_result(self, run_id: str) -> RunResult:
+        res = await self.get_result(run_id)
+        if res is not None:
+            return res
+        if await self._wait_for_finished_event(run_id):
+            res = await self.get_result(run_id, wait=self.long_poll)
+            if res is not None:
+                return res
         while True:
-            res = await self.get_result(run_id)
+            res = await self.get_result(run_id, wait=self.long_poll)
             if res is not None:
                 return res
-            await asyncio.sleep(poll_interval)
+
+    async def _wait_for_finished_event(self, run_id: str) -> bool:
+        """Block on the SSE stream until ``workflow.finished``.
+
+        Returns *False* when the stream is unavailable or ends early so the
+        caller can fall back to long-polling.
+        """
+
+        try:
+            async with self.http.stream(
+                "GET",
+                f"{_API_PREFIX}/runs/{run_id}/events",
+                timeout=httpx.Timeout(self.timeout, read=None),
+            ) as resp:
+                if resp.status_code != 200:
+                    return False
+                async for event, _ in _iter_sse_events(resp.aiter_lines()):
+                    if event == "workflow.finished":
+                        return True
+        except httpx.HTTPError:
+            return False
+        return False
+
+    # ------------------------------------------------------------------
+    # Batch helpers -----------------------------------------------------
+    # ------------------------------------------------------------------
+    async def start_runs(
+        self, runs: Sequence[Dict[str, Any]], *, concurrency: int | None = None
+    ) -> List[RunAck]:
+        """Submit many runs concurrently over the shared pool.
+
+        Each item holds :meth:`start_run` keyword arguments.  Acks are
+        returned in input order.
+        """
+
+        sem = asyncio.Semaphore(concurrency or self.max_connections)
+
+        async def _one(kwargs: Dict[str, Any]) -> RunAck:
+            async with sem:
+                return await self.start_run(**kwargs)
+
+        return list(await asyncio.gather(*(_one(kw) for kw in runs)))
+
+    async def await_results(
+        self, run_ids: Sequence[str], *, timeout: float | None = None
+    ) -> List[RunResult]:
+        """Await several runs at once; results are returned in input order."""
+
+        return list(
+            await asyncio.wait_for(
+                asyncio.gather(*(self._await_result(rid) for rid in run_ids)),
+                timeout,
+            )
+        )
@@ -13,10 +13,13 @@ backwards-compatibility.
 
 import asyncio
 import logging
-from typing import Any, Optional, Tuple
+from typing import Any, Optional, Tuple, Union
 
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from ice_core.models.model_registry import get_alternate_model, get_model_info
+from ice_core.utils.deadline import clamp_timeout
+from ice_core.utils.hedging import HedgePolicy, get_hedger
 from ice_sdk.models.config import LLMConfig, ModelProvider
 from ice_sdk.providers.llm_providers.anthropic_handler import AnthropicHandler
 from ice_sdk.providers.llm_providers.base_handler import BaseLLMHandler
@@ -39,6 +42,8 @@ except Exception:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+_Result = Tuple[str, Optional[dict[str, int]], Optional[str]]
+
 
 class LLMService:
     """High-level helper for synchronous/asynchronous LLM calls.
@@ -48,11 +53,27 @@ class LLMService:
 
     • Automatic provider dispatch based on ``LLMConfig.provider``.
     • Built-in retries with exponential backoff (via *tenacity*).
-    • An optional global timeout that wraps the entire request.
+    • An optional global timeout that wraps the entire request, capped at the
+      caller's remaining deadline (see :mod:`ice_core.utils.deadline`).
     • Error-capture semantics: instead of raising, return ``(text, usage, error)``.
+    • Opt-in request hedging (*hedge*): when a call is slower than the policy's
+      latency percentile for that provider/model, a backup request is issued
+      – optionally to *hedge_model* (a model id, or ``"auto"`` for an
+      alternate from the model registry) – and the first successful response
+      wins.  Shared counters are available from
+      :func:`ice_core.utils.hedging.hedging_metrics` under ``"llm"``.  The
+      losing request is billed as well, so its tokens are added to the
+      returned *usage* and ``usage["api_calls"]`` becomes ``2``.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        hedge: Optional[HedgePolicy] = None,
+        hedge_model: Optional[str] = None,
+    ) -> None:
+        self.hedge = hedge
+        self.hedge_model = hedge_model
         self.handlers = {
             ModelProvider.OPENAI: OpenAIHandler(),
             ModelProvider.ANTHROPIC: AnthropicHandler(),
@@ -67,10 +88,20 @@ class LLMService:
         context: Optional[dict[str, Any]] = None,
         tools: Optional[list[dict[str, Any]]] = None,
         *,
-        timeout_seconds: Optional[int] = 30,
+        timeout_seconds: Optional[float] = 30,
         max_retries: int = 2,
+        hedge: Union[HedgePolicy, bool, None] = None,
     ) -> Tuple[str, Optional[dict[str, int]], Optional[str]]:
-        """Return *(text, usage, error)* from the configured LLM provider."""
+        """Return *(text, usage, error)* from the configured LLM provider.
+
+        *hedge* overrides the service default: a policy (or ``True`` for the
+        default policy) enables hedging for this call, ``False`` disables it.
+        """
+
+        # Never outlive the enclosing node / chain deadline.
+        timeout_seconds = clamp_timeout(timeout_seconds)
+        if timeout_seconds is not None and timeout_seconds <= 0:
+            return "", None, "Deadline exceeded"
 
         # Map provider to enum constant when supplied as raw string
         provider_key: ModelProvider
@@ -123,6 +154,38 @@ class LLMService:
                 logger.error("LLM handler raised unexpected exception", exc_info=True)
                 return "", None, str(err)
 
+        policy: Optional[HedgePolicy]
+        if hedge is None:
+            policy = self.hedge
+        elif isinstance(hedge, bool):
+            policy = (self.hedge or HedgePolicy()) if hedge else None
+        else:
+            policy = hedge
+        backup_config = self._hedge_config(llm_config) if policy else None
+        # Result of every call the hedger started (``None`` until it settles).
+        issued: list[Optional[_Result]] = []
+
+        async def _track(call: Any) -> _Result:
+            slot = len(issued)
+            issued.append(None)
+            result_inner = await call()
+            issued[slot] = result_inner
+            return result_inner
+
+        async def _call_backup() -> (
+            Tuple[str, Optional[dict[str, int]], Optional[str]]
+        ):
+            assert backup_config is not None
+            return await self.generate(
+                backup_config,
+                prompt,
+                context,
+                tools,
+                timeout_seconds=None,
+                max_retries=0,
+                hedge=False,
+            )
+
         @retry(
             stop=stop_after_attempt(max_retries + 1),
             wait=wait_exponential(multiplier=1, min=1, max=10),
@@ -131,7 +194,20 @@ class LLMService:
         async def _call_with_retry() -> (
             Tuple[str, Optional[dict[str, int]], Optional[str]]
         ):
-            return await _call_handler()
+            if not policy:
+                return await _call_handler()
+            issued.clear()
+            result_hedged = await get_hedger("llm").run(
+                f"{provider_key.value}:{llm_config.model}",
+                lambda: _track(_call_handler),
+                lambda: _track(
+                    _call_backup if backup_config is not llm_config else _call_handler
+                ),
+                accept=lambda result: result[2] is None,
+                policy=policy,
+            )
+            usage = _hedged_usage(result_hedged, issued)
+            return result_hedged[0], usage, result_hedged[2]
 
         try:
             if timeout_seconds is None:
@@ -153,9 +229,49 @@ class LLMService:
             return "", None, str(err)
         except asyncio.TimeoutError:
             logger.warning(
-                "LLM request exceeded overall timeout of %s seconds", timeout_seconds
+                "LLM request exceeded overall timeout of %.3f seconds", timeout_seconds
             )
             return "", None, "Request timed out"
         except Exception as err:  # pylint: disable=broad-except
             logger.error("Unhandled exception in LLMService.generate", exc_info=True)
             return "", None, str(err)
+
+    def _hedge_config(self, llm_config: LLMConfig) -> LLMConfig:
+        """Config for hedged backup requests (same model unless configured)."""
+
+        if not self.hedge_model or not llm_config.model:
+            return llm_config
+        if self.hedge_model == "auto":
+            alternate = get_alternate_model(llm_config.model)
+            if alternate is None:
+                return llm_config
+            model, provider = alternate.id, alternate.provider
+        else:
+            info = get_model_info(self.hedge_model)
+            model = self.hedge_model
+            provider = info.provider if info is not None else llm_config.provider
+        return llm_config.model_copy(update={"model": model, "provider": provider})
+
+
+def _hedged_usage(
+    result: _Result, issued: list[Optional[_Result]]
+) -> Optional[dict[str, int]]:
+    """Usage of the hedged *result* plus the losing request in *issued*.
+
+    A cancelled loser has no usage report although it was already sent (and
+    is billed), so it is charged like the winner.
+    """
+
+    usage = result[1]
+    if len(issued) < 2 or usage is None:
+        return usage
+    loser = next((r for r in issued if r is not result), result)
+    extra = usage if loser is None else loser[1]
+    if extra is None:  # failed without reaching the model
+        return usage
+    merged = {
+        key: usage.get(key, 0) + extra.get(key, 0)
+        for key in ("prompt_tokens", "completion_tokens", "total_tokens")
+    }
+    merged["api_calls"] = 2
+    return {**usage, **merged}
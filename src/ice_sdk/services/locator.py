@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import asyncio
 from threading import Lock
-from typing import Any, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Type
 
 from pydantic import BaseModel, ValidationError
 
@@ -118,6 +118,8 @@ class ServiceLocator:  # – simple registry
     """Very small global registry mapping *service names* to instances."""
 
     _services: Dict[str, Any] = {}
+    # name -> zero-arg factory resolved (and replaced) on first ``get``
+    _lazy: Dict[str, Callable[[], Any]] = {}
     _lock: Lock = Lock()
 
     # ------------------------------------------------------------------ API
@@ -129,8 +131,20 @@ class ServiceLocator:  # – simple registry
         lifecycle so this is intentional.
         """
         with cls._lock:
+            cls._lazy.pop(name, None)
             cls._services[name] = service
 
+    @classmethod
+    def register_lazy(cls, name: str, factory: Callable[[], Any]) -> None:
+        """Register *factory* to build the service under *name* on first use.
+
+        Lets higher layers advertise implementations without importing them
+        at package import time.
+        """
+        with cls._lock:
+            cls._services.pop(name, None)
+            cls._lazy[name] = factory
+
     @classmethod
     def get(cls, name: str) -> Any:
         """Return a previously registered service.
@@ -139,13 +153,23 @@ class ServiceLocator:  # – simple registry
         """
         try:
             return cls._services[name]
-        except KeyError as exc:  # pragma: no cover – programmer error
-            raise KeyError(
-                f"Service '{name}' not registered in ServiceLocator"
-            ) from exc
+        except KeyError as exc:
+            factory = cls._lazy.get(name)
+            if factory is None:  # pragma: no cover – programmer error
+                raise KeyError(
+                    f"Service '{name}' not registered in ServiceLocator"
+                ) from exc
+        service = factory()
+        with cls._lock:
+            # A concurrent ``register`` wins over the lazy binding.
+            if cls._lazy.get(name) is factory:
+                del cls._lazy[name]
+                cls._services[name] = service
+            return cls._services.get(name, service)
 
     @classmethod
     def clear(cls) -> None:  # – test helper
         """Remove **all** registered services (useful in unit tests)."""
         with cls._lock:
             cls._services.clear()
+            cls._lazy.clear()
@@ -4,14 +4,15 @@ from ..utils.errors import SkillExecutionError
 from .base import SkillBase, ToolContext, function_tool
 from .registry import SkillRegistry, global_skill_registry
 
-# Domain skills -------------------------------------------------------------
-from .web.search_skill import WebSearchSkill  # – default registration
-
 # ---------------------------------------------------------------------------
 # Default skill registrations – executed on package import -------------------
 # ---------------------------------------------------------------------------
+# Registered as import paths so the web stack (httpx etc.) only loads when the
+# skill is first requested.
 try:
-    global_skill_registry.register("web_search", WebSearchSkill())
+    global_skill_registry.register_factory(
+        "web_search", "ice_sdk.skills.web.search_skill:WebSearchSkill"
+    )
 except Exception:  # pragma: no cover
     # Registration failures should not break import; logged by registry.
     pass
@@ -6,13 +6,15 @@ It includes the base Skill class, metadata structures, and common utilities.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, ClassVar, Dict, Optional, Type
 
 from pydantic import BaseModel, ConfigDict
 
 from ice_sdk.providers.costs import CostTracker
 from ice_sdk.utils.hashing import stable_hash
 
+from .execution import ExecutionClass
+
 # ---------------------------------------------------------------------------
 # Metadata structures --------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -59,12 +61,38 @@ class SkillBase(BaseModel):
         "required": [],
     }
 
+    # Instance lifecycle hints consumed by :class:`ice_sdk.skills.pool.SkillPool`.
+    # Stateless skills are shared as a single warm instance; skills that keep
+    # per-call state on ``self`` must opt into pooling via ``stateful = True``.
+    stateful: ClassVar[bool] = False
+    max_pool_size: ClassVar[int] = 4
+    # Where ToolService runs ``execute`` – see :mod:`ice_sdk.skills.execution`.
+    execution_class: ClassVar[ExecutionClass] = ExecutionClass.ASYNC
+
     def __init__(self) -> None:
         # CircuitBreaker is a **no-op** stub for now, but keeping the interface
         # in place allows later drop-in of a real implementation without
         # touching call-sites.
         pass
 
+    # ------------------------------------------------------------------
+    # Lifecycle hooks ---------------------------------------------------
+    # ------------------------------------------------------------------
+
+    async def setup(self) -> None:
+        """Acquire expensive resources (clients, compiled models, ...).
+
+        Called once per instance by :class:`~ice_sdk.skills.pool.SkillPool`
+        before the instance serves its first request.  The default is a no-op.
+        """
+
+    async def teardown(self) -> None:
+        """Release resources acquired in :meth:`setup`.
+
+        Called when the owning pool is closed or an instance is evicted after
+        a failed execution.  The default is a no-op.
+        """
+
     # ------------------------------------------------------------------
     # Structured representation for LLM function-calling ----------------
     # ------------------------------------------------------------------
@@ -229,6 +257,7 @@ def _build_function_tool(
     name: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
+    execution_class: ExecutionClass | str | None = None,
 ) -> Type[SkillBase]:
     """Build a *SkillBase* subclass that delegates to *func*.
 
@@ -237,15 +266,26 @@ def _build_function_tool(
     the *@function_tool* decorator to create test-friendly tool implementations.
     """
 
+    import inspect
+
     _name = name or func.__name__
     _description = description or (func.__doc__ or "")
     _tags = tags or []
+    if execution_class is None:
+        _exec_class = (
+            ExecutionClass.ASYNC
+            if inspect.iscoroutinefunction(func)
+            else ExecutionClass.IO_THREAD
+        )
+    else:
+        _exec_class = ExecutionClass(execution_class)
 
     # Dynamically build a trivial class with ``run`` delegating to *func*.
     class _FunctionTool(SkillBase):  # pylint: disable=too-few-public-methods
         name: str = _name
         description: str = _description
         tags: tuple[str, ...] = tuple(_tags)  # type: ignore[assignment]
+        execution_class: ClassVar[ExecutionClass] = _exec_class
 
         # NB: We purposefully **do not** call ``SkillBase.execute`` here – the
         # GraphContextManager invokes ``run`` directly.  We support both sync
@@ -253,9 +293,14 @@ def _build_function_tool(
 
         async def run(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:  # type: ignore[override,no-untyped-def]
             import asyncio  # local import to keep global footprint low
-            import inspect
 
-            if inspect.iscoroutinefunction(func):
+            if _exec_class is ExecutionClass.CPU_PROCESS:
+                from .execution import run_callable_in_process
+
+                # *ctx* holds a process-local ToolContext – never ship it.
+                kwargs.pop("ctx", None)
+                res = await run_callable_in_process(func, *args, **kwargs)
+            elif inspect.iscoroutinefunction(func):
                 res = await func(*args, **kwargs)
             else:
                 # Execute sync function in thread-friendly executor to avoid
@@ -282,12 +327,14 @@ def function_tool(
     name_override: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
+    execution_class: ExecutionClass | str | None = None,
 ) -> Callable[[Callable[..., Any]], Type[SkillBase]]:
     """Decorator that converts a function into a *SkillBase* subclass.
 
     This decorator is used primarily for testing and prototyping.  It creates
     a minimal *SkillBase* implementation that delegates execution to the
-    decorated function.
+    decorated function.  Pass ``execution_class="cpu_process"`` for CPU-heavy
+    module-level functions so they run in the shared process pool.
 
     Examples
     --------
@@ -301,7 +348,11 @@ def function_tool(
 
     def decorator(func: Callable[..., Any]) -> Type[SkillBase]:
         return _build_function_tool(
-            func, name=name_override, description=description, tags=tags
+            func,
+            name=name_override,
+            description=description,
+            tags=tags,
+            execution_class=execution_class,
         )
 
     return decorator
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, ClassVar, Dict
 
-from jsonschema import Draft7Validator  # type: ignore
+from ice_core.utils.schema_cache import compile_schema
 
 from ...utils.errors import SkillExecutionError
 from ..base import SkillBase
@@ -26,19 +26,21 @@ class SchemaValidatorSkill(SkillBase):
         schema: Dict[str, Any] | None = None,
         data: Any | None = None,
         input_data: Dict[str, Any] | None = None,
+        fail_fast: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         if input_data is not None:
             schema = schema or input_data.get("schema")  # type: ignore[assignment]
             data = data or input_data.get("data")  # type: ignore[assignment]
+            fail_fast = bool(input_data.get("fail_fast", fail_fast))
         if not isinstance(schema, dict):
             raise SkillExecutionError("'schema' must be object")
         if data is None:
             raise SkillExecutionError("'data' required")
 
-        validator = Draft7Validator(schema)
-        errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
-        if errors:
-            msgs = [e.message for e in errors]
+        # Compiled validators are cached by schema hash; *fail_fast* stops at
+        # the first violation instead of collecting and sorting all of them.
+        msgs = compile_schema(schema).errors(data, fail_fast=fail_fast)
+        if msgs:
             return {"valid": False, "errors": msgs}
         return {"valid": True}
@@ -0,0 +1,362 @@
+"""Execution classes and the managed process pool for CPU-bound skills.
+
+Skills declare *how* they should be run via the ``execution_class`` class
+attribute:
+
+* ``ExecutionClass.ASYNC`` – awaited directly on the event loop (default).
+* ``ExecutionClass.IO_THREAD`` – blocking I/O; run in the default thread pool.
+* ``ExecutionClass.CPU_PROCESS`` – CPU-heavy work; dispatched to a shared
+  :class:`~concurrent.futures.ProcessPoolExecutor` so it scales across cores
+  instead of serialising on the GIL.
+
+Arguments and results cross the process boundary by pickling.  ``bytes``-like
+values above :data:`SHARED_MEMORY_THRESHOLD` are moved through
+:mod:`multiprocessing.shared_memory` instead of the worker pipe.
+
+Example
+-------
+>>> class Hasher(SkillBase):
+...     execution_class = ExecutionClass.CPU_PROCESS
+...     async def _execute_impl(self, **kwargs):
+...         return {"digest": expensive_hash(kwargs["blob"])}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import importlib
+import inspect
+import logging
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__all__: list[str] = [
+    "ExecutionClass",
+    "SHARED_MEMORY_THRESHOLD",
+    "SharedBuffer",
+    "get_process_pool",
+    "resolve_execution_class",
+    "run_callable_in_process",
+    "run_skill_in_process",
+    "shutdown_process_pool",
+]
+
+logger = logging.getLogger(__name__)
+
+# Payloads at least this large (bytes) travel via shared memory ---------------
+SHARED_MEMORY_THRESHOLD: int = 1 << 20  # 1 MiB
+
+
+class ExecutionClass(str, Enum):
+    """Where a skill's ``execute`` runs."""
+
+    ASYNC = "async"
+    IO_THREAD = "io_thread"
+    CPU_PROCESS = "cpu_process"
+
+
+def resolve_execution_class(target: Any) -> ExecutionClass:
+    """Return the declared execution class of *target* (instance or class).
+
+    Objects without an explicit declaration are inferred from their
+    ``execute`` method: coroutine functions run on the loop, anything else in
+    the I/O thread pool (the historical behaviour).
+    """
+
+    declared = getattr(target, "execution_class", None)
+    if declared is not None:
+        return ExecutionClass(declared)
+    exec_fn = getattr(target, "execute", None)
+    if exec_fn is not None and not inspect.iscoroutinefunction(exec_fn):
+        return ExecutionClass.IO_THREAD
+    return ExecutionClass.ASYNC
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory transport ----------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SharedBuffer:
+    """Picklable handle to a ``bytes`` payload parked in shared memory."""
+
+    name: str
+    size: int
+
+
+def _share(value: Any, segments: List[shared_memory.SharedMemory]) -> Any:
+    """Move large bytes-like *value* into shared memory; pass others through."""
+
+    if (
+        not isinstance(value, (bytes, bytearray, memoryview))
+        or len(value) < SHARED_MEMORY_THRESHOLD
+    ):
+        return value
+    view = memoryview(value).cast("B")
+    shm = shared_memory.SharedMemory(create=True, size=max(1, view.nbytes))
+    shm.buf[: view.nbytes] = view
+    segments.append(shm)
+    return SharedBuffer(name=shm.name, size=view.nbytes)
+
+
+def _materialise(value: Any, *, unlink: bool = False) -> Any:
+    """Copy a :class:`SharedBuffer` back into ``bytes``; pass others through."""
+
+    if not isinstance(value, SharedBuffer):
+        return value
+    shm = shared_memory.SharedMemory(name=value.name)
+    try:
+        return bytes(shm.buf[: value.size])
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+
+
+def _share_mapping(
+    payload: Dict[str, Any], segments: List[shared_memory.SharedMemory]
+) -> Dict[str, Any]:
+    return {key: _share(val, segments) for key, val in payload.items()}
+
+
+def _release(segments: List[shared_memory.SharedMemory]) -> None:
+    for shm in segments:
+        try:
+            shm.close()
+            shm.unlink()
+        except FileNotFoundError:  # pragma: no cover – already reclaimed
+            pass
+
+
+def _collect(result: Any) -> Any:
+    """Materialise (and free) shared buffers returned by a worker."""
+
+    if isinstance(result, SharedBuffer):
+        return _materialise(result, unlink=True)
+    if isinstance(result, dict):
+        return {k: _materialise(v, unlink=True) for k, v in result.items()}
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Worker-side entry points (run inside the pool processes) -------------------
+# ---------------------------------------------------------------------------
+
+# Warm per-process state: one skill instance per class and a reusable loop.
+_worker_instances: Dict[type, Any] = {}
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _worker_init() -> None:
+    """Pre-import the skill base so the first task does not pay for it."""
+
+    try:
+        importlib.import_module("ice_sdk.skills.base")
+    except Exception:  # pragma: no cover – best effort warm-up
+        pass
+
+
+def _worker_noop() -> int:
+    return os.getpid()
+
+
+def _run_to_completion(value: Any) -> Any:
+    global _worker_loop  # pylint: disable=global-statement
+    if not inspect.isawaitable(value):
+        return value
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop.run_until_complete(value)  # type: ignore[arg-type]
+
+
+def _share_result(result: Any) -> Any:
+    segments: List[shared_memory.SharedMemory] = []
+    if isinstance(result, dict):
+        shared: Any = _share_mapping(result, segments)
+    else:
+        shared = _share(result, segments)
+    # Ownership moves to the parent, which unlinks after copying.
+    for shm in segments:
+        shm.close()
+    return shared
+
+
+def _worker_run_skill(skill_cls: type, inputs: Dict[str, Any]) -> Any:
+    inputs = {k: _materialise(v) for k, v in inputs.items()}
+    instance = _worker_instances.get(skill_cls)
+    if instance is None:
+        instance = skill_cls()
+        setup = getattr(instance, "setup", None)
+        if callable(setup):
+            _run_to_completion(setup())
+        _worker_instances[skill_cls] = instance
+    return _share_result(_run_to_completion(instance.execute(inputs)))
+
+
+def _worker_run_callable(
+    ref: Tuple[str, str], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Any:
+    module_name, qualname = ref
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    # ``@function_tool`` replaces the module attribute with the generated
+    # SkillBase subclass; the original callable hangs off ``.func``.
+    func = getattr(target, "func", target)
+    args = tuple(_materialise(a) for a in args)
+    kwargs = {k: _materialise(v) for k, v in kwargs.items()}
+    return _share_result(_run_to_completion(func(*args, **kwargs)))
+
+
+# ---------------------------------------------------------------------------
+# Parent-side pool management ------------------------------------------------
+# ---------------------------------------------------------------------------
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the process-wide pool, creating and warming it on first use.
+
+    Workers use the ``spawn`` start method so they never inherit a running
+    event loop or held locks from the parent.  The size defaults to the CPU
+    count and can be overridden via ``ICE_SKILL_PROCESS_WORKERS``.
+    """
+
+    global _pool  # pylint: disable=global-statement
+    with _pool_lock:
+        if _pool is None:
+            from ice_sdk.config import runtime_config
+
+            workers = runtime_config.skill_process_workers or os.cpu_count() or 1
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_worker_init,
+            )
+            # Spin up every worker now so the first CPU task is not delayed
+            # by interpreter start-up.
+            for _ in range(workers):
+                _pool.submit(_worker_noop)
+        return _pool
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """Stop the shared pool (a new one is created lazily on next use)."""
+
+    global _pool  # pylint: disable=global-statement
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+atexit.register(shutdown_process_pool, False)
+
+
+def _in_thread(fn: Callable[..., Any], *args: Any) -> Any:
+    """Thread fallback: run *fn* and drive any awaitable on a private loop."""
+
+    result = fn(*args)
+    if inspect.isawaitable(result):
+
+        async def _await() -> Any:
+            return await result
+
+        return asyncio.run(_await())
+    return result
+
+
+_warned_fallback: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _warn_thread_fallback(obj: Any, label: str) -> None:
+    """Log the thread fallback for *obj* once instead of on every call."""
+
+    try:
+        if obj in _warned_fallback:
+            return
+        _warned_fallback.add(obj)
+    except TypeError:  # pragma: no cover – not weak-referenceable
+        pass
+    logger.warning(
+        "%s is not importable by name; running in a thread instead of the "
+        "process pool",
+        label,
+    )
+
+
+def _picklable_ref(obj: Any) -> Optional[Tuple[str, str]]:
+    """Return ``(module, qualname)`` when *obj* can be re-imported by name."""
+
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if not module or not qualname or "<locals>" in qualname or module == "__main__":
+        return None
+    return module, qualname
+
+
+async def run_skill_in_process(skill_cls: type, inputs: Dict[str, Any]) -> Any:
+    """Execute ``skill_cls().execute(inputs)`` inside the process pool.
+
+    Each worker keeps one warm instance per skill class.  ``@function_tool``
+    classes are generated inside a function, so their wrapped ``func`` is
+    shipped instead.  Anything else that cannot be imported by name in a
+    fresh interpreter (defined in ``__main__`` or a function body) falls back
+    to a private thread so callers still succeed.
+    """
+
+    if _picklable_ref(skill_cls) is None:
+        func = getattr(skill_cls, "func", None)
+        if callable(func):
+            # *ctx* holds a process-local ToolContext – never ship it.
+            kwargs = {k: v for k, v in inputs.items() if k != "ctx"}
+            return await run_callable_in_process(func, **kwargs) or {}
+        _warn_thread_fallback(skill_cls, f"Skill {skill_cls.__qualname__}")
+        return await asyncio.to_thread(
+            _in_thread, lambda: skill_cls().execute(dict(inputs))
+        )
+
+    loop = asyncio.get_running_loop()
+    segments: List[shared_memory.SharedMemory] = []
+    try:
+        payload = _share_mapping(dict(inputs), segments)
+        result = await loop.run_in_executor(
+            get_process_pool(), _worker_run_skill, skill_cls, payload
+        )
+    finally:
+        _release(segments)
+    return _collect(result)
+
+
+async def run_callable_in_process(
+    func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Execute a module-level *func* inside the process pool."""
+
+    ref = _picklable_ref(func)
+    if ref is None:
+        _warn_thread_fallback(func, f"Callable {func!r}")
+        return await asyncio.to_thread(_in_thread, lambda: func(*args, **kwargs))
+
+    loop = asyncio.get_running_loop()
+    segments: List[shared_memory.SharedMemory] = []
+    try:
+        shared_args = tuple(_share(a, segments) for a in args)
+        shared_kwargs = _share_mapping(kwargs, segments)
+        result = await loop.run_in_executor(
+            get_process_pool(), _worker_run_callable, ref, shared_args, shared_kwargs
+        )
+    finally:
+        _release(segments)
+    return _collect(result)
@@ -0,0 +1,162 @@
+"""Warm instance pooling for *Skill* classes executed via :class:`ToolService`.
+
+Constructing a skill is not free – most skills are Pydantic models and some
+build configuration objects or network clients in ``__init__``/``setup``.
+:class:`SkillPool` keeps instances alive between calls:
+
+* **Stateless** skills (the default) are shared as a single warm instance.
+* **Stateful** skills (``stateful = True`` on the class) are leased exclusively
+  from a bounded pool of at most ``max_pool_size`` instances.
+
+Example
+-------
+>>> pool = SkillPool(SumSkill)
+>>> async with pool.lease() as skill:
+...     await skill.execute({"numbers": [1, 2]})
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
+
+__all__: list[str] = ["SkillPool"]
+
+logger = logging.getLogger(__name__)
+
+
+class SkillPool:
+    """Lifecycle-aware instance pool for a single skill class."""
+
+    def __init__(self, skill_cls: type, *, max_size: Optional[int] = None) -> None:
+        self.skill_cls = skill_cls
+        self.stateful: bool = bool(getattr(skill_cls, "stateful", False))
+        size = max_size or int(getattr(skill_cls, "max_pool_size", 4) or 1)
+        self.max_size: int = max(1, size)
+
+        self._singleton: Any | None = None
+        self._idle: List[Any] = []
+        self._created = 0
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_size)
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API --------------------------------------------------------
+    # ------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Any]:
+        """Yield a ready-to-use instance and return it to the pool afterwards.
+
+        Stateful instances that raise during use are torn down instead of
+        being recycled so a half-mutated object is never handed out again.
+        """
+
+        instance = await self.acquire()
+        try:
+            yield instance
+        except BaseException:
+            await self.release(instance, discard=self.stateful)
+            raise
+        await self.release(instance)
+
+    async def acquire(self) -> Any:
+        """Return a warm instance (creating and ``setup``-ing it on demand)."""
+
+        if self._closed:
+            raise RuntimeError(f"SkillPool for '{self.skill_cls.__name__}' is closed")
+
+        if not self.stateful:
+            if self._singleton is None:
+                async with self._lock:
+                    if self._singleton is None:
+                        self._singleton = await self._create()
+            return self._singleton
+
+        await self._slots.acquire()
+        if self._idle:
+            return self._idle.pop()
+        try:
+            return await self._create()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, instance: Any, *, discard: bool = False) -> None:
+        """Return *instance* to the pool (no-op for stateless singletons)."""
+
+        if not self.stateful:
+            return
+
+        try:
+            if discard or self._closed:
+                self._created -= 1
+                await self._teardown(instance)
+            else:
+                self._idle.append(instance)
+        finally:
+            self._slots.release()
+
+    async def close(self) -> None:
+        """Tear down every idle instance and reject further leases."""
+
+        self._closed = True
+        instances: List[Any] = list(self._idle)
+        self._idle.clear()
+        if self._singleton is not None:
+            instances.append(self._singleton)
+            self._singleton = None
+        for instance in instances:
+            await self._teardown(instance)
+        self._created = 0
+
+    # ------------------------------------------------------------------
+    # Introspection -----------------------------------------------------
+    # ------------------------------------------------------------------
+
+    @property
+    def size(self) -> int:
+        """Number of live instances owned by the pool."""
+
+        if not self.stateful:
+            return 0 if self._singleton is None else 1
+        return self._created
+
+    @property
+    def idle(self) -> int:
+        """Number of instances currently available for lease."""
+
+        if not self.stateful:
+            return self.size
+        return len(self._idle)
+
+    # ------------------------------------------------------------------
+    # Internal helpers --------------------------------------------------
+    # ------------------------------------------------------------------
+
+    async def _create(self) -> Any:
+        instance = self.skill_cls()  # type: ignore[call-arg]
+        setup = getattr(instance, "setup", None)
+        if callable(setup):
+            res = setup()
+            if asyncio.iscoroutine(res):
+                await res
+        self._created += 1
+        return instance
+
+    @staticmethod
+    async def _teardown(instance: Any) -> None:
+        teardown = getattr(instance, "teardown", None)
+        if not callable(teardown):
+            return
+        try:
+            res = teardown()
+            if asyncio.iscoroutine(res):
+                await res
+        except Exception as exc:  # – never fail callers on cleanup
+            logger.warning(
+                "Skill teardown failed for %s: %s", type(instance).__name__, exc
+            )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import warnings as _warnings
-from typing import Any, Dict, Generator, Mapping, Tuple
+from importlib import import_module
+from typing import Any, Callable, Dict, Generator, Mapping, Tuple, Union
 
 # Pydantic v2 migrated – PrivateAttr for internal attributes
 from pydantic import BaseModel, PrivateAttr
@@ -21,6 +22,17 @@ class SkillRegistrationError(RuntimeError):
     """Raised when a skill cannot be registered in the registry."""
 
 
+# Zero-arg callable returning a skill, or an ``"package.module:ClassName"`` path
+SkillFactory = Union[Callable[[], SkillBase], str]
+
+
+def _build(factory: SkillFactory) -> SkillBase:
+    if isinstance(factory, str):
+        module_path, _, attr = factory.partition(":")
+        factory = getattr(import_module(module_path), attr)
+    return factory()  # type: ignore[operator]
+
+
 class SkillRegistry(BaseModel):
     """In-memory registry that resolves *Skill* implementations by name.
 
@@ -35,6 +47,8 @@ class SkillRegistry(BaseModel):
 
     # Internal mapping – excluded from model schema
     _skills: Dict[str, SkillBase] = PrivateAttr(default_factory=dict)
+    # Deferred registrations – instantiated on first ``get``
+    _factories: Dict[str, SkillFactory] = PrivateAttr(default_factory=dict)
 
     model_config = {
         "arbitrary_types_allowed": True,
@@ -54,14 +68,35 @@ class SkillRegistry(BaseModel):
         skill: SkillBase
             An instantiated, fully-validated skill.
         """
-        if name in self._skills:
+        if name in self._skills or name in self._factories:
             raise SkillRegistrationError(f"Skill '{name}' already registered")
 
         # Skills are validated by Pydantic at instantiation time
         # No need for additional validation here
 
-        self._skills[name] = skill
+        self._store(name, skill)
+
+    def register_factory(self, name: str, factory: SkillFactory) -> None:
+        """Register *factory* under *name* without importing or building it.
 
+        The skill is instantiated on first :meth:`get`, so package imports
+        stay cheap.  *factory* is a zero-arg callable or an import path such
+        as ``"ice_sdk.skills.system.sum_skill:SumSkill"``.  Re-registering the
+        same import path is a no-op.
+        """
+        existing = self._factories.get(name)
+        if existing is not None and existing == factory:
+            return
+        if name in self._skills or existing is not None:
+            raise SkillRegistrationError(f"Skill '{name}' already registered")
+        self._factories[name] = factory
+
+    def names(self) -> list[str]:
+        """Return every registered name without instantiating factories."""
+        return [*self._skills, *(n for n in self._factories if n not in self._skills)]
+
+    def _store(self, name: str, skill: SkillBase) -> None:
+        self._skills[name] = skill
         # ------------------------------------------------------------------
         # Legacy ToolService synchronisation – keeps tool nodes working
         # ------------------------------------------------------------------
@@ -73,10 +108,20 @@ class SkillRegistry(BaseModel):
             pass
 
     def get(self, name: str) -> SkillBase:
+        skill = self._skills.get(name)
+        if skill is not None:
+            return skill
+        factory = self._factories.get(name)
+        if factory is None:
+            raise SkillRegistrationError(f"Skill '{name}' not found")
         try:
-            return self._skills[name]
-        except KeyError as exc:
-            raise SkillRegistrationError(f"Skill '{name}' not found") from exc
+            skill = _build(factory)
+        except Exception as exc:
+            raise SkillRegistrationError(
+                f"Skill '{name}' could not be created: {exc}"
+            ) from exc
+        self._store(name, skill)
+        return skill
 
     async def execute(
         self, name: str, payload: Mapping[str, Any]
@@ -100,7 +145,7 @@ class SkillRegistry(BaseModel):
         from ice_sdk.skills.base import SkillMeta  # local import to avoid cycles
 
         agents: List[SkillMeta] = []
-        for skill in self._skills.values():
+        for _, skill in self:
             try:
                 if getattr(skill.meta, "node_subtype", None) == "agent":
                     agents.append(skill.meta)
@@ -112,10 +157,15 @@ class SkillRegistry(BaseModel):
     # Dunder helpers
     # ------------------------------------------------------------------
     def __iter__(self) -> Generator[Tuple[str, SkillBase], None, None]:
-        yield from self._skills.items()
+        # Materialises pending factories; unbuildable ones are skipped.
+        for name in self.names():
+            try:
+                yield name, self.get(name)
+            except SkillRegistrationError:
+                continue
 
     def __len__(self) -> int:
-        return len(self._skills)
+        return len(self.names())
 
 
 # Global default registry -----------------------------------------------------
@@ -1,19 +1,28 @@
 """Tool service for executing skills by name.
 
 This module provides the ToolService class that acts as a registry and executor
-for skills. It maintains a registry of skill classes and can instantiate and
-execute them on demand.
+for skills. It maintains a registry of skill classes and serves warm instances
+from per-class :class:`~ice_sdk.skills.pool.SkillPool`s.
 """
 
 from __future__ import annotations
 
 import asyncio
 import inspect
+import weakref
 from pathlib import Path
 from typing import Any, Dict, List
 
 from pydantic import BaseModel
 
+from .execution import (
+    ExecutionClass,
+    resolve_execution_class,
+    run_skill_in_process,
+    shutdown_process_pool,
+)
+from .pool import SkillPool
+
 
 class ToolRequest(BaseModel):  # pylint: disable=too-few-public-methods
     """Request payload consumed by :pymeth:`ToolService.execute`."""
@@ -28,11 +37,22 @@ class ToolService:  # – thin orchestration facade
 
     The service acts as a lightweight compatibility layer between the
     orchestrator (which issues :class:`ToolRequest`s) and concrete *Skill*
-    classes registered at runtime.  It purposefully remains **stateless** –
-    each call to :pymeth:`execute` instantiates a new *Skill* object.
+    classes registered at runtime.  Instances are **not** rebuilt per call –
+    each tool name owns a :class:`SkillPool` that keeps stateless skills warm
+    as singletons and leases stateful ones from a bounded pool.  Pools belong
+    to the service instance and to the event loop that created them (their
+    locks and semaphores are loop-bound).
     """
 
     _registry: Dict[str, type] = {}
+    # Built-in system skills are imported at most once per process
+    _builtins_loaded: bool = False
+
+    def __init__(self) -> None:
+        # event loop -> tool_name -> warm instance pool
+        self._pools: "weakref.WeakKeyDictionary[Any, Dict[str, SkillPool]]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     # ------------------------------------------------------------------ legacy discovery
     def discover_and_register(self, path: "Path") -> None:  # noqa: D401
@@ -60,9 +80,20 @@ class ToolService:  # – thin orchestration facade
         self._registry[tool_name] = tool_cls
 
     def available_tools(self) -> list[str]:  # – enumeration helper
-        """Return human-readable list of registered tool names (sorted)."""
+        """Return human-readable list of registered tool names (sorted).
+
+        Includes skills registered lazily on ``global_skill_registry`` that
+        have not been instantiated yet.
+        """
+
+        names = set(self._registry)
+        try:
+            from ice_sdk.registry.skill import global_skill_registry  # local import
 
-        return sorted(self._registry.keys())
+            names.update(global_skill_registry.names())
+        except Exception:  # pragma: no cover – registry optional here
+            pass
+        return sorted(names)
 
     # ------------------------------------------------------------------ metadata helpers
     def cards(self) -> List[Any]:
@@ -80,15 +111,65 @@ class ToolService:  # – thin orchestration facade
 
     # ------------------------------------------------------------------ core
     async def execute(self, request: ToolRequest) -> Dict[str, Any]:
-        """Instantiate the requested *Skill* and delegate execution.
+        """Lease a warm *Skill* instance from its pool and delegate execution.
 
         The method automatically detects whether :pymeth:`SkillBase.execute`
         is async or sync and routes accordingly so callers don't need to
         differentiate.
         """
 
-        tool_cls = self._registry.get(request.tool_name)
-        if tool_cls is None:
+        pool = self._pool_for(request.tool_name)
+
+        async with pool.lease() as tool_instance:
+            result = await self._invoke(tool_instance, request.inputs)
+
+        # Maintain legacy wrapper structure expected by GraphContextManager
+        return {"data": result}
+
+    async def warm_up(self, tool_names: List[str] | None = None) -> None:
+        """Pre-build pools and run ``setup`` for *tool_names* (default: all).
+
+        Useful at API start-up so the first request does not pay the cost of
+        importing, constructing and setting up every skill.
+        """
+
+        for name in tool_names or self.available_tools():
+            pool = self._pool_for(name)
+            async with pool.lease():
+                pass
+
+    async def shutdown(self) -> None:
+        """Tear down pooled skill instances and the CPU worker processes."""
+
+        pools = [pool for by_name in self._pools.values() for pool in by_name.values()]
+        self._pools.clear()
+        for pool in pools:
+            await pool.close()
+        shutdown_process_pool()
+
+    # ------------------------------------------------------------------ internals
+    def _pool_for(self, tool_name: str) -> SkillPool:
+        """Return the warm pool serving *tool_name*, resolving it on first use."""
+
+        tool_cls = self._registry.get(tool_name) or self._resolve(tool_name)
+        loop = asyncio.get_running_loop()
+        pools = self._pools.get(loop)
+        if pools is None:
+            pools = self._pools[loop] = {}
+        pool = pools.get(tool_name)
+        if pool is None or pool.skill_cls is not tool_cls:
+            # First use or the name was re-bound to a new class via
+            # SkillRegistry.register – start a fresh pool.
+            pool = SkillPool(tool_cls)
+            pools[tool_name] = pool
+        return pool
+
+    @classmethod
+    def _resolve(cls, tool_name: str) -> type:
+        """Resolve *tool_name* on a registry miss and cache the class."""
+
+        if not cls._builtins_loaded:
+            cls._builtins_loaded = True
             # Attempt eager import of built-in system skills which auto-register
             try:
                 import importlib
@@ -97,30 +178,43 @@ class ToolService:  # – thin orchestration facade
             except Exception:
                 pass  # ignore failures – best effort
 
-            tool_cls = self._registry.get(request.tool_name)
+            tool_cls = cls._registry.get(tool_name)
+            if tool_cls is not None:
+                return tool_cls
 
-        if tool_cls is None:
-            # Attempt fallback via global_skill_registry --------------------
-            try:
-                from ice_sdk.registry.skill import global_skill_registry  # local import
+        # Attempt fallback via global_skill_registry ------------------------
+        try:
+            from ice_sdk.registry.skill import global_skill_registry  # local import
+
+            tool_instance_fallback = global_skill_registry.get(tool_name)
+        except Exception as exc:  # pragma: no cover – final fallback
+            raise ValueError(f"Tool '{tool_name}' not registered") from exc
+
+        resolved: type = tool_instance_fallback.__class__
+        # Cache for future lookups
+        cls._registry[tool_name] = resolved
+        return resolved
 
-                tool_instance_fallback = global_skill_registry.get(request.tool_name)
-                tool_cls = tool_instance_fallback.__class__
-                # Cache for future lookups
-                self._registry[request.tool_name] = tool_cls
-            except Exception as exc:  # pragma: no cover – final fallback
-                raise ValueError(f"Tool '{request.tool_name}' not registered") from exc
+    @staticmethod
+    async def _invoke(tool_instance: Any, inputs: Dict[str, Any]) -> Any:
+        """Run *tool_instance.execute* according to its execution class."""
 
-        tool_instance = tool_cls()  # type: ignore[call-arg]
+        mode = resolve_execution_class(tool_instance)
+        if mode is ExecutionClass.CPU_PROCESS:
+            # Workers keep their own warm instance per class; only the class
+            # reference and (pickled) inputs cross the process boundary.
+            return await run_skill_in_process(type(tool_instance), inputs)
 
         exec_fn = getattr(tool_instance, "execute")
-        if inspect.iscoroutinefunction(exec_fn):
-            result = await exec_fn(request.inputs)  # type: ignore[arg-type]
-        else:
-            # Fallback – run sync implementation inside default executor to avoid
-            # blocking the event loop.
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, exec_fn, request.inputs)
+        if mode is ExecutionClass.ASYNC and inspect.iscoroutinefunction(exec_fn):
+            return await exec_fn(inputs)  # type: ignore[arg-type]
 
-        # Maintain legacy wrapper structure expected by GraphContextManager
-        return {"data": result}
+        # Blocking implementations run inside the default thread pool to avoid
+        # stalling the event loop.  Async *execute* methods declared as
+        # IO_THREAD get a private loop inside the worker thread.
+        loop = asyncio.get_event_loop()
+        if inspect.iscoroutinefunction(exec_fn):
+            return await loop.run_in_executor(
+                None, lambda: asyncio.run(exec_fn(inputs))
+            )
+        return await loop.run_in_executor(None, exec_fn, inputs)
@@ -1,35 +1,47 @@
-from .computer_skill import ComputerSkill
-from .csv_reader_skill import CSVReaderSkill
-from .jinja_render_skill import JinjaRenderSkill
-from .json_merge_skill import JSONMergeSkill
-from .markdown_to_html_skill import MarkdownToHTMLSkill
-from .sleep_skill import SleepSkill
-from .sum_skill import SumSkill
-from .summarizer_skill import SummarizerSkill
+"""Built-in system skills.
 
-try:
-    from ..registry import global_skill_registry
+Skills are registered as factories and classes are resolved lazily (PEP 562),
+so importing this package does not import any skill module.
+"""
 
-    global_skill_registry.register("json_merge", JSONMergeSkill())
-    global_skill_registry.register("sleep", SleepSkill())
-    global_skill_registry.register("sum", SumSkill())
-    global_skill_registry.register("computer", ComputerSkill())
-    global_skill_registry.register("markdown_to_html", MarkdownToHTMLSkill())
-    global_skill_registry.register("jinja_render", JinjaRenderSkill())
-    global_skill_registry.register("csv_reader", CSVReaderSkill())
-    global_skill_registry.register("summarizer", SummarizerSkill())
-    from .rows_validator_skill import RowsValidatorSkill
+from __future__ import annotations
 
-    global_skill_registry.register("rows_validator", RowsValidatorSkill())
-    from .insights_skill import InsightsSkill
+from importlib import import_module
+from typing import Any, Dict, Tuple
 
-    global_skill_registry.register("insights", InsightsSkill())
-    from .line_item_generator_skill import LineItemGeneratorSkill
+# class name -> (submodule, registry name)
+_SKILLS: Dict[str, Tuple[str, str]] = {
+    "JSONMergeSkill": ("json_merge_skill", "json_merge"),
+    "SleepSkill": ("sleep_skill", "sleep"),
+    "SumSkill": ("sum_skill", "sum"),
+    "ComputerSkill": ("computer_skill", "computer"),
+    "MarkdownToHTMLSkill": ("markdown_to_html_skill", "markdown_to_html"),
+    "JinjaRenderSkill": ("jinja_render_skill", "jinja_render"),
+    "CSVReaderSkill": ("csv_reader_skill", "csv_reader"),
+    "SummarizerSkill": ("summarizer_skill", "summarizer"),
+    "RowsValidatorSkill": ("rows_validator_skill", "rows_validator"),
+    "InsightsSkill": ("insights_skill", "insights"),
+    "LineItemGeneratorSkill": ("line_item_generator_skill", "line_item_generator"),
+    "CSVWriterSkill": ("csv_writer_skill", "csv_writer"),
+}
 
-    global_skill_registry.register("line_item_generator", LineItemGeneratorSkill())
+__all__: list[str] = list(_SKILLS)
 
-    from .csv_writer_skill import CSVWriterSkill
+try:
+    from ..registry import global_skill_registry
 
-    global_skill_registry.register("csv_writer", CSVWriterSkill())
+    for _cls_name, (_module, _skill_name) in _SKILLS.items():
+        global_skill_registry.register_factory(
+            _skill_name, f"{__name__}.{_module}:{_cls_name}"
+        )
 except Exception:  # pragma: no cover
     pass
+
+
+def __getattr__(name: str) -> Any:
+    entry = _SKILLS.get(name)
+    if entry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{entry[0]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,16 +1,83 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
-from typing import Any, Dict, List, cast
+import threading
+from typing import Any, Dict, List, Optional, cast
 
+from ...cache import LRUCache
 from ...utils.errors import SkillExecutionError
 from ..base import SkillBase
 
 __all__ = ["JinjaRenderSkill"]
 
+# Compiled templates kept per environment (Jinja's own LRU, keyed by hash).
+_TEMPLATE_CACHE_SIZE = 512
+
+# ---------------------------------------------------------------------------
+# Shared environments --------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+# Template sources addressed by SHA-256; the loader resolves names from here.
+_sources = LRUCache(capacity=_TEMPLATE_CACHE_SIZE)
+_envs: Dict[bool, Any] = {}
+_env_lock = threading.Lock()
+
+
+def _source_key(template_str: str) -> str:
+    return hashlib.sha256(template_str.encode()).hexdigest()
+
+
+def _get_env(jinja2: Any, sandboxed: bool) -> Any:
+    """Return the process-wide (optionally sandboxed) Jinja environment.
+
+    Templates are loaded by source hash so the environment's LRU and the
+    optional bytecode cache (``ICE_JINJA_BYTECODE_DIR``) key on content.
+    """
+
+    env = _envs.get(sandboxed)
+    if env is not None:
+        return env
+    with _env_lock:
+        env = _envs.get(sandboxed)
+        if env is None:
+            from ice_sdk.config import runtime_config
+
+            def _load(name: str) -> Optional[tuple[str, None, Any]]:
+                source = _sources.get(name)
+                if source is None:
+                    return None
+                # Content-addressed: a name always maps to the same source.
+                return source, None, lambda: True
+
+            bytecode_cache = None
+            if runtime_config.jinja_bytecode_dir:
+                bytecode_cache = jinja2.FileSystemBytecodeCache(
+                    runtime_config.jinja_bytecode_dir
+                )
+            env_cls = jinja2.Environment
+            if sandboxed:
+                sandbox = importlib.import_module("jinja2.sandbox")
+                env_cls = sandbox.SandboxedEnvironment
+            env = env_cls(
+                autoescape=True,
+                loader=jinja2.FunctionLoader(_load),
+                cache_size=_TEMPLATE_CACHE_SIZE,
+                bytecode_cache=bytecode_cache,
+            )
+            _envs[sandboxed] = env
+    return env
+
 
 class JinjaRenderSkill(SkillBase):
-    """Render a Jinja2 template with context."""
+    """Render a Jinja2 template with context.
+
+    Pass ``contexts`` (a list of dicts) instead of ``context`` to render the
+    same template once per entry; ``rendered`` is then a list.  Templates are
+    compiled once per distinct source and shared across calls; set
+    ``sandboxed=True`` to render untrusted templates in a shared
+    :class:`jinja2.sandbox.SandboxedEnvironment`.
+    """
 
     name: str = "jinja_render"
     description: str = "Render a Jinja2 template with variables."
@@ -21,10 +88,31 @@ class JinjaRenderSkill(SkillBase):
 
     @staticmethod
     def _render_with_jinja(template_str: str, ctx: Dict[str, Any]) -> str:
+        return JinjaRenderSkill._render_many(template_str, [ctx])[0]
+
+    @staticmethod
+    def _render_many(
+        template_str: str, contexts: List[Dict[str, Any]], *, sandboxed: bool = False
+    ) -> List[str]:
         try:
             jinja2 = importlib.import_module("jinja2")  # type: ignore
-            env = jinja2.Environment(autoescape=True)
+        except ModuleNotFoundError:
+            try:
+                return [template_str.format(**ctx) for ctx in contexts]
+            except Exception as exc:
+                raise SkillExecutionError(f"Template rendering failed: {exc}") from exc
+
+        env = _get_env(jinja2, sandboxed)
+        key = _source_key(template_str)
+        if _sources.get(key) is None:
+            _sources.set(key, template_str)
+        try:
+            template = env.get_template(key)
+        except jinja2.TemplateNotFound:  # evicted by a concurrent caller
             template = env.from_string(template_str)
+
+        results: List[str] = []
+        for ctx in contexts:
             rendered: str = template.render(**ctx)
 
             # When developers use *format*-style placeholders ("{name}") Jinja2
@@ -32,22 +120,29 @@ class JinjaRenderSkill(SkillBase):
             # Python's ``str.format`` so templates written for the legacy
             # *HttpRequestTool* continue to work.
             if rendered == template_str and "{" in template_str:
-                return template_str.format(**ctx)
-
-            return rendered
-        except ModuleNotFoundError:
-            try:
-                return template_str.format(**ctx)
-            except Exception as exc:
-                raise SkillExecutionError(f"Template rendering failed: {exc}") from exc
+                rendered = template_str.format(**ctx)
+            results.append(rendered)
+        return results
 
     async def _execute_impl(self, **kwargs: Any) -> Dict[str, Any]:
         template = cast(str, kwargs.get("template", ""))
-        ctx = cast(Dict[str, Any], kwargs.get("context", {}))
+        sandboxed = bool(kwargs.get("sandboxed", False))
         if not isinstance(template, str):
             raise SkillExecutionError("'template' must be a string")
+
+        contexts = kwargs.get("contexts")
+        if contexts is not None:
+            if not isinstance(contexts, list) or not all(
+                isinstance(c, dict) for c in contexts
+            ):
+                raise SkillExecutionError("'contexts' must be a list of dicts")
+            return {
+                "rendered": self._render_many(template, contexts, sandboxed=sandboxed)
+            }
+
+        ctx = cast(Dict[str, Any], kwargs.get("context", {}))
         if not isinstance(ctx, dict):
             raise SkillExecutionError("'context' must be a dict")
 
-        rendered = self._render_with_jinja(template, ctx)
+        rendered = self._render_many(template, [ctx], sandboxed=sandboxed)[0]
         return {"rendered": rendered}
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import math
 import os
-from typing import Any, ClassVar, Dict, List, Union
+from collections import Counter
+from typing import Any, ClassVar, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
 
 from ice_core.models.llm import LLMConfig, ModelProvider
 from ice_sdk.providers.llm_service import LLMService
+from ice_sdk.utils.token_counter import TokenCounter
 
 from ...utils.errors import SkillExecutionError
 from ..base import SkillBase
@@ -23,17 +28,112 @@ class SummarizerInput(BaseModel):
         ..., description="Rows as list or JSON"
     )
     max_summary_tokens: int = Field(128, ge=16, le=1024)
+    chunk_token_budget: int = Field(
+        3000,
+        ge=256,
+        description="Approximate prompt tokens of row data per map-phase chunk",
+    )
+    max_concurrency: int = Field(
+        4, ge=1, le=32, description="Maximum concurrent LLM calls"
+    )
+    reduce_fan_in: int = Field(
+        8, ge=2, le=64, description="Partial summaries merged per reduce call"
+    )
 
     @field_validator("rows")
     @classmethod
     def parse_rows(cls, value):
         if isinstance(value, str):
-            import json
-
             return json.loads(value)
         return value
 
 
+# ---------------------------------------------------------------------------
+# Local, deterministic helpers ----------------------------------------------
+# ---------------------------------------------------------------------------
+
+_TOP_VALUES = 3
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, str):
+        try:
+            num = float(value.strip())
+        except ValueError:
+            return None
+        return num if math.isfinite(num) else None
+    return None
+
+
+def column_stats(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Return cheap per-column statistics computed without an LLM.
+
+    Numeric columns (every non-empty value parses as a number) report
+    ``min``/``max``/``mean``; all other columns report the number of distinct
+    values and the most common ones.
+    """
+
+    columns: Dict[str, List[Any]] = {}
+    for row in rows:
+        for key, value in row.items():
+            columns.setdefault(key, []).append(value)
+
+    stats: Dict[str, Dict[str, Any]] = {}
+    for key, values in columns.items():
+        present = [v for v in values if v not in (None, "")]
+        entry: Dict[str, Any] = {
+            "count": len(present),
+            "missing": len(rows) - len(present),
+        }
+        numbers = [_as_number(v) for v in present]
+        if present and all(n is not None for n in numbers):
+            nums = [n for n in numbers if n is not None]
+            entry.update(
+                type="numeric",
+                min=min(nums),
+                max=max(nums),
+                mean=round(sum(nums) / len(nums), 4),
+            )
+        else:
+            counts = Counter(json.dumps(v, default=str) for v in present)
+            entry.update(
+                type="categorical",
+                distinct=len(counts),
+                top=[json.loads(v) for v, _ in counts.most_common(_TOP_VALUES)],
+            )
+        stats[key] = entry
+    return stats
+
+
+def chunk_rows(
+    rows: List[Dict[str, Any]], token_budget: int, model: str = "gpt-4o"
+) -> List[List[str]]:
+    """Split *rows* into JSON-line chunks of at most *token_budget* tokens.
+
+    A single row larger than the budget becomes a chunk of its own so no data
+    is dropped.
+    """
+
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    used = 0
+    for row in rows:
+        line = json.dumps(row, separators=(",", ":"), default=str)
+        cost = TokenCounter.estimate_tokens(line, model) + 1
+        if current and used + cost > token_budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(line)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 class SummarizerOutput(BaseModel):
     """Output schema containing a concise *summary* string."""
 
@@ -48,6 +148,12 @@ class SummarizerSkill(SkillBase):
     • ``ANTHROPIC_API_KEY`` → Claude/opus
     Fallbacks to a deterministic summary when no key is present so that CI
     remains offline-compatible.
+
+    Datasets that exceed ``chunk_token_budget`` are summarised map-reduce
+    style: token-bounded chunks are summarised concurrently (at most
+    ``max_concurrency`` in flight) and the partial summaries are merged in
+    rounds of ``reduce_fan_in`` until one remains.  Exact per-column
+    statistics are computed locally and included in the final prompt.
     """
 
     name: str = "summarizer"
@@ -89,19 +195,8 @@ class SummarizerSkill(SkillBase):
             }
 
         # ------------------------------------------------------------------
-        # 3. Build prompt ---------------------------------------------------
+        # 3. Map: summarise token-bounded chunks concurrently ---------------
         # ------------------------------------------------------------------
-        import json
-
-        dataset_preview = json.dumps(inp.rows[:10], indent=2)
-        prompt = (
-            "You are a data summarization assistant. Given the following rows\n"
-            f"(maximum 10 shown) from a CSV dataset, produce a concise summary\n"
-            f"under {inp.max_summary_tokens} tokens describing key observations,\n"
-            "value ranges, and any outliers.\n\n"
-            f"Rows Preview:\n{dataset_preview}\n\nSummary:"
-        )
-
         llm_cfg = LLMConfig(  # type: ignore[call-arg]
             provider=provider.value,  # use raw str for LLMService
             model=model,
@@ -109,9 +204,77 @@ class SummarizerSkill(SkillBase):
             max_tokens=inp.max_summary_tokens,
             api_key=os.getenv(api_key_env) if api_key_env else None,
         )
+        service = LLMService()
+        limiter = asyncio.Semaphore(inp.max_concurrency)
+
+        async def _complete(prompt: str) -> str:
+            async with limiter:
+                text, _usage, err = await service.generate(llm_cfg, prompt)
+            if err:
+                raise SkillExecutionError(f"LLM summarization failed: {err}")
+            return text.strip()
+
+        stats_block = json.dumps(column_stats(inp.rows), default=str)
+        chunks = chunk_rows(inp.rows, inp.chunk_token_budget, model)
+        total = len(inp.rows)
+
+        if len(chunks) <= 1:
+            rows_block = "\n".join(chunks[0]) if chunks else ""
+            prompt = (
+                "You are a data summarization assistant. Given the following\n"
+                f"{total} rows from a CSV dataset and exact per-column statistics,\n"
+                f"produce a concise summary under {inp.max_summary_tokens} tokens\n"
+                "describing key observations, value ranges, and any outliers.\n\n"
+                f"Column statistics:\n{stats_block}\n\n"
+                f"Rows (JSON lines):\n{rows_block}\n\nSummary:"
+            )
+            return {"summary": await _complete(prompt)}
+
+        def _map_prompt(index: int, lines: List[str]) -> str:
+            return (
+                "You are a data summarization assistant. Below is part "
+                f"{index + 1} of {len(chunks)} of a {total}-row CSV dataset.\n"
+                f"Summarise this part in under {inp.max_summary_tokens} tokens,\n"
+                "noting value ranges, notable patterns, and outliers.\n\n"
+                "Rows (JSON lines):\n" + "\n".join(lines) + "\n\nSummary:"
+            )
+
+        partials = list(
+            await asyncio.gather(
+                *(_complete(_map_prompt(i, c)) for i, c in enumerate(chunks))
+            )
+        )
+
+        # ------------------------------------------------------------------
+        # 4. Reduce: merge partial summaries hierarchically -----------------
+        # ------------------------------------------------------------------
+        while len(partials) > 1:
+            groups = [
+                partials[i : i + inp.reduce_fan_in]
+                for i in range(0, len(partials), inp.reduce_fan_in)
+            ]
+            final = len(groups) == 1
+
+            def _reduce_prompt(group: List[str], final: bool = final) -> str:
+                parts = "\n\n".join(
+                    f"Part {n + 1}:\n{text}" for n, text in enumerate(group)
+                )
+                stats = (
+                    f"Exact per-column statistics for all {total} rows:\n"
+                    f"{stats_block}\n\n"
+                    if final
+                    else ""
+                )
+                return (
+                    "You are a data summarization assistant. Combine the partial\n"
+                    "summaries of a CSV dataset below into one concise summary\n"
+                    f"under {inp.max_summary_tokens} tokens describing key\n"
+                    "observations, value ranges, and any outliers.\n\n"
+                    f"{stats}Partial summaries:\n{parts}\n\nSummary:"
+                )
 
-        text, _usage, err = await LLMService().generate(llm_cfg, prompt)
-        if err:
-            raise SkillExecutionError(f"LLM summarization failed: {err}")
+            partials = list(
+                await asyncio.gather(*(_complete(_reduce_prompt(g)) for g in groups))
+            )
 
-        return {"summary": text.strip()}
+        return {"summary": partials[0]}
@@ -1,12 +1,34 @@
-from .http_request_skill import HttpRequestSkill
-from .search_skill import WebSearchSkill
-from .webhook_skill import WebhookSkill
+"""Web skills – registered as factories, classes resolved lazily (PEP 562)."""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Dict, Tuple
+
+# class name -> (submodule, registry name)
+_SKILLS: Dict[str, Tuple[str, str]] = {
+    "HttpRequestSkill": ("http_request_skill", "http_request"),
+    "WebhookSkill": ("webhook_skill", "webhook_emitter"),
+    "WebSearchSkill": ("search_skill", "web_search"),
+}
+
+__all__: list[str] = list(_SKILLS)
 
 try:
     from ..registry import global_skill_registry
 
-    global_skill_registry.register("http_request", HttpRequestSkill())
-    global_skill_registry.register("webhook_emitter", WebhookSkill())
-    global_skill_registry.register("web_search", WebSearchSkill())
+    for _cls_name, (_module, _skill_name) in _SKILLS.items():
+        global_skill_registry.register_factory(
+            _skill_name, f"{__name__}.{_module}:{_cls_name}"
+        )
 except Exception:  # pragma: no cover
     pass
+
+
+def __getattr__(name: str) -> Any:
+    entry = _SKILLS.get(name)
+    if entry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{entry[0]}", __name__), name)
+    globals()[name] = value
+    return value
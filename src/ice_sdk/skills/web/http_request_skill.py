@@ -3,21 +3,32 @@ from __future__ import annotations
 import asyncio
 import base64
 from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
 
 import httpx
 from pydantic import BaseModel, ConfigDict, Field
 
+from ice_core.utils.deadline import clamp_timeout
+from ice_core.utils.hedging import get_hedger
+
 from ...utils.errors import SkillExecutionError
 from ..base import SkillBase
 
 __all__ = ["HttpRequestSkill", "HttpRequestConfig"]
 
 
+def _not_server_error(resp: httpx.Response) -> bool:
+    return resp.status_code < 500
+
+
 class HttpRequestConfig(BaseModel):
     method: str = Field("GET", pattern="^(GET|POST)$", description="HTTP verb")
     timeout: float = Field(10.0, gt=0.0)
     attempts: int = Field(5, ge=1, le=10)
     max_bytes: int = Field(65_536, alias="max_bytes", gt=0)
+    hedge: bool = Field(
+        False, description="Hedge slow GET requests (see ice_core.utils.hedging)"
+    )
 
     @classmethod
     def create(cls) -> "HttpRequestConfig":
@@ -79,15 +90,29 @@ class HttpRequestSkill(SkillBase):
         attempts: int = int(input_data.get("attempts", self.config.attempts))
         max_bytes: int = int(input_data.get("max_bytes", self.config.max_bytes))
         wants_b64: bool = bool(input_data.get("base64", False))
+        # Only idempotent requests may be duplicated.
+        hedge = method == "GET" and bool(input_data.get("hedge", self.config.hedge))
 
         resp: Optional[httpx.Response] = None
         for attempt in range(1, attempts + 1):
-            try:
-                async with httpx.AsyncClient(timeout=timeout) as client:
+            # Each attempt gets at most what is left of the caller's deadline.
+            budget = clamp_timeout(timeout)
+            if budget is not None and budget <= 0:
+                raise SkillExecutionError("HTTP request deadline exceeded")
+
+            async def _send(budget: Optional[float] = budget) -> httpx.Response:
+                async with httpx.AsyncClient(timeout=budget) as client:
                     if method == "GET":
-                        resp = await client.get(url, params=params)
-                    else:
-                        resp = await client.post(url, params=params, json=data)
+                        return await client.get(url, params=params)
+                    return await client.post(url, params=params, json=data)
+
+            try:
+                if hedge:
+                    resp = await get_hedger("http").run(
+                        urlsplit(url).netloc, _send, accept=_not_server_error
+                    )
+                else:
+                    resp = await _send()
                 break
             except Exception as exc:  # pragma: no cover
                 if attempt == attempts:
@@ -6,6 +6,8 @@ from typing import Any, Dict, List
 import httpx
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from ice_core.utils.hedging import get_hedger
+
 from ...utils.errors import SkillExecutionError
 from ..base import SkillBase
 
@@ -22,10 +24,14 @@ class WebSearchConfig(BaseModel):
         environment variable at runtime.
     num_results: int, default=10
         Desired number of search results (\<=20).
+    hedge: bool, default=False
+        Issue a backup request when SerpAPI is slower than its recent p95
+        (see :mod:`ice_core.utils.hedging`).
     """
 
     api_key: str | None = Field(default=None, alias="api_key")
     num_results: int = Field(default=10, ge=1, le=20, alias="num")
+    hedge: bool = False
 
     @model_validator(mode="after")
     def _populate_key(cls, model: "WebSearchConfig") -> "WebSearchConfig":  # type: ignore[override,arg-type]  # – pydantic API
@@ -111,8 +117,18 @@ class WebSearchSkill(SkillBase):
             "engine": "google",
         }
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get("https://serpapi.com/search.json", params=params)
+        async def _search() -> httpx.Response:
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                return await client.get(
+                    "https://serpapi.com/search.json", params=params
+                )
+
+        if self.config.hedge:
+            resp = await get_hedger("http").run(
+                "serpapi.com", _search, accept=lambda r: r.status_code < 500
+            )
+        else:
+            resp = await _search()
 
         if resp.status_code != 200:
             snippet = resp.text[:200]
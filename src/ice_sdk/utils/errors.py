@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
+if TYPE_CHECKING:  # pragma: no cover – FastAPI is only needed by the API layer
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +43,8 @@ class SkillExecutionError(Exception):
 def add_exception_handlers(app: FastAPI) -> None:
     """Register global exception handlers on *app*."""
 
+    from fastapi.responses import JSONResponse
+
     @app.exception_handler(APIError)
     async def _api_error_handler(_: Request, exc: APIError) -> JSONResponse:
         logger.error("APIError: %s", exc.detail)
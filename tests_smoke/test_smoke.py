@@ -1,6 +1,267 @@
 import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
 
 
 def test_import_runtime() -> None:
     """Ensure ice_api.main imports without errors."""
     importlib.import_module("ice_api.main")
+
+
+def test_import_surfaces_stay_lazy() -> None:
+    """``import ice_sdk`` must not drag in heavy optional dependencies."""
+
+    heavy = ("networkx", "fastapi", "httpx", "sentence_transformers", "pyautogui")
+    code = (
+        "import sys, time; t = time.perf_counter(); import ice_sdk, ice_sdk.skills; "
+        "print(time.perf_counter() - t); "
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(_SRC)},
+    )
+    elapsed, eager = proc.stdout.splitlines()
+    assert eager == "", f"eagerly imported: {eager}"
+    # Loose ceiling – catches regressions like an eager ML/GUI import.
+    assert float(elapsed) < 2.0
+
+
+def test_loop_watchdog_attributes_blocking_call() -> None:
+    """A synchronous sleep inside a node scope fails the blocking budget."""
+
+    import asyncio
+    import time
+
+    from ice_core.utils.watchdog import (
+        LoopBlockedError,
+        assert_no_blocking,
+        execution_scope,
+    )
+
+    async def _run() -> None:
+        async with assert_no_blocking(budget_ms=20):
+            await asyncio.sleep(0.01)  # yielding work stays within budget
+            with execution_scope("slow", skill="jinja_render"):
+                time.sleep(0.08)
+
+    try:
+        asyncio.run(_run())
+    except LoopBlockedError as exc:
+        (event,) = exc.events
+        assert (event.node_id, event.skill) == ("slow", "jinja_render")
+        assert event.duration_ms >= 60
+    else:  # pragma: no cover – assertion path
+        raise AssertionError("blocking call was not detected")
+
+
+def test_capability_search_matches_infix_terms() -> None:
+    """Index-backed search still finds terms inside words (*research*)."""
+
+    from ice_sdk.capabilities.card import CapabilityCard
+    from ice_sdk.capabilities.registry import CapabilityRegistry
+
+    registry = CapabilityRegistry()
+    for card_id, name, description in (
+        ("research", "Research", "Does deep research"),
+        ("web_search", "Web search", "Query the web"),
+        ("csv_loader", "CSV loader", "Reads CSV"),
+    ):
+        registry.add(CapabilityCard(id=card_id, name=name, description=description))
+
+    assert [c.id for c in registry.search("search")] == ["research", "web_search"]
+    assert [c.id for c in registry.search("earch")] == ["research", "web_search"]
+    assert [c.id for c in registry.search("web*")] == ["web_search"]
+    assert [c.id for c in registry.search("deep search")] == ["research"]
+    assert len(registry.search("")) == 3
+
+
+def test_mcp_client_sees_finished_event_on_api_stream() -> None:
+    """``await_result`` detects completion from the real events endpoint."""
+
+    import asyncio
+
+    import httpx
+    from fastapi import FastAPI
+
+    from ice_api.api import mcp
+    from ice_sdk.protocols.mcp.client import MCPClient, _iter_sse_events
+
+    if not mcp._RECORD_EVENTS:
+        import pytest
+
+        pytest.skip("sse_starlette installed – events are streamed from Redis")
+
+    app = FastAPI()
+    app.include_router(mcp.router)
+    mcp._record_event("run_sse", "node.completed", '{"node_id": "a"}')
+    mcp._record_event("run_sse", "workflow.finished", '{"success": true}')
+
+    async def _lines(*lines: str):
+        for line in lines:
+            yield line
+
+    async def _run() -> None:
+        client = MCPClient("http://test")
+        client._client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+        async with client:
+            assert await client._wait_for_finished_event("run_sse")
+            assert not await client._wait_for_finished_event("run_missing")
+        # Pre-formatted frames wrapped into ``data:`` lines by sse_starlette.
+        wrapped = _lines("data: event: workflow.finished", "data: data: {}", "")
+        assert [e async for e in _iter_sse_events(wrapped)] == [
+            ("workflow.finished", "{}")
+        ]
+
+    asyncio.run(_run())
+    # Served finished streams are dropped; the fallback store stays bounded.
+    assert "run_sse" not in mcp._EVENTS
+    for i in range(mcp._MAX_EVENT_RUNS + 5):
+        mcp._record_event(f"run_{i}", "node.completed", "{}")
+    assert len(mcp._EVENTS) == mcp._MAX_EVENT_RUNS
+    assert "run_0" not in mcp._EVENTS
+    mcp._EVENTS.clear()
+
+
+
+def _sleep_node(node_id: str, seconds: float, *deps: str, **extra: object) -> dict:
+    """``smoke_sleep`` skill node (sleeps *seconds*, returns a 4 KiB payload)."""
+
+    from typing import Any, ClassVar, Dict
+
+    from ice_sdk.registry.skill import global_skill_registry
+    from ice_sdk.skills import SkillBase
+
+    class _SleepSkill(SkillBase):
+        name: str = "smoke_sleep"
+        description: str = "Sleeps, then returns a 4 KiB payload"
+        tags: ClassVar[list[str]] = []
+
+        def get_required_config(self) -> list[str]:
+            return []
+
+        async def _execute_impl(self, **kwargs: Any) -> Dict[str, Any]:
+            import asyncio
+
+            await asyncio.sleep(float(kwargs.get("seconds", 0)))
+            return {"rows": "x" * 4096, "ok": True}
+
+    if "smoke_sleep" not in global_skill_registry.names():
+        global_skill_registry.register("smoke_sleep", _SleepSkill())
+    return {
+        "id": node_id,
+        "type": "skill",
+        "tool_name": "smoke_sleep",
+        "tool_args": {"seconds": seconds},
+        "dependencies": list(deps),
+        "use_cache": False,
+        **extra,
+    }
+
+
+def _payload(*nodes: dict) -> dict:
+    return {"name": "smoke", "version": "1.0.0", "nodes": list(nodes)}
+
+
+def test_node_timeout_and_chain_deadline_cancel_slow_nodes() -> None:
+    """``timeout_seconds`` and ``deadline_seconds`` stop a node mid-sleep."""
+
+    import asyncio
+    import time
+
+    from ice_orchestrator.core.chain_factory import ChainFactory
+
+    async def _run(payload: dict, **kwargs: object) -> tuple:
+        workflow = await ChainFactory.from_dict(payload, **kwargs)
+        start = time.perf_counter()
+        result = await workflow.execute()
+        return result, time.perf_counter() - start
+
+    result, elapsed = asyncio.run(
+        _run(_payload(_sleep_node("slow", 5, timeout_seconds=1)))
+    )
+    assert not result.success and "timed out" in (result.error or "")
+    assert elapsed < 3
+
+    result, elapsed = asyncio.run(
+        _run(_payload(_sleep_node("slow", 5)), deadline_seconds=0.2)
+    )
+    assert not result.success and "deadline" in (result.error or "")
+    assert elapsed < 2
+
+
+def test_hedger_backup_wins_within_budget() -> None:
+    """A slow primary is hedged once; the empty budget denies the next hedge."""
+
+    import asyncio
+
+    from ice_core.utils.hedging import HedgePolicy, Hedger
+
+    policy = HedgePolicy(min_samples=3, min_delay=0.01, max_delay=0.02, burst=1.0)
+    hedger = Hedger(policy)
+    for _ in range(3):
+        hedger.record("k", 0.001)
+    calls: list[str] = []
+
+    async def _primary() -> str:
+        calls.append("primary")
+        await asyncio.sleep(0.1 if len(calls) > 1 else 0.5)
+        return "primary"
+
+    async def _backup() -> str:
+        calls.append("backup")
+        return "backup"
+
+    async def _run() -> tuple:
+        first = await hedger.run("k", _primary, _backup)
+        second = await hedger.run("k", _primary, _backup)
+        return first, second
+
+    assert asyncio.run(_run()) == ("backup", "primary")
+    stats = hedger.metrics()["k"]
+    assert (stats["hedged"], stats["hedge_wins"], stats["budget_denied"]) == (1, 1, 1)
+
+
+def test_blob_offload_round_trip() -> None:
+    """Offloaded outputs come back intact and the run releases its blobs."""
+
+    import asyncio
+
+    from ice_core.utils.blobs import (
+        BlobRef,
+        BlobStore,
+        global_blob_store,
+        materialize,
+        offload,
+    )
+    from ice_orchestrator.core.chain_factory import ChainFactory
+
+    # Spilled (mmap-backed) blobs decode to the original value.
+    store = BlobStore(memory_limit=1)
+    value = {"rows": ["a" * 300, "b" * 300], "n": 2}
+    stored = offload(value, threshold=256, store=store)
+    assert isinstance(stored["rows"], BlobRef) and stored["n"] == 2
+    offload("c" * 300, threshold=256, store=store)  # spills the first blob
+    assert store.stats()["disk_bytes"] > 0
+    assert materialize(stored, store) == value
+
+    async def _run() -> object:
+        payload = _payload(_sleep_node("a", 0), _sleep_node("b", 0, "a"))
+        workflow = await ChainFactory.from_dict(payload, blob_threshold=256)
+        return await workflow.execute()
+
+    before = global_blob_store().stats()
+    result = asyncio.run(_run())
+    after = global_blob_store().stats()
+    assert result.success
+    assert result.output["a"].output == {"rows": "x" * 4096, "ok": True}
+    assert after["puts"] > before["puts"] and after["blobs"] == before["blobs"]